@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: URLExtractor crawl throughput
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_crawl [pages] [latency_ms]
+#
+# Crawl situs fixture lokal (latency per request disuntikkan di server)
+# dengan 1 worker vs banyak worker, laporkan pages/sec.
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from benchmarks.fixtures import FixtureServer, site_app
+from modules.url_extractor import URLExtractor
+
+
+def crawl(base_url, pages, workers, per_host):
+    extractor = URLExtractor(max_pages=pages, workers=workers, per_host=per_host)
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        # depth besar supaya budget halaman yang membatasi; broken link check dimatikan
+        extractor._check_broken_links = lambda urls, limit=50: []
+        result = extractor.extract(f"{base_url}/page/0", depth=50)
+    elapsed = time.perf_counter() - start
+    return result, elapsed
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+
+    with FixtureServer(site_app(pages=pages), latency=latency) as base_url:
+        print(f"[*] Fixture: {pages} pages, {latency * 1000:.0f} ms latency, {base_url}")
+        for workers, per_host in ((1, 1), (4, 4), (16, 16)):
+            result, elapsed = crawl(base_url, pages, workers, per_host)
+            crawled = result['pages_crawled']
+            print(f"  workers={workers:<3} per_host={per_host:<3} "
+                  f"{crawled} pages in {elapsed:6.2f} s -> {crawled / elapsed:7.1f} pages/s "
+                  f"(robots blocked: {result['robots_blocked']})")
+
+
+if __name__ == "__main__":
+    main()
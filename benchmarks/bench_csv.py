@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: save_to_csv / append_to_csv lama vs CSVWriter streaming
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_csv [rows]
+#
+# Default 2.000.000 baris mirip hasil scanport / subdomain / iptrack bulk.
+# Mode generator ikut menghitung waktu membuat baris (lihat baris pertama output).
+# File ditulis ke folder sementara lalu dihapus.
+
+import os
+import sys
+import csv
+import time
+import shutil
+import tempfile
+from functools import partial
+from lib import csv_save
+from lib.csv_save import CSVWriter, save_to_csv, append_to_csv
+
+SERVICES = ('http', 'https', 'ssh', 'ftp', 'smtp', 'mysql', 'rdp', 'unknown')
+BATCH = 1000
+
+
+def make_rows(count, extra_every=0):
+    """Generator baris; extra_every > 0 menambah key baru di sebagian baris"""
+    for i in range(count):
+        row = {'host': f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", 'port': i % 65535 + 1,
+               'service': SERVICES[i % len(SERVICES)], 'banner': f"srv-{i % 977}"}
+        # Key baru baru muncul setelah schema dikunci (SAMPLE_ROWS pertama)
+        if extra_every and i >= csv_save.SAMPLE_ROWS and i % extra_every == 0:
+            row['tls'] = 'yes'
+        yield row
+
+
+def legacy_save(data, filename):
+    """save_to_csv sebelum perubahan: DictWriter, kolom dari data[0]"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=data[0].keys())
+        writer.writeheader()
+        writer.writerows(data)
+
+
+def legacy_append(data, filename):
+    """append_to_csv sebelum perubahan: DictWriter baru per panggilan, tanpa cek header"""
+    with open(filename, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=data[0].keys())
+        writer.writerows(data)
+
+
+def batches(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    folder = tempfile.mkdtemp(prefix='osxnt-bench-csv-')
+    print(f"[*] {count} baris, batch append {BATCH}")
+
+    def run(name, func, filename):
+        path = os.path.join(folder, filename)
+        start = time.perf_counter()
+        func(path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path) / 1024 / 1024
+        print(f"  {name:<38} {elapsed:7.2f} s  {count / elapsed:10.0f} baris/s  {size:7.1f} MB")
+
+    stdout = sys.stdout
+    quiet = open(os.devnull, 'w')
+
+    def silent(func):
+        def wrapper(path):
+            sys.stdout = quiet
+            try:
+                func(path)
+            finally:
+                sys.stdout = stdout
+        return wrapper
+
+    try:
+        start = time.perf_counter()
+        data = list(make_rows(count))
+        print(f"  {'(membuat baris saja)':<38} {time.perf_counter() - start:7.2f} s")
+        run('legacy save_to_csv (list)', partial(legacy_save, data), 'legacy.csv')
+        run('save_to_csv (list, union kolom)', silent(partial(save_to_csv, data)), 'save.csv')
+        # Lepas list sebelum ukur versi streaming
+        del data
+
+        def stream(path):
+            with CSVWriter(path) as writer:
+                writer.write_many(make_rows(count))
+        run('CSVWriter (generator)', stream, 'stream.csv')
+
+        def stream_extra(path):
+            with CSVWriter(path) as writer:
+                writer.write_many(make_rows(count, extra_every=1000))
+        run('CSVWriter (key baru tiap 1000 baris)', silent(stream_extra), 'extra.csv')
+
+        def old_batches(path):
+            for batch in batches(make_rows(count)):
+                legacy_append(batch, path)
+        run('legacy append_to_csv per batch', old_batches, 'legacy-append.csv')
+
+        def new_batches(path):
+            for batch in batches(make_rows(count)):
+                append_to_csv(batch, path)
+        run('append_to_csv per batch', silent(new_batches), 'append.csv')
+
+        # Output streaming sama dengan save_to_csv; append menulis header sekali
+        with open(os.path.join(folder, 'save.csv'), 'rb') as a, open(os.path.join(folder, 'stream.csv'), 'rb') as b:
+            assert a.read() == b.read()
+        with open(os.path.join(folder, 'append.csv'), newline='') as f:
+            reader = csv.reader(f)
+            assert next(reader) == ['host', 'port', 'service', 'banner']
+            assert sum(1 for _ in reader) == count
+        extra = csv_save.sidecar_name(os.path.join(folder, 'extra.csv'))
+        with open(extra, newline='') as f:
+            rows = list(csv.reader(f))[1:]
+        expected = sum(1 for i in range(csv_save.SAMPLE_ROWS, count) if i % 1000 == 0)
+        assert len(rows) == expected and rows[0] == [str(csv_save.SAMPLE_ROWS + 1), 'tls', 'yes']
+        print(f"  [+] output konsisten, {len(rows)} nilai kolom baru di sidecar")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: bulk DNS (BulkResolver) vs resolve satu per satu
+# Jalankan dari root repo (butuh dnspython):
+#   python -m benchmarks.bench_dns [queries] [latency_ms] [workers]
+#
+# Pakai stub resolver lokal (UDP + TCP). Sebagian nama NXDOMAIN, sebagian
+# jawaban terlalu besar untuk UDP sehingga harus diulang lewat TCP.
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+import dns.resolver
+from benchmarks.fixtures import FakeDNSServer
+from modules.dns import BulkResolver
+
+
+def queries(count):
+    pairs = []
+    for i in range(count):
+        if i % 50 == 0:
+            pairs.append((f"big{i}.fixture.test", 'TXT'))
+        elif i % 10 == 0:
+            pairs.append((f"nx{i}.fixture.test", 'A'))
+        else:
+            pairs.append((f"host{i}.fixture.test", 'AAAA' if i % 3 == 0 else 'A'))
+    return pairs
+
+
+def sequential(address, pairs):
+    """Pola lama dns_lookup: dns.resolver.resolve satu per satu"""
+    resolver = dns.resolver.Resolver(configure=False)
+    resolver.nameservers = [address[0]]
+    resolver.port = address[1]
+    resolver.lifetime = 5
+    answered = 0
+    for name, rtype in pairs:
+        try:
+            resolver.resolve(name, rtype)
+            answered += 1
+        except dns.resolver.NXDOMAIN:
+            pass
+    return answered
+
+
+def bulk(address, pairs, workers):
+    resolver = BulkResolver([f"{address[0]}:{address[1]}"], workers=workers)
+    with redirect_stdout(io.StringIO()):
+        results = resolver.resolve_many(pairs)
+    return sum(1 for r in results if r['status'] == 'NOERROR'), resolver.stats
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 2.0) / 1000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 64
+    pairs = queries(count)
+    print(f"[*] {count} query, latency stub {latency * 1000:.1f} ms, {workers} worker")
+
+    with FakeDNSServer(latency) as address:
+        start = time.perf_counter()
+        answered = sequential(address, pairs)
+        elapsed = time.perf_counter() - start
+        print(f"  {'resolve satu per satu':<24} {elapsed:7.2f} s  {count / elapsed:8.0f} q/s  ({answered} jawaban)")
+
+        start = time.perf_counter()
+        answered, stats = bulk(address, pairs, workers)
+        elapsed = time.perf_counter() - start
+        print(f"  {'BulkResolver':<24} {elapsed:7.2f} s  {count / elapsed:8.0f} q/s  ({answered} jawaban, "
+              f"{stats['nxdomain']} NXDOMAIN, {stats['tcp']} via TCP)")
+
+
+if __name__ == "__main__":
+    main()
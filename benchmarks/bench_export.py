@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: query hasil scan dari JSON (-s) vs export SQLite / Parquet (--export)
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_export [ports] [subdomains]
+#
+# Default 1.000.000 record port + 200.000 subdomain. Dibandingkan:
+# grep di file JSON, json.load + filter, dan query ber-index di SQLite
+# (plus Parquet kalo pyarrow terinstall). File di folder sementara lalu dihapus.
+
+import os
+import sys
+import json
+import time
+import shutil
+import sqlite3
+import tempfile
+import subprocess
+from lib import result_export
+from lib.json_save import save_to_json, prepare_output
+from lib.result_export import ResultExporter
+
+SERVICES = ('http', 'https', 'ssh', 'ftp', 'smtp', 'mysql', 'rdp', 'unknown')
+PORTS = (21, 22, 25, 80, 443, 3306, 3389, 8080)
+
+
+def make_ports(count):
+    return [{'host': f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", 'port': PORTS[i % len(PORTS)],
+             'service': SERVICES[i % len(SERVICES)]} for i in range(count)]
+
+
+def make_subdomains(count):
+    return [{'subdomain': f"host{i}.example.com", 'ip': f"192.0.{i >> 8 & 255}.{i & 255}"}
+            for i in range(count)]
+
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return time.perf_counter() - start, value
+
+
+def main():
+    port_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    sub_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    folder = tempfile.mkdtemp(prefix='osxnt-bench-export-')
+    ports = make_ports(port_count)
+    subs = make_subdomains(sub_count)
+    wanted_sub = f"host{sub_count // 2}.example.com"
+    print(f"[*] {port_count} port + {sub_count} subdomain, pyarrow: "
+          f"{'ya' if result_export.HAS_PYARROW else 'tidak'}")
+
+    stdout = sys.stdout
+    try:
+        ports_json = os.path.join(folder, 'ports.json')
+        subs_json = os.path.join(folder, 'subs.json')
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            json_time, _ = timed(lambda: (save_to_json(prepare_output(ports, 'bench', 'scanport'), ports_json),
+                                          save_to_json(prepare_output(subs, 'bench', 'subdomain'), subs_json)))
+
+            def export(path, backend):
+                with ResultExporter(path, backend=backend) as exporter:
+                    exporter.add_result('scanport', 'bench', ports)
+                    exporter.add_result('subdomain', 'bench', subs)
+            db_path = os.path.join(folder, 'scan.sqlite')
+            sqlite_time, _ = timed(lambda: export(db_path, 'sqlite'))
+            if result_export.HAS_PYARROW:
+                pq_path = os.path.join(folder, 'scan-parquet')
+                parquet_time, _ = timed(lambda: export(pq_path, 'parquet'))
+        finally:
+            sys.stdout = stdout
+
+        def size(path):
+            if os.path.isdir(path):
+                return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path)) / 1024 / 1024
+            return os.path.getsize(path) / 1024 / 1024
+
+        print("  Tulis")
+        print(f"    {'JSON pretty (-s)':<34} {json_time:7.2f} s  "
+              f"{size(ports_json) + size(subs_json):7.1f} MB")
+        print(f"    {'SQLite + index (--export)':<34} {sqlite_time:7.2f} s  {size(db_path):7.1f} MB")
+        if result_export.HAS_PYARROW:
+            print(f"    {'Parquet zstd (--export)':<34} {parquet_time:7.2f} s  {size(pq_path):7.1f} MB")
+
+        def report(name, elapsed, value):
+            print(f"    {name:<34} {elapsed * 1000:9.1f} ms  -> {value}")
+
+        # Query 1: semua host dengan port 3389
+        print("  Query: host dengan port 3389")
+        report('grep -c (hanya hitung)', *timed(lambda: subprocess.run(
+            ['grep', '-c', '"port": 3389', ports_json], capture_output=True, text=True).stdout.strip()))
+
+        def json_filter():
+            with open(ports_json) as f:
+                data = json.load(f)['data']
+            return len([r['host'] for r in data if r['port'] == 3389])
+        report('json.load + filter', *timed(json_filter))
+
+        def sqlite_query(sql, *params):
+            db = sqlite3.connect(db_path)
+            try:
+                return db.execute(sql, params).fetchall()
+            finally:
+                db.close()
+        report('SQLite (index port)', *timed(lambda: len(sqlite_query(
+            "SELECT host FROM ports WHERE port = ?", 3389))))
+        if result_export.HAS_PYARROW:
+            import pyarrow.dataset as ds
+            ports_files = [os.path.join(pq_path, f) for f in os.listdir(pq_path) if f.startswith('ports-')]
+            report('Parquet (filter kolom)', *timed(lambda: ds.dataset(ports_files).to_table(
+                columns=['host'], filter=ds.field('port') == 3389).num_rows))
+
+        # Query 2: IP satu subdomain
+        print(f"  Query: IP dari {wanted_sub}")
+        report('grep -A1', *timed(lambda: subprocess.run(
+            ['grep', '-A1', '-F', f'"subdomain": "{wanted_sub}"', subs_json],
+            capture_output=True, text=True).stdout.split('"ip": ')[-1].strip().strip('"')))
+
+        def json_lookup():
+            with open(subs_json) as f:
+                return next(r['ip'] for r in json.load(f)['data'] if r['subdomain'] == wanted_sub)
+        report('json.load + cari', *timed(json_lookup))
+        report('SQLite (index subdomain)', *timed(lambda: sqlite_query(
+            "SELECT ip FROM subdomains WHERE subdomain = ?", wanted_sub)[0][0]))
+
+        # Query 3: agregasi per service
+        print("  Query: jumlah port per service")
+
+        def json_group():
+            counts = {}
+            with open(ports_json) as f:
+                for r in json.load(f)['data']:
+                    counts[r['service']] = counts.get(r['service'], 0) + 1
+            return len(counts)
+        report('json.load + hitung', *timed(json_group))
+        report('SQLite GROUP BY', *timed(lambda: len(sqlite_query(
+            "SELECT service, COUNT(*) FROM ports GROUP BY service"))))
+    finally:
+        sys.stdout = stdout
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: ekstraksi link URLExtractor
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_extract                  (halaman sintetis)
+#   python -m benchmarks.bench_extract page1.html ...   (halaman tersimpan)
+#
+# Membandingkan implementasi lama (BeautifulSoup html.parser + 6x find_all)
+# dengan lib.htmlscan.extract_links (html.parser streaming / lxml).
+
+import sys
+import time
+from urllib.parse import urljoin
+from lib.htmlscan import extract_links, HAS_LXML
+from benchmarks.bench_htmlscan import synthetic_page
+
+
+def bs4_links(html_text, url):
+    """Salinan logika _extract_from_page sebelum single-pass"""
+    from bs4 import BeautifulSoup
+    urls = []
+    soup = BeautifulSoup(html_text, 'html.parser')
+    for link in soup.find_all('a', href=True):
+        href = link['href'].strip()
+        if href:
+            urls.append({'url': urljoin(url, href), 'text': link.text.strip()[:100], 'type': 'a'})
+    for link in soup.find_all('link', href=True):
+        href = link['href'].strip()
+        if href:
+            urls.append({'url': urljoin(url, href), 'type': 'link', 'rel': link.get('rel', [''])[0]})
+    for script in soup.find_all('script', src=True):
+        src = script['src'].strip()
+        if src:
+            urls.append({'url': urljoin(url, src), 'type': 'script'})
+    for img in soup.find_all('img', src=True):
+        src = img['src'].strip()
+        if src:
+            urls.append({'url': urljoin(url, src), 'type': 'image', 'alt': img.get('alt', '')[:50]})
+    for iframe in soup.find_all('iframe', src=True):
+        src = iframe['src'].strip()
+        if src:
+            urls.append({'url': urljoin(url, src), 'type': 'iframe'})
+    for form in soup.find_all('form', action=True):
+        action = form['action'].strip()
+        if action:
+            urls.append({'url': urljoin(url, action), 'type': 'form', 'method': form.get('method', 'get')})
+    return urls
+
+
+def bench(name, func, html_text, rounds=3):
+    best = None
+    count = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        count = len(func(html_text, 'https://example.com/index.html'))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {name:<18} {best * 1000:9.1f} ms  ({count} links)")
+    return best
+
+
+def run(html_text, label):
+    print(f"[*] {label}: {len(html_text) / 1024 / 1024:.2f} MB")
+    results = {}
+    results['html.parser'] = bench('htmlscan/html.parser', lambda h, u: extract_links(h, u, 'html.parser'), html_text)
+    if HAS_LXML:
+        results['lxml'] = bench('htmlscan/lxml', lambda h, u: extract_links(h, u, 'lxml'), html_text)
+    else:
+        print("  [!] lxml tidak terinstall, backend lxml dilewati")
+    try:
+        old = bench('bs4 (lama)', bs4_links, html_text)
+        for name, elapsed in results.items():
+            print(f"  [+] {name}: {old / elapsed:.1f}x lebih cepat")
+    except ImportError:
+        print("  [!] beautifulsoup4 tidak terinstall, perbandingan dilewati")
+
+
+def main():
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                run(f.read(), path)
+    else:
+        run(synthetic_page(10000), 'synthetic')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: CrawlFrontier vs list-based bookkeeping
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_frontier [pages] [links_per_page]
+#
+# Hanya mengukur CPU bookkeeping crawler (tanpa network) pada link graph
+# sintetis: setiap halaman punya N link internal acak.
+
+import sys
+import time
+import random
+from lib.frontier import CrawlFrontier
+
+
+def build_graph(pages, links_per_page, seed=1337):
+    rnd = random.Random(seed)
+    base = 'https://example.com/page/'
+    graph = {}
+    for i in range(pages):
+        links = []
+        for _ in range(links_per_page):
+            j = rnd.randrange(pages)
+            # Variasi yang harus dianggap URL yang sama
+            variant = rnd.randrange(4)
+            if variant == 0:
+                links.append(f"{base}{j}")
+            elif variant == 1:
+                links.append(f"{base}{j}/")
+            elif variant == 2:
+                links.append(f"{base}{j}#section")
+            else:
+                links.append(f"https://example.com:443/page/{j}")
+        graph[f"{base}{i}"] = links
+    return graph
+
+
+def lookup(graph, url):
+    key = url.split('#')[0].replace(':443', '').rstrip('/')
+    return graph.get(key, [])
+
+
+def crawl_list(graph, start, max_pages, depth):
+    """Bookkeeping lama: list.pop(0) + scan list per link"""
+    visited = set()
+    to_visit = [(start, 0)]
+    while to_visit and len(visited) < max_pages:
+        current_url, current_depth = to_visit.pop(0)
+        if current_url in visited or current_depth > depth:
+            continue
+        links = lookup(graph, current_url)
+        visited.add(current_url)
+        if current_depth < depth:
+            for link in links:
+                if link not in visited and link not in [v[0] for v in to_visit]:
+                    to_visit.append((link, current_depth + 1))
+    return len(visited)
+
+
+def crawl_frontier(graph, start, max_pages, depth):
+    frontier = CrawlFrontier(max_pages=max_pages, max_depth=depth)
+    frontier.add(start, 0)
+    while frontier:
+        current_url, current_depth = frontier.next()
+        frontier.add_many(lookup(graph, current_url), current_depth + 1)
+    return frontier.crawled
+
+
+def bench(name, func, *args):
+    start = time.process_time()
+    pages = func(*args)
+    elapsed = time.process_time() - start
+    print(f"  {name:<10} {elapsed:8.3f} s CPU  ({pages} pages)")
+    return elapsed
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    links = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    graph = build_graph(pages, links)
+    start = 'https://example.com/page/0'
+
+    print(f"[*] Graph: {pages} pages x {links} links")
+    new = bench('frontier', crawl_frontier, graph, start, pages, 10)
+    # Versi lama kuadratik, batasi supaya benchmark tetap selesai
+    old_pages = min(pages, 1000)
+    old = bench('list', crawl_list, graph, start, old_pages, 10)
+    print(f"[i] list dibatasi {old_pages} halaman; "
+          f"per halaman: frontier {new / pages * 1e6:.1f} us, list {old / old_pages * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: lookup GeoIP offline (lib.geoip)
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_geoip [lookups] [ranges]
+#   python -m benchmarks.bench_geoip 1000000 200000 database.csv
+#
+# Tanpa database: buat CSV sintetis (range IPv4 + IPv6 berurutan), compile ke
+# .osxgeo, lalu ukur waktu compile, waktu buka (mmap) dan lookups/sec untuk
+# IP acak.
+
+import os
+import sys
+import time
+import random
+import tempfile
+from lib.geoip import GeoDB, compile_csv
+
+
+def synthetic_csv(path, ranges, seed=1):
+    rng = random.Random(seed)
+    countries = [('US', 'United States'), ('ID', 'Indonesia'), ('DE', 'Germany'),
+                 ('JP', 'Japan'), ('BR', 'Brazil'), ('AU', 'Australia')]
+    step = (2 ** 32) // ranges
+    with open(path, 'w') as f:
+        f.write('start,end,country_code,country,city,latitude,longitude,asn,as_org\n')
+        for i in range(ranges):
+            start = i * step
+            code, name = countries[i % len(countries)]
+            f.write(f"{start},{start + step - 1},{code},{name},City-{i % 5000},"
+                    f"{rng.uniform(-60, 60):.3f},{rng.uniform(-180, 180):.3f},"
+                    f"{64500 + i % 1000},Org {i % 1000}\n")
+        for i in range(ranges // 10):
+            prefix = 0x2001_0db8_0000_0000 + i
+            f.write(f"{prefix << 64},{(prefix << 64) | (2 ** 64 - 1)},US,United States,"
+                    f"V6-{i % 100},0,0,{64500 + i % 1000},Org {i % 1000}\n")
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    ranges = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    source = sys.argv[3] if len(sys.argv) > 3 else None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if source is None:
+            source = os.path.join(tmp, 'synthetic.csv')
+            synthetic_csv(source, ranges)
+        compiled = os.path.join(tmp, 'db.osxgeo')
+
+        start = time.perf_counter()
+        compile_csv(source, compiled)
+        print(f"[*] Compile: {time.perf_counter() - start:.2f} s "
+              f"({os.path.getsize(compiled) / 1024 / 1024:.1f} MB)")
+
+        start = time.perf_counter()
+        db = GeoDB(compiled)
+        print(f"[*] Open (mmap): {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        rng = random.Random(2)
+        ips = [f"{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}"
+               for _ in range(lookups)]
+
+        # Lookup mentah (tanpa bungkus record ip-api)
+        reader = db.readers[0]
+        start = time.perf_counter()
+        found = 0
+        for ip in ips:
+            if reader.lookup(ip) is not None:
+                found += 1
+        elapsed = time.perf_counter() - start
+        print(f"  RangeDB.lookup  {lookups / elapsed:12,.0f} lookups/s  ({found} found)")
+
+        start = time.perf_counter()
+        for ip in ips:
+            db.lookup(ip)
+        elapsed = time.perf_counter() - start
+        print(f"  GeoDB.lookup    {lookups / elapsed:12,.0f} lookups/s  (record format ip-api)")
+
+        v6 = [f"2001:db8:0:{rng.randrange(ranges // 10):x}::{rng.randrange(65536):x}"
+              for _ in range(min(lookups, 200000))]
+        start = time.perf_counter()
+        for ip in v6:
+            reader.lookup(ip)
+        elapsed = time.perf_counter() - start
+        print(f"  IPv6 lookup     {len(v6) / elapsed:12,.0f} lookups/s")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: history SQLite + diff vs bandingkan file JSON per run
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_history [runs] [records_per_run] [churn_percent]
+#
+# Simulasi scan port harian: tiap run sebagian kecil port buka/tutup/ganti service.
+# Default 300 run x 10.000 record, 1% berubah per run. File di folder sementara.
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+from lib.json_save import save_to_json, prepare_output
+from lib.scan_history import ScanHistory
+
+SERVICES = ('http', 'https', 'ssh', 'ftp', 'smtp', 'mysql', 'rdp', 'unknown')
+
+
+def evolve(state, churn, rng):
+    """Ubah sebagian record: port tutup, port baru, service berubah"""
+    keys = list(state)
+    changes = max(1, len(keys) * churn // 100)
+    for key in rng.sample(keys, changes // 3):
+        del state[key]
+    for _ in range(changes // 3):
+        host = f"10.0.{rng.randrange(256)}.{rng.randrange(256)}"
+        port = rng.randrange(1, 65536)
+        state[(host, port)] = SERVICES[port % len(SERVICES)]
+    for key in rng.sample(list(state), changes - 2 * (changes // 3)):
+        state[key] = rng.choice(SERVICES)
+
+
+def as_result(state):
+    return [{'host': h, 'port': p, 'service': s} for (h, p), s in state.items()]
+
+
+def json_diff(old_path, new_path):
+    """Cara manual: load dua file penuh lalu bandingkan per (host, port)"""
+    def load(path):
+        with open(path) as f:
+            return {(r['host'], r['port']): r for r in json.load(f)['data']}
+    old, new = load(old_path), load(new_path)
+    added = [k for k in new if k not in old]
+    removed = [k for k in old if k not in new]
+    changed = [k for k in new if k in old and old[k] != new[k]]
+    return len(added), len(removed), len(changed)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    per_run = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    churn = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    rng = random.Random(1)
+    folder = tempfile.mkdtemp(prefix='osxnt-bench-history-')
+    print(f"[*] {runs} run x {per_run} record, {churn}% berubah per run")
+
+    state = {}
+    while len(state) < per_run:
+        state[(f"10.0.{rng.randrange(256)}.{rng.randrange(256)}", rng.randrange(1, 65536))] = 'http'
+
+    stdout = sys.stdout
+    try:
+        db_path = os.path.join(folder, 'history.sqlite3')
+        json_paths = []
+        ingest = 0.0
+        json_write = 0.0
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            for i in range(runs):
+                if i:
+                    evolve(state, churn, rng)
+                result = as_result(state)
+                # Satu ScanHistory per run, seperti satu eksekusi CLI
+                history = ScanHistory(db_path)
+                start = time.perf_counter()
+                history.record('scanport', 'bench', result)
+                ingest += time.perf_counter() - start
+                history.close()
+
+                path = os.path.join(folder, f"run{i:04d}.json")
+                start = time.perf_counter()
+                save_to_json(prepare_output(result, 'bench', 'scanport'), path)
+                json_write += time.perf_counter() - start
+                json_paths.append(path)
+        finally:
+            sys.stdout = stdout
+
+        json_size = sum(os.path.getsize(p) for p in json_paths) / 1024 / 1024
+        db_size = (os.path.getsize(db_path) + (os.path.getsize(db_path + '-wal')
+                   if os.path.exists(db_path + '-wal') else 0)) / 1024 / 1024
+        print(f"  Simpan: history {ingest / runs * 1000:.1f} ms/run, total {db_size:.1f} MB | "
+              f"JSON {json_write / runs * 1000:.1f} ms/run, total {json_size:.1f} MB")
+
+        history = ScanHistory(db_path)
+        pairs = (('run terakhir vs sebelumnya', runs - 1, runs), ('run pertama vs terakhir', 1, runs))
+        for name, old_id, new_id in pairs:
+            start = time.perf_counter()
+            diff = history.diff(old_id, new_id)
+            db_time = time.perf_counter() - start
+            counts = (len(diff['added']), len(diff['removed']), len(diff['changed']))
+
+            start = time.perf_counter()
+            json_counts = json_diff(json_paths[old_id - 1], json_paths[new_id - 1])
+            file_time = time.perf_counter() - start
+            assert counts == json_counts, (counts, json_counts)
+            print(f"  Diff {name:<28} history {db_time * 1000:8.1f} ms | JSON {file_time * 1000:8.1f} ms  "
+                  f"(+{counts[0]} -{counts[1]} ~{counts[2]})")
+
+        start = time.perf_counter()
+        listed = history.runs(module='scanport', target='bench', limit=20)
+        print(f"  Daftar 20 run terakhir: {(time.perf_counter() - start) * 1000:.1f} ms ({len(listed)} run)")
+        history.close()
+    finally:
+        sys.stdout = stdout
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
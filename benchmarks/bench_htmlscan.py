@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: lib.htmlscan vs BeautifulSoup
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_htmlscan                 (halaman sintetis)
+#   python -m benchmarks.bench_htmlscan saved_page.html (halaman asli)
+
+import sys
+import time
+from lib.htmlscan import extract_assets
+
+
+def synthetic_page(blocks=5000):
+    """Halaman besar dengan campuran asset (~1 MB per 2500 blok)"""
+    parts = ['<html><head><base href="/static/">']
+    for i in range(blocks // 50):
+        parts.append(f'<link rel="stylesheet" href="css/s{i}.css">')
+        parts.append(f'<link rel="preload" as="font" href="fonts/f{i}.woff2">')
+        parts.append(f'<script src="js/app{i}.js?v={i}"></script>')
+    parts.append('<style>@import url("base.css"); .h{background:url(img/h.png)}</style></head><body>')
+    for i in range(blocks):
+        parts.append(
+            f'<div class="card" style="background-image:url(\'bg/{i}.jpg\')">'
+            f'<a href="/p/{i}">Item {i}</a>'
+            f'<img src="img/{i}.png" srcset="img/{i}@2x.png 2x, img/{i}@3x.png 3x" alt="x">'
+            f'<p>Lorem ipsum dolor sit amet {i}</p></div>'
+        )
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def bs4_assets(html_text, base_url):
+    """Ekstraksi setara dengan BeautifulSoup (walk per tag seperti kode lama)"""
+    from urllib.parse import urljoin
+    from bs4 import BeautifulSoup
+    from lib.htmlscan import extract_css_urls
+
+    soup = BeautifulSoup(html_text, 'html.parser')
+    base = soup.find('base', href=True)
+    if base:
+        base_url = urljoin(base_url, base['href'])
+    urls = []
+    for link in soup.find_all('link', href=True):
+        urls.append(urljoin(base_url, link['href']))
+    for tag in soup.find_all(['script', 'img', 'source', 'video', 'audio'], src=True):
+        urls.append(urljoin(base_url, tag['src']))
+    for tag in soup.find_all(srcset=True):
+        for cand in tag['srcset'].split(','):
+            if cand.strip():
+                urls.append(urljoin(base_url, cand.split()[0]))
+    for style in soup.find_all('style'):
+        urls.extend(u for u, _ in extract_css_urls(style.get_text(), base_url))
+    for tag in soup.find_all(style=True):
+        urls.extend(u for u, _ in extract_css_urls(tag['style'], base_url))
+    return urls
+
+
+def bench(name, func, html_text, rounds=3):
+    best = None
+    count = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        count = len(func(html_text, 'https://example.com/index.html'))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {name:<14} {best * 1000:9.1f} ms  ({count} assets)")
+    return best
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r', encoding='utf-8', errors='replace') as f:
+            html_text = f.read()
+    else:
+        html_text = synthetic_page()
+
+    print(f"[*] Page size: {len(html_text) / 1024 / 1024:.2f} MB")
+    fast = bench('htmlscan', extract_assets, html_text)
+    try:
+        slow = bench('BeautifulSoup', bs4_assets, html_text)
+        print(f"[+] Speedup: {slow / fast:.1f}x")
+    except ImportError:
+        print("[!] beautifulsoup4 tidak terinstall, perbandingan dilewati")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: keep-alive client bersama vs koneksi baru per request
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_http [requests] [threads]
+#
+# Server fixture lokal (HTTP/1.1, tanpa latency buatan) supaya yang terukur
+# murni biaya setup koneksi. Pola lama = requests.get() langsung
+# (Session + koneksi TCP baru setiap panggilan), pola baru = lib.http.HTTPClient.
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from benchmarks.fixtures import FixtureServer
+from lib.http import HTTPClient
+
+PAYLOAD = b'{"status": "success", "query": "8.8.8.8"}' * 8
+
+
+def app(method, path, headers, body):
+    return 200, {'Content-Type': 'application/json'}, PAYLOAD
+
+
+def run(name, fetch, urls, threads):
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            codes = list(pool.map(fetch, urls))
+    else:
+        codes = [fetch(u) for u in urls]
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for c in codes if c == 200)
+    print(f"  {name:<28} threads={threads:<3} {len(urls) / elapsed:9.1f} req/s  ({ok}/{len(urls)} OK)")
+    return len(urls) / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    with FixtureServer(app) as base_url:
+        urls = [f"{base_url}/json/{i}" for i in range(count)]
+        print(f"[*] {count} requests ke {base_url}")
+
+        for n in (1, threads):
+            old = run('requests.get (no keep-alive)', lambda u: requests.get(u, timeout=10).status_code, urls, n)
+            client = HTTPClient(pool_maxsize=max(n, 1))
+            new = run('HTTPClient (keep-alive)', lambda u: client.get(u, timeout=10).status_code, urls, n)
+            stats = client.metrics.summary()
+            for host, s in stats.items():
+                print(f"    metrics {host}: avg {s['avg_ms']} ms, p95 {s['p95_ms']} ms, retries {s['retries']}")
+            client.close()
+            print(f"  [+] {new / old:.1f}x lebih cepat")
+
+
+if __name__ == "__main__":
+    main()
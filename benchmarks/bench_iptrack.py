@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: iptrack bulk (batch POST) vs satu GET per IP
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_iptrack [ips] [window_seconds]
+#
+# Pakai stub ip-api lokal dengan rate limit free tier (45 GET / 15 batch per
+# window). Window default 2 detik (aslinya 60) supaya cepat selesai; rasio
+# waktu antar mode sama dengan di API asli.
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from benchmarks.fixtures import FixtureServer, ipapi_app
+from lib.http import HTTPClient
+from modules import iptrack
+
+
+def per_ip(base_url, ips):
+    """Pola lama: GET /json/<ip> satu per satu, tunggu X-Ttl kalo kena limit"""
+    client = HTTPClient(retries=0)
+    done = 0
+    for ip in ips:
+        while True:
+            r = client.get(f"{base_url}/json/{ip}", timeout=10)
+            if r.status_code == 429:
+                time.sleep(int(r.headers.get('X-Ttl', 1)) + 1)
+                continue
+            done += 1
+            if r.headers.get('X-Rl') == '0':
+                time.sleep(int(r.headers.get('X-Ttl', 1)) + 1)
+            break
+    return done
+
+
+def batched(base_url, ips):
+    with redirect_stdout(io.StringIO()):
+        return len(iptrack.track_ips(ips, api_url=base_url))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    window = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    ips = [f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}" for i in range(1, count + 1)]
+
+    print(f"[*] {count} IP, rate limit window {window}s")
+    for name, func in (('GET per IP', per_ip), ('POST /batch', batched)):
+        with FixtureServer(ipapi_app(window=window)) as base_url:
+            start = time.perf_counter()
+            done = func(base_url, ips)
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<12} {done:>6} IP  {elapsed:7.2f} s  -> {done / elapsed:8.1f} IP/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: save_to_json lama (json.dump indent=4) vs compact / orjson / streaming
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_json [records]
+#
+# Record berbentuk hasil scanport ({port, service}) dan subdomain ({subdomain, ip}),
+# default 1.000.000 (separuh-separuh). File ditulis ke folder sementara lalu dihapus.
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+from lib import json_save
+from lib.json_save import save_to_json, prepare_output, JSONWriter, JSONLWriter
+
+SERVICES = ('http', 'https', 'ssh', 'ftp', 'smtp', 'mysql', 'rdp', 'unknown')
+
+
+def make_records(count):
+    records = []
+    for i in range(count):
+        if i % 2:
+            records.append({'port': i % 65535 + 1, 'service': SERVICES[i % len(SERVICES)],
+                            'host': f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"})
+        else:
+            records.append({'subdomain': f"host{i}.sub{i % 97}.example.com",
+                            'ip': f"192.0.{i >> 8 & 255}.{i & 255}"})
+    return records
+
+
+def legacy_save(data, filename):
+    """save_to_json sebelum perubahan: json.dump indent=4 langsung ke file tujuan"""
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=4, default=str)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    records = make_records(count)
+    data = prepare_output(records, 'bench', 'scanport')
+    folder = tempfile.mkdtemp(prefix='osxnt-bench-json-')
+    print(f"[*] {count} record, orjson: {'ya' if json_save.HAS_ORJSON else 'tidak'}")
+
+    def run(name, func, filename):
+        path = os.path.join(folder, filename)
+        start = time.perf_counter()
+        func(path)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path) / 1024 / 1024
+        print(f"  {name:<34} {elapsed:7.2f} s  {count / elapsed:10.0f} record/s  {size:7.1f} MB")
+        return path
+
+    def stream(path):
+        with JSONWriter(path, 'bench', 'scanport') as writer:
+            writer.write_many(records)
+
+    def jsonl(path):
+        with JSONLWriter(path, 'w') as writer:
+            writer.write_many(records)
+
+    has_orjson = json_save.HAS_ORJSON
+    try:
+        # save_to_json mencetak "[+] Results saved", disembunyikan supaya tabel rapi
+        quiet = open(os.devnull, 'w')
+        stdout = sys.stdout
+
+        def silent(func):
+            def wrapper(path):
+                sys.stdout = quiet
+                try:
+                    func(path)
+                finally:
+                    sys.stdout = stdout
+            return wrapper
+
+        run('legacy json.dump indent=4', lambda p: legacy_save(data, p), 'legacy.json')
+        run('save_to_json (pretty, atomic)', silent(lambda p: save_to_json(data, p)), 'pretty.json')
+        json_save.HAS_ORJSON = False
+        run('save_to_json compact (stdlib)', silent(lambda p: save_to_json(data, p, compact=True)),
+            'compact-std.json')
+        run('JSONWriter stream (stdlib)', stream, 'stream-std.json')
+        json_save.HAS_ORJSON = has_orjson
+        if has_orjson:
+            run('save_to_json compact (orjson)', silent(lambda p: save_to_json(data, p, compact=True)),
+                'compact-orjson.json')
+            run('JSONWriter stream (orjson)', stream, 'stream-orjson.json')
+        run('JSONLWriter', jsonl, 'records.jsonl')
+
+        # Incremental: 10 run x 1/10 record ke file .jsonl yang sama
+        chunk = max(1, count // 10)
+
+        def incremental(path):
+            for i in range(0, count, chunk):
+                save_to_json(prepare_output(records[i:i + chunk], 'bench', 'scanport'), path)
+        run('save_to_json .jsonl, 10x append', silent(incremental), 'append.jsonl')
+
+        # Semua format harus terbaca balik dengan isi yang sama
+        for filename in ('legacy.json', 'pretty.json', 'compact-std.json', 'stream-std.json'):
+            with open(os.path.join(folder, filename)) as f:
+                assert json.load(f)['data'] == records, filename
+        with open(os.path.join(folder, 'append.jsonl')) as f:
+            assert [json.loads(line)['data'] for line in f] == records
+        print("  [+] isi semua file sama")
+    finally:
+        json_save.HAS_ORJSON = has_orjson
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
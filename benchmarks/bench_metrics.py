@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: overhead metrics (incr / observe / span) nonaktif vs aktif,
+# dan overhead capture cProfile pada loop panas
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_metrics [iterations]
+#
+# Default 1.000.000 iterasi. "Loop panas" meniru satu probe scanport tanpa jaringan:
+# dua perf_counter + observe + incr per iterasi.
+
+import sys
+import time
+import cProfile
+from lib import metrics
+
+
+def hot_loop(count, instrumented):
+    total = 0
+    for i in range(count):
+        if instrumented:
+            start = time.perf_counter()
+        total += i & 7
+        if instrumented:
+            metrics.observe('bench.probe', time.perf_counter() - start)
+            if total & 1:
+                metrics.incr('bench.open')
+    return total
+
+
+def per_call(name, func, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    registry = metrics.get_metrics()
+    print(f"[*] {count} iterasi")
+
+    calls = (
+        ('incr', lambda: metrics.incr('bench.counter')),
+        ('observe', lambda: metrics.observe('bench.latency', 0.001)),
+        ('span (with)', lambda: metrics.span('bench').__enter__().__exit__()),
+    )
+    baseline = per_call('lambda kosong', lambda: None, count)
+    print(f"  {'lambda kosong (dasar)':<24} {baseline:8.0f} ns/panggilan")
+    for enabled in (False, True):
+        registry.enabled = enabled
+        registry.reset()
+        for name, func in calls:
+            ns = per_call(name, func, count)
+            print(f"  {name + (' aktif' if enabled else ' nonaktif'):<24} {ns:8.0f} ns/panggilan "
+                  f"(+{ns - baseline:.0f} ns)")
+
+    print("  Loop panas:")
+    registry.enabled = False
+    start = time.perf_counter()
+    hot_loop(count, False)
+    plain = time.perf_counter() - start
+    print(f"    {'tanpa instrumentasi':<32} {plain:6.2f} s")
+    for label, enabled in (('instrumentasi, metrics nonaktif', False), ('instrumentasi, metrics aktif', True)):
+        registry.enabled = enabled
+        registry.reset()
+        start = time.perf_counter()
+        hot_loop(count, True)
+        elapsed = time.perf_counter() - start
+        print(f"    {label:<32} {elapsed:6.2f} s  (+{(elapsed - plain) / count * 1e9:.0f} ns/iterasi)")
+
+    registry.enabled = True
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    hot_loop(count, True)
+    profiler.disable()
+    elapsed = time.perf_counter() - start
+    print(f"    {'metrics aktif + cProfile':<32} {elapsed:6.2f} s")
+    registry.enabled = False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: biaya progress di loop panas
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_progress [words] [threads]
+#
+# Loop meniru crack_wordlist (md5 per kata) dan worker multi-thread (scanport /
+# subdomain). Progress mode json ke /dev/null supaya ticker benar-benar render.
+
+import os
+import sys
+import time
+import hashlib
+import threading
+from lib.progress import Progress
+
+
+def crack(words, target, mode):
+    """mode: none, print (cara lama tiap 10.000), update (tiap 1024), advance (per kata)"""
+    with open(os.devnull, 'w') as null:
+        p = Progress(len(words), 'crack', 'word', mode='json', interval=0.1, stream=null).start()
+        for i, word in enumerate(words):
+            if mode == 'print':
+                if i % 10000 == 0 and i > 0:
+                    print(f"  Progress: {i}/{len(words)} words", file=null)
+            elif mode == 'update':
+                if not i & 0x3FF:
+                    p.update(i)
+            elif mode == 'advance':
+                p.advance()
+            if hashlib.md5(word.encode()).hexdigest() == target:
+                break
+        p.close()
+
+
+def threaded(count, threads, kind):
+    """kind: none, lock (counter + Lock, pola umum), progress (slot per thread)"""
+    per_thread = count // threads
+    lock = threading.Lock()
+    state = {'done': 0}
+    with open(os.devnull, 'w') as null:
+        p = Progress(per_thread * threads, 'worker', mode='json', interval=0.1, stream=null).start()
+
+        def worker():
+            for _ in range(per_thread):
+                if kind == 'lock':
+                    with lock:
+                        state['done'] += 1
+                elif kind == 'progress':
+                    p.advance()
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        p.close()
+        return p.counts()[0] if kind == 'progress' else state['done']
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    words = [f"pass{i}" for i in range(count)]
+    print(f"[*] crack_wordlist md5, {count} kata (tidak ketemu)")
+    base = None
+    for mode in ('none', 'print', 'update', 'advance'):
+        start = time.perf_counter()
+        crack(words, 'x' * 32, mode)
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(f"  {mode:<8} {elapsed:6.2f} s  ({(elapsed / base - 1) * 100:+5.1f}%)")
+
+    print(f"[*] {threads} thread, {count} item total")
+    base = None
+    for kind in ('none', 'lock', 'progress'):
+        start = time.perf_counter()
+        done = threaded(count, threads, kind)
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(f"  {kind:<8} {elapsed:6.2f} s  ({(elapsed - base) / count * 1e9:+6.0f} ns/item)  hitungan {done}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: read_targets_from_file + set string vs iter_targets (lazy, TargetSet)
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_targets [prefix_len]
+#
+# Default /12 (1.048.574 host). Pola lama: CIDR ditulis ke file satu IP per baris,
+# dibaca jadi list, dedupe pakai set string. Memori diukur dengan tracemalloc
+# di putaran terpisah (tracemalloc memperlambat).
+
+import os
+import sys
+import time
+import random
+import tempfile
+import ipaddress
+import tracemalloc
+from lib.multi_target import read_targets_from_file, iter_targets, TargetSet
+
+
+def legacy(path):
+    """Pola lama: list penuh dari file, dedupe set string"""
+    seen = set()
+    out = []
+    for target in read_targets_from_file(path):
+        if target not in seen:
+            seen.add(target)
+            out.append(target)
+    return sum(1 for _ in out)
+
+
+def measure(name, func):
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    print(f"  {name:<40} {elapsed:6.2f} s  {count / elapsed:10.0f} target/s  puncak {peak:8.1f} MB")
+
+
+def main():
+    prefix = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    cidr = f"10.0.0.0/{prefix}"
+    net = ipaddress.ip_network(cidr)
+    fd, path = tempfile.mkstemp(prefix='osxnt-bench-targets-', suffix='.txt')
+    print(f"[*] {cidr}: {net.num_addresses - 2} host")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            for addr in net.hosts():
+                f.write(f"{addr}\n")
+        size = os.path.getsize(path) / 1024 / 1024
+
+        measure(f"file {size:.0f} MB -> list + set string", lambda: legacy(path))
+        measure("iter_targets(@file)", lambda: sum(1 for _ in iter_targets('@' + path)))
+        measure(f"iter_targets('{cidr}')", lambda: sum(1 for _ in iter_targets(cidr)))
+        measure(f"iter_targets('{cidr}', dedupe=False)",
+                lambda: sum(1 for _ in iter_targets(cidr, dedupe=False)))
+
+        # Dedupe saja: string dibuat lazy supaya memori yang ditahan set ikut terhitung.
+        # 'acak' = IP acak (jarang per /16), 'padat' = isi CIDR berurutan
+        count = net.num_addresses - 2
+
+        def sparse():
+            rng = random.Random(1)
+            for _ in range(count):
+                yield f"{rng.randrange(1, 224)}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}"
+
+        def dense():
+            return (str(addr) for addr in net.hosts())
+
+        for label, items in (('acak', sparse), ('padat', dense)):
+            start = time.perf_counter()
+            for _ in items():
+                pass
+            baseline = time.perf_counter() - start
+            print(f"  dedupe {count} IP {label:<6} (buat string saja {baseline:.2f} s)")
+            for kind in ('set string', 'TargetSet'):
+                store = set() if kind == 'set string' else TargetSet()
+                start = time.perf_counter()
+                for item in items():
+                    store.add(item)
+                elapsed = time.perf_counter() - start
+                del store
+                tracemalloc.start()
+                store = set() if kind == 'set string' else TargetSet()
+                for item in items():
+                    store.add(item)
+                current = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+                tracemalloc.stop()
+                del store
+                print(f"    {kind:<12} {elapsed:6.2f} s  memori ditahan {current:8.1f} MB")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: memori URLExtractor untuk crawl besar
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_url_store [unique_urls] [pages]
+#
+# Simulasi hasil crawl (setiap halaman punya ~100 link, banyak yang berulang
+# lintas halaman seperti navbar/footer) lalu bandingkan peak memori
+# (tracemalloc) antara bookkeeping lama (list per kategori + duplikat +
+# urlparse ulang untuk domain) dan lib.url_store.URLStore.
+
+import sys
+import time
+import random
+import tracemalloc
+from collections import Counter
+from urllib.parse import urlparse
+from lib.url_store import URLStore
+
+CATEGORIES = ('internal', 'external', 'static', 'mailto', 'javascript', 'invalid')
+
+
+def synthetic_crawl(unique, pages, per_page=100, seed=1):
+    """Generator (page_url, [url_info, ...]) untuk crawl sintetis"""
+    rng = random.Random(seed)
+    hosts = [f"cdn{i}.example-{i % 37}.net" for i in range(200)]
+    pool = []
+    for i in range(unique):
+        r = i % 10
+        if r < 6:
+            pool.append((f"https://target.example.com/section/{i % 300}/article-{i}?ref=nav&page={i % 7}", 'internal', 'a'))
+        elif r < 8:
+            pool.append((f"https://{hosts[i % len(hosts)]}/out/{i}/index", 'external', 'a'))
+        else:
+            pool.append((f"https://target.example.com/static/{i}/bundle.{'js' if r == 8 else 'css'}", 'static', 'script'))
+    # Link navigasi yang muncul di setiap halaman
+    nav = pool[:20]
+    for p in range(pages):
+        page = f"https://target.example.com/section/{p % 300}/article-{p}"
+        links = nav + [pool[rng.randrange(unique)] for _ in range(per_page - len(nav))]
+        # String baru per kemunculan, seperti hasil parse HTML sungguhan
+        yield page, [{'url': (u + ' ')[:-1], 'type': kind, 'category': cat} for u, cat, kind in links]
+
+
+def legacy(crawl):
+    categories = {cat: [] for cat in CATEGORIES}
+    for page, links in crawl:
+        for info in links:
+            cat = info['category']
+            categories[cat].append(dict(info) if cat == 'static' else info['url'])
+    domains = []
+    for urls in categories.values():
+        for u in urls:
+            u = u if isinstance(u, str) else u['url']
+            domains.append(urlparse(u).netloc)
+    by_domain = dict(Counter(domains).most_common())
+    return sum(len(v) for v in categories.values()), categories, by_domain
+
+
+def with_store(crawl):
+    store = URLStore(CATEGORIES)
+    for page, links in crawl:
+        source = store.intern(page)
+        for info in links:
+            store.add(info['url'], info['category'], source, info['type'])
+    return sum(store.counts_by_category().values()), store, store.counts_by_domain()
+
+
+def measure(name, func, unique, pages):
+    # Data halaman dibuat lazy di dalam pengukuran: string URL yang
+    # disimpan ikut terhitung, yang dibuang tidak
+    tracemalloc.start()
+    start = time.perf_counter()
+    count, keep, _ = func(synthetic_crawl(unique, pages))
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<10} {count:>9} entries  retained {current / 1024 / 1024:7.1f} MB  "
+          f"peak {peak / 1024 / 1024:7.1f} MB  {elapsed:6.2f} s")
+    del keep
+    return current
+
+
+def main():
+    unique = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    print(f"[*] Crawl sintetis: {pages} pages x 100 links, {unique} unique URLs")
+    old = measure('legacy', legacy, unique, pages)
+    new = measure('URLStore', with_store, unique, pages)
+    print(f"[+] Retained memory: {old / new:.1f}x lebih kecil")
+
+
+if __name__ == "__main__":
+    main()
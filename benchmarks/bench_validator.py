@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: validator lama (re.match string / exception / replace loop) vs
+# pattern precompiled, str.translate dan validate_many
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_validator [lines]
+#
+# Default 1.000.000 baris campuran: IPv4, IPv6, domain, email, URL dan sampah.
+# Sebelum timing, hasil fungsi baru dicek sama dengan fungsi lama.
+
+import re
+import sys
+import time
+import random
+import ipaddress
+from urllib.parse import urlparse
+from lib import validator
+from lib.validator import validate_many
+
+
+# ---------- fungsi lama (sebelum perubahan) ----------
+
+def legacy_ip(ip):
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except:
+        return False
+
+
+def legacy_domain(domain):
+    pattern = r'^[a-zA-Z0-9][a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}$'
+    return re.match(pattern, domain) is not None
+
+
+def legacy_url(url):
+    try:
+        result = urlparse(url)
+        return all([result.scheme, result.netloc])
+    except:
+        return False
+
+
+def legacy_email(email):
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return re.match(pattern, email) is not None
+
+
+def legacy_sanitize(filename):
+    unsafe = '<>:"/\\|?* '
+    for char in unsafe:
+        filename = filename.replace(char, '_')
+    return filename
+
+
+def legacy_classify(lines):
+    """Cara lama mengklasifikasi list: coba validator satu per satu"""
+    for line in lines:
+        value = line.strip()
+        if not value or value[0] == '#':
+            continue
+        if legacy_url(value) and '://' in value:
+            label = 'url'
+        elif legacy_ip(value):
+            label = 'ipv6' if ':' in value else 'ipv4'
+        elif '@' in value:
+            label = 'email' if legacy_email(value) else None
+        elif legacy_domain(value):
+            label = 'domain'
+        else:
+            label = None
+        yield value, label
+
+
+# ---------- data ----------
+
+def make_lines(count, rng):
+    words = ('mail', 'www', 'api', 'dev', 'vpn', 'shop', 'cdn', 'static')
+    tlds = ('com', 'id', 'net', 'org', 'co.id')
+    lines = []
+    for i in range(count):
+        kind = i % 6
+        if kind == 0:
+            lines.append(f"{rng.randrange(1, 224)}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}\n")
+        elif kind == 1:
+            lines.append(f"2001:db8:{rng.randrange(65536):x}::{rng.randrange(65536):x}\n")
+        elif kind == 2:
+            lines.append(f"{rng.choice(words)}{i}.example.{rng.choice(tlds)}\n")
+        elif kind == 3:
+            lines.append(f"user{i}@{rng.choice(words)}.example.{rng.choice(tlds)}\n")
+        elif kind == 4:
+            lines.append(f"https://{rng.choice(words)}.example.{rng.choice(tlds)}/p/{i}?q={i}\n")
+        else:
+            lines.append(rng.choice(("not a host\n", "999.1.1.1\n", "-bad-.com\n", "x@y\n", "\n", "# komentar\n")))
+    return lines
+
+
+def timed(name, func, count):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<44} {elapsed:6.2f} s  {count / elapsed:10.0f} /s")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(1)
+    lines = make_lines(count, rng)
+    values = [line.strip() for line in lines]
+    filenames = [f"scan {v}:{i}/result?.json" for i, v in enumerate(values[:count // 5])]
+    print(f"[*] {count} baris campuran")
+
+    # Hasil harus sama dengan fungsi lama
+    for v in values:
+        assert validator.is_valid_ip(v) == legacy_ip(v), v
+        assert validator.is_valid_domain(v) == legacy_domain(v), v
+        assert validator.is_valid_email(v) == legacy_email(v), v
+        assert validator.is_valid_url(v) == legacy_url(v), v
+    for name in filenames[:10000]:
+        assert validator.sanitize_filename(name) == legacy_sanitize(name)
+    old = list(legacy_classify(lines))
+    new = list(validate_many(lines))
+    assert old == new, [(a, b) for a, b in zip(old, new) if a != b][:5]
+    print("[+] Hasil sama dengan fungsi lama")
+
+    pairs = (
+        ('is_valid_ip', legacy_ip, validator.is_valid_ip),
+        ('is_valid_domain', legacy_domain, validator.is_valid_domain),
+        ('is_valid_email', legacy_email, validator.is_valid_email),
+        ('is_valid_url', legacy_url, validator.is_valid_url),
+    )
+    for name, old_func, new_func in pairs:
+        timed(f"{name} lama", lambda: sum(1 for v in values if old_func(v)), count)
+        timed(f"{name} baru", lambda: sum(1 for v in values if new_func(v)), count)
+
+    n = len(filenames)
+    timed("sanitize_filename lama (replace loop)", lambda: [legacy_sanitize(f) for f in filenames], n)
+    timed("sanitize_filename baru (translate)", lambda: [validator.sanitize_filename(f) for f in filenames], n)
+
+    timed("klasifikasi lama (validator satu per satu)", lambda: sum(1 for _ in legacy_classify(lines)), count)
+    timed("validate_many(lines)", lambda: sum(1 for _ in validate_many(lines)), count)
+    timed("validate_many(lines, 'ip')", lambda: sum(1 for _ in validate_many(lines, 'ip')), count)
+
+
+if __name__ == "__main__":
+    main()
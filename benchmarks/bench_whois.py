@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark: WhoisClient vs pola lama (server dicari ulang, serial, regex per field)
+# Jalankan dari root repo:
+#   python -m benchmarks.bench_whois [domains] [latency_ms]
+#
+# Pakai tiga server WHOIS lokal (IANA, registry thin, registrar thick) dengan
+# latency buatan per query. Tanpa internet, tanpa python-whois.
+
+import re
+import sys
+import time
+import socket
+from benchmarks.fixtures import FakeWhoisServer, whois_apps
+from lib.lookup_cache import configure_lookup_cache
+from lib.whois_client import WhoisClient, parse_whois
+
+# Mirip python-whois: beberapa regex per field, masing-masing di-scan ke seluruh teks
+LEGACY_PATTERNS = {
+    'registrar': [r'Registrar:\s*(.+)', r'Sponsoring Registrar:\s*(.+)', r'Registrar Name:\s*(.+)'],
+    'creation_date': [r'Creation Date:\s*(.+)', r'Created On:\s*(.+)', r'created:\s*(.+)',
+                      r'Registered on:\s*(.+)', r'Domain Registration Date:\s*(.+)'],
+    'expiration_date': [r'Registry Expiry Date:\s*(.+)', r'Registrar Registration Expiration Date:\s*(.+)',
+                        r'Expiration Date:\s*(.+)', r'Expiry date:\s*(.+)', r'paid-till:\s*(.+)'],
+    'updated_date': [r'Updated Date:\s*(.+)', r'Last Updated On:\s*(.+)', r'changed:\s*(.+)',
+                     r'Last Modified:\s*(.+)'],
+    'name_servers': [r'Name Server:\s*(.+)', r'nserver:\s*(.+)', r'Nameservers?:\s*(.+)'],
+    'emails': [r'[\w.+-]+@[\w-]+\.[\w.-]+'],
+    'org': [r'Registrant Organization:\s*(.+)', r'Registrant Organisation:\s*(.+)', r'org:\s*(.+)'],
+    'country': [r'Registrant Country:\s*(.+)', r'country:\s*(.+)'],
+    'referral': [r'Registrar WHOIS Server:\s*(.+)', r'whois:\s*(.+)', r'refer:\s*(.+)']
+}
+
+
+def legacy_parse(text):
+    result = {}
+    for field, patterns in LEGACY_PATTERNS.items():
+        values = []
+        for pattern in patterns:
+            values.extend(v.strip() for v in re.findall(pattern, text, re.IGNORECASE))
+        result[field] = values
+    return result
+
+
+def raw_query(server, text):
+    host, port = server.rsplit(':', 1)
+    with socket.create_connection((host, int(port)), timeout=10) as sock:
+        sock.sendall(text.encode())
+        chunks = []
+        while True:
+            chunk = sock.recv(16384)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b''.join(chunks).decode('utf-8', 'replace')
+
+
+def legacy_lookup(iana, domain):
+    """Pola lama: tanya IANA untuk setiap domain, ikuti referral, parse pakai regex per field"""
+    tld = domain.rsplit('.', 1)[-1]
+    server = legacy_parse(raw_query(iana, f"{tld}\r\n"))['referral'][0]
+    text = raw_query(server, f"{domain}\r\n")
+    referral = legacy_parse(text)['referral']
+    if referral and referral[0] != server:
+        text += raw_query(referral[0], f"{domain}\r\n")
+    return legacy_parse(text)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 20.0) / 1000
+    tlds = ('test', 'example', 'invalid', 'fixture')
+    domains = [f"site{i}.{tlds[i % len(tlds)]}" for i in range(count)]
+
+    # Lookup cache dimatikan supaya tiap mode benar-benar query ke server
+    configure_lookup_cache(enabled=False)
+    servers, iana_app, registry_app, registrar_app = whois_apps()
+    iana = FakeWhoisServer(iana_app, latency)
+    registry = FakeWhoisServer(registry_app, latency)
+    registrar = FakeWhoisServer(registrar_app, latency)
+    iana_addr = iana.start()
+    servers['registry'] = registry.start()
+    servers['registrar'] = registrar.start()
+
+    print(f"[*] {count} domain, {len(tlds)} TLD, latency {latency * 1000:.0f} ms per query")
+    try:
+        def reset():
+            for server in (iana, registry, registrar):
+                server.queries.clear()
+
+        def report(name, elapsed, done):
+            queries = len(iana.queries) + len(registry.queries) + len(registrar.queries)
+            print(f"  {name:<26} {elapsed:7.2f} s  {done / elapsed:8.1f} domain/s  "
+                  f"({queries} query, {len(iana.queries)} ke IANA)")
+
+        reset()
+        start = time.perf_counter()
+        done = sum(1 for d in domains if legacy_lookup(iana_addr, d)['registrar'])
+        report('legacy serial', time.perf_counter() - start, done)
+
+        reset()
+        client = WhoisClient(rdap=False, delay=0, iana_server=iana_addr, servers={})
+        client.servers.clear()
+        start = time.perf_counter()
+        done = sum(1 for d in domains if client.lookup(d))
+        report('WhoisClient serial', time.perf_counter() - start, done)
+
+        reset()
+        client = WhoisClient(rdap=False, delay=0, max_per_server=8, iana_server=iana_addr)
+        client.servers.clear()
+        start = time.perf_counter()
+        results = client.lookup_many(domains, workers=16)
+        report('WhoisClient 16 thread', time.perf_counter() - start,
+               sum(1 for r in results.values() if r))
+
+        sample = results[domains[0]]
+        print(f"  sample: registrar={sample['registrar']!r} org={sample['org']!r} "
+              f"ns={sample['name_servers']} server={sample['whois_server']}")
+        missing = client.lookup('missing-domain.test')
+        print(f"  tidak terdaftar -> {missing!r}")
+
+        # Rate limit per server: 1 in-flight, jeda 50 ms
+        reset()
+        client = WhoisClient(rdap=False, delay=0.05, max_per_server=1, max_referrals=0,
+                             iana_server=iana_addr)
+        client.servers.clear()
+        client.lookup_many(domains[:40], workers=16)
+        stamps = sorted(t for _, t in registry.queries)
+        gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+        print(f"  rate limit 50 ms/server: {len(stamps)} query ke registry, "
+              f"jeda minimum {min(gaps) * 1000:.1f} ms")
+    finally:
+        for server in (iana, registry, registrar):
+            server.stop()
+
+    # Parsing saja
+    text = registry_app('domain example.test') + registrar_app('example.test')
+    rounds = 20000
+    for name, func in (('legacy regex per field', legacy_parse), ('parse_whois (field map)', parse_whois)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            func(text)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<26} {rounds / elapsed:10.0f} record/s")
+
+
+if __name__ == "__main__":
+    main()
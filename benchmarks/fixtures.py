@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# OSXNT - Benchmark fixtures
+# HTTP server lokal dengan latency buatan, untuk benchmark tanpa internet
+
+import time
+import threading
+import socketserver
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _serve(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            server.requests += 1
+
+        status, headers, payload = server.app(self.command, self.path, self.headers, body)
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    do_GET = do_HEAD = do_POST = _serve
+
+    def log_message(self, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    HTTP server lokal di thread terpisah.
+
+    app(method, path, headers, body) -> (status, headers_dict, body_bytes)
+
+        with FixtureServer(site_app(), latency=0.05) as base_url:
+            ...
+    """
+
+    def __init__(self, app, latency=0.0, host='127.0.0.1', port=0):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = app
+        self.httpd.latency = latency
+        self.httpd.lock = threading.Lock()
+        self.httpd.requests = 0
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def site_app(pages=200, links=5, assets=3, broken_every=10):
+    """
+    Situs sintetis: /page/<n> punya `links` link internal, `assets` gambar,
+    dan satu link external. Setiap `broken_every` asset mengembalikan 404.
+    """
+    def app(method, path, headers, body):
+        if path == '/robots.txt':
+            return 200, {'Content-Type': 'text/plain'}, b'User-agent: *\nDisallow: /private\n'
+        if path.startswith('/page/'):
+            try:
+                n = int(path.split('/')[2])
+            except ValueError:
+                return 404, {}, b'not found'
+            parts = [f'<html><body><h1>Page {n}</h1>']
+            for k in range(1, links + 1):
+                parts.append(f'<a href="/page/{(n * links + k) % pages}">p</a>')
+            for k in range(assets):
+                parts.append(f'<img src="/asset/{(n + k) % 50}.png">')
+            parts.append('<a href="/private/secret">x</a><a href="https://example.org/">ext</a>')
+            parts.append('</body></html>')
+            return 200, {'Content-Type': 'text/html'}, ''.join(parts).encode()
+        if path.startswith('/asset/'):
+            name = path.rsplit('/', 1)[1]
+            num = int(name.split('.')[0]) if name.split('.')[0].isdigit() else 0
+            if broken_every and num % broken_every == 0:
+                return 404, {}, b''
+            return 200, {'Content-Type': 'image/png'}, b'\x89PNG' + b'\x00' * 256
+        return 404, {}, b'not found'
+    return app
+
+
+def ipapi_app(single_limit=45, batch_limit=15, window=60.0):
+    """
+    Stub ip-api: GET /json/<ip> dan POST /batch dengan rate limit per window
+    seperti free tier (header X-Rl / X-Ttl, 429 kalo limit habis).
+    `window` bisa dikecilkan supaya benchmark tidak perlu menunggu 1 menit.
+    """
+    import json
+    lock = threading.Lock()
+    state = {'start': time.monotonic(), 'single': 0, 'batch': 0}
+
+    def record(ip):
+        last = ip.rsplit('.', 1)[-1]
+        return {'status': 'success', 'query': ip, 'country': 'Testland', 'countryCode': 'TL',
+                'regionName': 'Fixture', 'city': f'City-{last}', 'isp': 'Fixture ISP',
+                'org': 'Fixture Org', 'as': 'AS64500 Fixture', 'lat': 0.0, 'lon': 0.0}
+
+    def app(method, path, headers, body):
+        if path.startswith('/json/'):
+            kind, limit = 'single', single_limit
+        elif path.startswith('/batch') and method == 'POST':
+            kind, limit = 'batch', batch_limit
+        else:
+            return 404, {}, b'not found'
+
+        with lock:
+            now = time.monotonic()
+            if now - state['start'] >= window:
+                state.update(start=now, single=0, batch=0)
+            state[kind] += 1
+            count = state[kind]
+            ttl = max(0, int(window - (now - state['start'])))
+        rl_headers = {'Content-Type': 'application/json',
+                      'X-Rl': str(max(0, limit - count)), 'X-Ttl': str(ttl)}
+        if count > limit:
+            return 429, rl_headers, b'{"status": "fail", "message": "rate limited"}'
+
+        if kind == 'single':
+            ip = path.split('/')[2].split('?')[0]
+            return 200, rl_headers, json.dumps(record(ip)).encode()
+        ips = json.loads(body or b'[]')
+        if len(ips) > 100:
+            return 422, rl_headers, b'{"status": "fail", "message": "too many IPs"}'
+        return 200, rl_headers, json.dumps([record(ip if isinstance(ip, str) else ip.get('query'))
+                                            for ip in ips]).encode()
+    return app
+
+
+class _WhoisHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        query = self.rfile.readline().decode('utf-8', 'replace').strip()
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            server.queries.append((query, time.monotonic()))
+        self.wfile.write(server.app(query).encode('utf-8'))
+
+
+class FakeWhoisServer:
+    """
+    Server WHOIS (port 43 style) lokal: baca satu baris query, balas, tutup.
+
+    app(query) -> response text
+
+        with FakeWhoisServer(app) as address:   # "127.0.0.1:<port>"
+            ...
+    """
+
+    def __init__(self, app, latency=0.0, host='127.0.0.1', port=0):
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self.server = socketserver.ThreadingTCPServer((host, port), _WhoisHandler)
+        self.server.daemon_threads = True
+        self.server.app = app
+        self.server.latency = latency
+        self.server.lock = threading.Lock()
+        self.server.queries = []
+        self.thread = None
+
+    @property
+    def address(self):
+        host, port = self.server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def queries(self):
+        return self.server.queries
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.address
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def whois_apps():
+    """
+    Tiga app WHOIS: IANA (TLD -> registry), registry thin (referral ke
+    registrar) dan registrar thick. Alamat server diisi lewat dict `servers`
+    setelah server jalan: {'registry': 'host:port', 'registrar': 'host:port'}.
+    """
+    servers = {}
+
+    def iana(query):
+        return (f"% IANA WHOIS server\n\ndomain:       {query.upper()}\n"
+                f"organisation: Fixture Registry\nwhois:        {servers['registry']}\n"
+                f"status:       ACTIVE\n")
+
+    def registry(query):
+        domain = query.split()[-1].lower()
+        if domain.startswith('missing'):
+            return f'No match for "{domain.upper()}".\n'
+        return (f"   Domain Name: {domain.upper()}\n"
+                f"   Registry Domain ID: 1_DOMAIN_FIXTURE\n"
+                f"   Registrar WHOIS Server: {servers['registrar']}\n"
+                f"   Updated Date: 2024-01-01T00:00:00Z\n"
+                f"   Creation Date: 2001-02-03T04:05:06Z\n"
+                f"   Registry Expiry Date: 2030-02-03T04:05:06Z\n"
+                f"   Registrar: Fixture Registrar LLC\n"
+                f"   Name Server: NS1.{domain.upper()}\n"
+                f"   Name Server: NS2.{domain.upper()}\n"
+                f">>> Last update of whois database: 2024-01-01T00:00:00Z <<<\n"
+                + "\nTERMS OF USE: fixture data only.\n" * 20)
+
+    def registrar(query):
+        domain = query.split()[-1].lower()
+        return (f"Domain Name: {domain}\n"
+                f"Registrar WHOIS Server: {servers['registrar']}\n"
+                f"Creation Date: 2001-02-03T04:05:06Z\n"
+                f"Registrar Registration Expiration Date: 2030-02-03T04:05:06Z\n"
+                f"Registrar: Fixture Registrar LLC\n"
+                f"Registrar Abuse Contact Email: abuse@registrar.test\n"
+                f"Registrant Organization: Fixture Corp\n"
+                f"Registrant Country: ID\n"
+                f"Registrant Email: owner@{domain}\n"
+                f"Name Server: ns1.{domain}\n"
+                f"Name Server: ns2.{domain}\n"
+                + "\nThe data in this record is provided for information purposes only.\n" * 20)
+
+    return servers, iana, registry, registrar
+
+
+class FakeDNSServer:
+    """
+    Stub resolver lokal (UDP + TCP di port yang sama, butuh dnspython).
+
+    - A / AAAA / TXT dijawab dengan data sintetis, TTL 300
+    - nama yang diawali "nx" -> NXDOMAIN
+    - nama yang diawali "big" -> 40 record TXT; lewat UDP dikirim dengan flag TC
+      supaya client mengulang lewat TCP
+
+        with FakeDNSServer(latency=0.002) as (host, port):
+            ...
+    """
+
+    def __init__(self, latency=0.0, host='127.0.0.1'):
+        import dns.flags
+        import dns.message
+        import dns.rcode
+        import dns.rdatatype
+        import dns.rrset
+
+        stub = self
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.counts = {'udp': 0, 'tcp': 0}
+
+        def answer(wire, transport):
+            request = dns.message.from_wire(wire)
+            response = dns.message.make_response(request)
+            question = request.question[0]
+            name = question.name.to_text(omit_final_dot=True)
+            rdtype = dns.rdatatype.to_text(question.rdtype)
+            if stub.latency:
+                time.sleep(stub.latency)
+            with stub.lock:
+                stub.counts[transport] += 1
+            if name.startswith('nx'):
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            elif name.startswith('big'):
+                if transport == 'udp':
+                    response.flags |= dns.flags.TC
+                else:
+                    texts = [f'"fixture record {i} {"x" * 60}"' for i in range(40)]
+                    response.answer.append(dns.rrset.from_text(question.name, 300, 'IN', 'TXT', *texts))
+            elif rdtype == 'A':
+                last = sum(name.encode()) % 254 + 1
+                response.answer.append(dns.rrset.from_text(question.name, 300, 'IN', 'A', f'192.0.2.{last}'))
+            elif rdtype == 'AAAA':
+                response.answer.append(dns.rrset.from_text(question.name, 300, 'IN', 'AAAA', '2001:db8::1'))
+            elif rdtype == 'TXT':
+                response.answer.append(dns.rrset.from_text(question.name, 300, 'IN', 'TXT', '"v=fixture"'))
+            return response.to_wire()
+
+        class UDPHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                data, sock = self.request
+                sock.sendto(answer(data, 'udp'), self.client_address)
+
+        class TCPHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                header = self.request.recv(2)
+                if len(header) < 2:
+                    return
+                length = int.from_bytes(header, 'big')
+                data = b''
+                while len(data) < length:
+                    chunk = self.request.recv(length - len(data))
+                    if not chunk:
+                        return
+                    data += chunk
+                wire = answer(data, 'tcp')
+                self.request.sendall(len(wire).to_bytes(2, 'big') + wire)
+
+        self.udp = socketserver.ThreadingUDPServer((host, 0), UDPHandler)
+        self.udp.daemon_threads = True
+        port = self.udp.server_address[1]
+        self.tcp = socketserver.ThreadingTCPServer((host, port), TCPHandler)
+        self.tcp.daemon_threads = True
+        self.address = (host, port)
+
+    def start(self):
+        for server in (self.udp, self.tcp):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self.address
+
+    def stop(self):
+        for server in (self.udp, self.tcp):
+            server.shutdown()
+            server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
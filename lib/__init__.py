@@ -1,25 +1,46 @@
 # lib/__init__.py
 # OSXNT - Library Package
 
-from .multi_target import read_targets_from_file, sanitize_filename, process_placeholder
-from .json_save import save_to_json, prepare_output
+from .multi_target import (read_targets_from_file, sanitize_filename, process_placeholder,
+                           iter_targets, is_multi_target, normalize_target, TargetSet)
+from .json_save import save_to_json, append_to_jsonl, prepare_output, configure_json, JSONWriter, JSONLWriter
 from .verbose import Verbose
-from .csv_save import save_to_csv, append_to_csv, dict_to_csv
+from .csv_save import save_to_csv, append_to_csv, dict_to_csv, CSVWriter
 from .txt_save import save_to_txt, append_to_txt, save_results
 from .file_helper import ensure_dir, get_unique_filename, list_files, delete_file, copy_file, move_file, get_file_size, read_file
-from .validator import is_valid_ip, is_valid_domain, is_valid_url, is_valid_email, is_valid_port, is_valid_filename, validate_input, sanitize_filename
+from .validator import (is_valid_ip, is_valid_domain, is_valid_url, is_valid_email, is_valid_port, is_valid_filename,
+                        validate_input, sanitize_filename, validate_many, classify)
 from .converter import json_to_csv, csv_to_json, dict_to_txt, list_to_columns, size_to_human, timestamp_to_date
 from .timer import Timer, measure_time
+from .metrics import MetricsRegistry, configure_metrics, get_metrics, write_report
+from .progress import Progress, configure_progress, progress
+from .htmlscan import extract_assets, extract_css_urls, extract_links, URLJoiner
+from .frontier import CrawlFrontier, RobotsCache, normalize_url
+from .ratelimit import HostLimiter
+from .url_store import URLStore
+from .geoip import GeoDB, compile_csv
+from .lookup_cache import LookupCache, get_lookup_cache, configure_lookup_cache, resolve_cached
+from .whois_client import WhoisClient, get_whois_client, configure_whois, parse_whois, parse_rdap, registrable_domain
+from .result_export import ResultExporter, configure_export, get_exporter, export_result, result_rows
+from .scan_history import ScanHistory, configure_history, get_history, record_result
 
 __all__ = [
     # Multi target
     'read_targets_from_file',
     'sanitize_filename',
     'process_placeholder',
+    'iter_targets',
+    'is_multi_target',
+    'normalize_target',
+    'TargetSet',
     
     # JSON
     'save_to_json',
+    'append_to_jsonl',
     'prepare_output',
+    'configure_json',
+    'JSONWriter',
+    'JSONLWriter',
     
     # Verbose
     'Verbose',
@@ -28,6 +49,7 @@ __all__ = [
     'save_to_csv',
     'append_to_csv',
     'dict_to_csv',
+    'CSVWriter',
     
     # TXT
     'save_to_txt',
@@ -52,6 +74,8 @@ __all__ = [
     'is_valid_port',
     'is_valid_filename',
     'validate_input',
+    'validate_many',
+    'classify',
     
     # Converter
     'json_to_csv',
@@ -63,7 +87,66 @@ __all__ = [
     
     # Timer
     'Timer',
-    'measure_time'
+    'measure_time',
+    
+    # Metrics / --profile
+    'MetricsRegistry',
+    'configure_metrics',
+    'get_metrics',
+    'write_report',
+    
+    # Progress
+    'Progress',
+    'configure_progress',
+    'progress',
+    
+    # HTML scan
+    'extract_assets',
+    'extract_css_urls',
+    'extract_links',
+    'URLJoiner',
+    
+    # Crawl frontier
+    'CrawlFrontier',
+    'RobotsCache',
+    'normalize_url',
+    
+    # Rate limit
+    'HostLimiter',
+    
+    # URL store
+    'URLStore',
+    
+    # GeoIP offline
+    'GeoDB',
+    'compile_csv',
+    
+    # Lookup cache
+    'LookupCache',
+    'get_lookup_cache',
+    'configure_lookup_cache',
+    'resolve_cached',
+    
+    # WHOIS / RDAP
+    'WhoisClient',
+    'get_whois_client',
+    'configure_whois',
+    'parse_whois',
+    'parse_rdap',
+    'registrable_domain',
+    
+    # Export Parquet / SQLite
+    'ResultExporter',
+    'configure_export',
+    'get_exporter',
+    'export_result',
+    'result_rows',
+    
+    # Scan history / diff
+    'ScanHistory',
+    'configure_history',
+    'get_history',
+    'record_result'
 ]
 
 __version__ = '1.1.0'
@@ -6,6 +6,182 @@ import csv
 import os
 from datetime import datetime
 
+# Baris pertama yang dibuffer untuk menentukan kolom (union semua key)
+SAMPLE_ROWS = 1000
+
+# Buffer file output
+BUFFER_SIZE = 1024 * 1024
+
+def union_fields(rows):
+    """Gabungan key semua dict, urut sesuai kemunculan pertama"""
+    fields = {}
+    for row in rows:
+        for key in row:
+            if key not in fields:
+                fields[key] = None
+    return list(fields)
+
+def sidecar_name(filename):
+    """hasil.csv -> hasil.extra.csv (kolom yang muncul setelah schema dikunci)"""
+    base, ext = os.path.splitext(filename)
+    return f"{base}.extra{ext or '.csv'}"
+
+class CSVWriter:
+    """
+    Writer CSV streaming dengan schema stabil.
+
+    - Kolom = union key dari SAMPLE_ROWS baris pertama (atau `fieldnames`),
+      lalu dikunci dan header ditulis.
+    - Key baru setelah itu tidak merusak kolom: ditulis ke sidecar
+      <file>.extra.csv sebagai (row, field, value), row = nomor baris data.
+    - mode 'a': header file yang ada dipakai sebagai schema, baris terakhir
+      yang terpotong (crash di tengah tulis) ditutup dulu.
+
+        with CSVWriter('hasil.csv') as w:
+            for record in records:
+                w.write(record)
+    """
+
+    def __init__(self, filename, fieldnames=None, mode='w', sample=SAMPLE_ROWS,
+                 buffer_size=BUFFER_SIZE):
+        """
+        Args:
+            filename (str): File CSV
+            fieldnames (list): Kolom tetap (tanpa sampling)
+            mode (str): 'w' tulis ulang, 'a' tambah ke file yang ada
+            sample (int): Jumlah baris yang dibuffer sebelum schema dikunci
+            buffer_size (int): Buffer file output (byte)
+        """
+        self.filename = filename
+        self.sample = max(1, sample)
+        self.count = 0
+        self.extra_fields = []
+        self._fields = list(fieldnames) if fieldnames else None
+        self._pending = []
+        self._extra = None
+        self._row_offset = 0
+        self._offset_known = True
+
+        existing = None
+        if mode == 'a' and os.path.exists(filename) and os.path.getsize(filename) > 0:
+            existing = self._read_header()
+        self._file = open(filename, 'a' if existing is not None else 'w', newline='',
+                          encoding='utf-8', buffering=buffer_size)
+        self._writer = csv.writer(self._file)
+        if existing is not None:
+            self._fields = existing
+            self._fieldset = set(existing)
+            # Nomor baris di sidecar dilanjutkan; dihitung hanya kalo diperlukan
+            self._offset_known = False
+        elif self._fields:
+            self._lock_schema()
+
+    def _read_header(self):
+        """Header file yang ada + pastikan file diakhiri newline"""
+        with open(self.filename, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) not in (b'\n', b'\r'):
+                f.write(b'\r\n')
+        with open(self.filename, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None)
+        # "No data" dari save_to_csv kosong bukan header
+        if not header or header == ['No data']:
+            return None
+        return header
+
+    def _count_rows(self):
+        with open(self.filename, newline='', encoding='utf-8') as f:
+            return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+    def _lock_schema(self):
+        if not self._fields:
+            self._fields = union_fields(r for r in self._pending if isinstance(r, dict))
+        self._fieldset = set(self._fields)
+        if self._fields:
+            self._writer.writerow(self._fields)
+        pending, self._pending = self._pending, []
+        for row in pending:
+            self._write(row)
+
+    def _write_extra(self, row):
+        if not self._offset_known:
+            self._file.flush()
+            self._row_offset = self._count_rows() - self.count
+            self._offset_known = True
+        if self._extra is None:
+            name = sidecar_name(self.filename)
+            new = not os.path.exists(name) or os.path.getsize(name) == 0
+            self._extra = open(name, 'a', newline='', encoding='utf-8')
+            self._extra_writer = csv.writer(self._extra)
+            if new:
+                self._extra_writer.writerow(['row', 'field', 'value'])
+        line = self._row_offset + self.count
+        for key in row.keys() - self._fieldset:
+            if key not in self.extra_fields:
+                self.extra_fields.append(key)
+            self._extra_writer.writerow([line, key, row[key]])
+
+    def _write(self, row):
+        if isinstance(row, dict):
+            self.count += 1
+            self._writer.writerow([row.get(k, '') for k in self._fields])
+            if not row.keys() <= self._fieldset:
+                self._write_extra(row)
+        elif isinstance(row, (list, tuple)):
+            self.count += 1
+            self._writer.writerow(row)
+        else:
+            self.count += 1
+            self._writer.writerow([row])
+
+    def write(self, row):
+        if self._fields is None:
+            self._pending.append(row)
+            if len(self._pending) >= self.sample:
+                self._lock_schema()
+        else:
+            self._write(row)
+
+    def write_many(self, rows):
+        rows = iter(rows)
+        if self._fields is None:
+            for row in rows:
+                self.write(row)
+                if self._fields is not None:
+                    break
+            else:
+                return
+        fields = self._fields
+        fieldset = self._fieldset
+        writerow = self._writer.writerow
+        for row in rows:
+            # Jalur cepat untuk dict dengan key yang sudah dikenal
+            if isinstance(row, dict) and row.keys() <= fieldset:
+                self.count += 1
+                writerow([row.get(k, '') for k in fields])
+            else:
+                self._write(row)
+
+    def flush(self):
+        if self._fields is not None:
+            self._file.flush()
+            if self._extra is not None:
+                self._extra.flush()
+
+    def close(self):
+        if self._fields is None:
+            self._lock_schema()
+        self._file.close()
+        if self._extra is not None:
+            self._extra.close()
+            print(f"[*] Kolom baru {', '.join(map(str, self.extra_fields))} -> {sidecar_name(self.filename)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 def save_to_csv(data, filename, fieldnames=None):
     """
     Simpan data ke file CSV
@@ -13,37 +189,24 @@ def save_to_csv(data, filename, fieldnames=None):
     Args:
         data: list of dictionaries atau list of lists
         filename: nama file CSV
-        fieldnames: list kolom (optional)
+        fieldnames: list kolom (optional, default union key semua baris)
     
     Returns:
         bool: True jika berhasil
     """
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            # Kalo data kosong
-            if not data:
+        # Kalo data kosong
+        if not data:
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
                 f.write("No data")
-                return True
-            
-            # Kalo data berupa list of dictionaries
-            if isinstance(data[0], dict):
-                if not fieldnames:
-                    fieldnames = data[0].keys()
-                
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
-            
-            # Kalo data berupa list of lists
-            elif isinstance(data[0], (list, tuple)):
-                writer = csv.writer(f)
-                writer.writerows(data)
-            
-            # Kalo data berupa single item
-            else:
-                writer = csv.writer(f)
-                for item in data:
-                    writer.writerow([item])
+            return True
+        
+        # Kalo data berupa list of dictionaries: kolom dari semua baris, bukan cuma data[0]
+        if isinstance(data[0], dict) and not fieldnames:
+            fieldnames = union_fields(data)
+        
+        with CSVWriter(filename, fieldnames=fieldnames) as writer:
+            writer.write_many(data)
         
         print(f"[+] Data saved to {filename}")
         return True
@@ -53,15 +216,10 @@ def save_to_csv(data, filename, fieldnames=None):
         return False
 
 def append_to_csv(data, filename):
-    """Append data ke file CSV yang sudah ada"""
+    """Append data ke file CSV yang sudah ada (kolom mengikuti header file)"""
     try:
-        with open(filename, 'a', newline='', encoding='utf-8') as f:
-            if isinstance(data[0], dict):
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writerows(data)
-            else:
-                writer = csv.writer(f)
-                writer.writerows(data)
+        with CSVWriter(filename, mode='a') as writer:
+            writer.write_many(data)
         
         print(f"[+] Data appended to {filename}")
         return True
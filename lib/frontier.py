@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# OSXNT - Crawl Frontier Module
+# Antrian BFS + seen-set dengan normalisasi URL untuk crawler
+
+import threading
+from collections import deque
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """
+    Normalisasi URL untuk dedupe crawler:
+    - buang fragment (#...)
+    - scheme & host lowercase, port default (80/443) dibuang
+    - path kosong -> '/', trailing slash dibuang (kecuali root)
+    - query parameter diurutkan
+
+    Returns:
+        str: URL ternormalisasi (atau url asli kalo gagal di-parse)
+    """
+    try:
+        parts = urlsplit(url.strip())
+        # .port raise ValueError untuk port bukan angka / di luar 0-65535
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        # IPv6: hostname datang tanpa kurung siku
+        host = f"[{host}]"
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if parts.username:
+        auth = parts.username + (f":{parts.password}" if parts.password else '')
+        host = f"{auth}@{host}"
+
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/') or '/'
+
+    query = parts.query
+    if query:
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+
+    return urlunsplit((scheme, host, path, query, ''))
+
+
+class CrawlFrontier:
+    """
+    Frontier BFS untuk crawler.
+
+    deque untuk antrian (O(1) pop kiri) dan set URL ternormalisasi untuk
+    dedupe (O(1) lookup), menggantikan list.pop(0) + scan list per link.
+    URL ditandai 'seen' saat masuk antrian, jadi tiap URL di-crawl sekali.
+    """
+
+    def __init__(self, max_pages=100, max_depth=1):
+        """
+        Args:
+            max_pages (int): Budget jumlah halaman yang di-crawl (None = tanpa batas)
+            max_depth (int): Kedalaman maksimum (0 = halaman awal saja)
+        """
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.queue = deque()
+        self.seen = set()
+        # URL mentah yang sudah pernah diproses, skip normalisasi untuk link berulang
+        self._raw_seen = set()
+        self.crawled = 0
+
+    def add(self, url, depth=0):
+        """
+        Tambah URL ke antrian kalo belum pernah dilihat dan masih dalam budget depth.
+
+        Returns:
+            bool: True kalo URL masuk antrian
+        """
+        if depth > self.max_depth or url in self._raw_seen:
+            return False
+        self._raw_seen.add(url)
+        key = normalize_url(url)
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        self.queue.append((url, depth))
+        return True
+
+    def add_many(self, urls, depth):
+        """Tambah banyak URL dengan depth yang sama, kembalikan jumlah yang masuk"""
+        if depth > self.max_depth:
+            return 0
+        added = 0
+        for url in urls:
+            if self.add(url, depth):
+                added += 1
+        return added
+
+    def budget_left(self):
+        """Sisa budget halaman (None = tanpa batas)"""
+        if self.max_pages is None:
+            return None
+        return max(self.max_pages - self.crawled, 0)
+
+    def next(self):
+        """
+        Ambil URL berikutnya (BFS) dan hitung ke budget halaman.
+
+        Returns:
+            tuple: (url, depth) atau None kalo antrian habis / budget habis
+        """
+        if not self.queue or self.budget_left() == 0:
+            return None
+        self.crawled += 1
+        return self.queue.popleft()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __bool__(self):
+        return bool(self.queue) and self.budget_left() != 0
+
+
+class RobotsCache:
+    """
+    Cache robots.txt per origin (scheme://host[:port]).
+
+    fetch(url) dipanggil sekali per origin dan harus mengembalikan isi
+    robots.txt (str) atau None kalo tidak ada / gagal (dianggap allow all).
+    """
+
+    def __init__(self, fetch, user_agent='*'):
+        self.fetch = fetch
+        self.user_agent = user_agent
+        self._parsers = {}
+        self._lock = threading.Lock()
+
+    def _parser(self, url):
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            parser = self._parsers.get(origin)
+        if parser is not None:
+            return parser
+
+        text = self.fetch(origin + '/robots.txt')
+        parser = RobotFileParser()
+        parser.parse((text or '').splitlines())
+        with self._lock:
+            return self._parsers.setdefault(origin, parser)
+
+    def allowed(self, url):
+        """True kalo robots.txt mengizinkan URL di-crawl"""
+        try:
+            return self._parser(url).can_fetch(self.user_agent, url)
+        except Exception:
+            return True
+
+    def crawl_delay(self, url):
+        """Crawl-delay dari robots.txt untuk origin URL (None kalo tidak ada)"""
+        try:
+            return self._parser(url).crawl_delay(self.user_agent)
+        except Exception:
+            return None
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+# OSXNT - Offline GeoIP Module
+# Lookup GeoIP/ASN dari database lokal (MMDB atau CSV range) tanpa internet
+
+import os
+import csv
+import sys
+import mmap
+import socket
+import struct
+import ipaddress
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import chain
+
+try:
+    import maxminddb
+    HAS_MAXMINDDB = True
+except ImportError:
+    HAS_MAXMINDDB = False
+
+MAGIC = b'OSXGEO\x02\x00'
+COMPILED_EXT = '.osxgeo'
+
+# magic, byteorder, n4, n6, nrec, nstr, 11 offset section
+HEADER = struct.Struct('<8sc3xIIII11Q')
+
+# Field string per record (disimpan sebagai id ke tabel string; 0 = kosong)
+STRING_FIELDS = ('country', 'countryCode', 'regionName', 'city', 'zip',
+                 'timezone', 'isp', 'org', 'as')
+
+# Nama kolom CSV yang dikenali -> field ip-api (sama dengan output track_ip)
+COLUMN_ALIASES = {
+    'country': 'country', 'country_name': 'country', 'country_long': 'country',
+    'countrycode': 'countryCode', 'country_code': 'countryCode',
+    'country_iso_code': 'countryCode', 'country_short': 'countryCode',
+    'region': 'regionName', 'regionname': 'regionName', 'region_name': 'regionName',
+    'subdivision_1_name': 'regionName', 'state': 'regionName',
+    'city': 'city', 'city_name': 'city',
+    'zip': 'zip', 'zip_code': 'zip', 'postal_code': 'zip',
+    'lat': 'lat', 'latitude': 'lat',
+    'lon': 'lon', 'lng': 'lon', 'longitude': 'lon',
+    'timezone': 'timezone', 'time_zone': 'timezone',
+    'isp': 'isp',
+    'org': 'org', 'organization': 'org', 'as_org': 'org',
+    'autonomous_system_organization': 'org', 'as_name': 'org',
+    'as': 'as', 'asn': 'as', 'autonomous_system_number': 'as'
+}
+START_COLUMNS = ('start', 'ip_from', 'start_ip', 'range_start', 'first_ip')
+END_COLUMNS = ('end', 'ip_to', 'end_ip', 'range_end', 'last_ip')
+NETWORK_COLUMNS = ('network', 'cidr', 'prefix')
+
+# CSV tanpa header dianggap layout IP2Location LITE (DB5)
+HEADERLESS_LAYOUT = ('start', 'end', 'countryCode', 'country', 'regionName', 'city', 'lat', 'lon')
+
+_inet_aton = socket.inet_aton
+_inet_pton = socket.inet_pton
+_unpack_v4 = struct.Struct('!I').unpack
+
+NAN = float('nan')
+
+
+def ip_key(ip):
+    """
+    IP string -> (versi, key). Key IPv4 = int, key IPv6 = 16 byte big-endian.
+    IPv4-mapped IPv6 (::ffff:a.b.c.d) dianggap IPv4.
+
+    Returns:
+        tuple: (4, int) / (6, bytes), atau None kalo bukan IP
+    """
+    try:
+        if ':' not in ip:
+            if ip.count('.') != 3:
+                return None
+            return 4, _unpack_v4(_inet_aton(ip))[0]
+        packed = _inet_pton(socket.AF_INET6, ip)
+    except (OSError, TypeError):
+        return None
+    if packed[:12] == b'\x00' * 10 + b'\xff\xff':
+        return 4, _unpack_v4(packed[12:])[0]
+    return 6, packed
+
+
+def _parse_bound(value):
+    """Batas range dari CSV: integer (IP2Location) atau string IP"""
+    value = value.strip()
+    if value.isdigit():
+        number = int(value)
+        return (4, number) if number <= 0xFFFFFFFF else (6, number.to_bytes(16, 'big'))
+    return ip_key(value)
+
+
+def _normalize_as(value):
+    value = str(value).strip()
+    if value.isdigit():
+        return f"AS{value}"
+    return value
+
+
+def compile_csv(csv_path, out_path=None, verbose=False):
+    """
+    Compile CSV range IP ke file biner .osxgeo (array range terurut).
+
+    Kolom range: start/end (int atau IP) atau network (CIDR).
+    Kolom lain dipetakan lewat COLUMN_ALIASES ke field ip-api.
+
+    Args:
+        csv_path (str): File CSV
+        out_path (str): File output (default: csv_path + .osxgeo)
+
+    Returns:
+        str: Path file compiled (None kalo gagal)
+    """
+    out_path = out_path or csv_path + COMPILED_EXT
+    v4, v6 = [], []
+    records = []
+    record_ids = {}
+
+    try:
+        with open(csv_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            reader = csv.reader(f)
+            first = next(reader, None)
+            if first is None:
+                print(f"[!] CSV kosong: {csv_path}")
+                return None
+
+            lowered = [c.strip().lower() for c in first]
+            if _parse_bound(first[0]) is None and '/' not in first[0]:
+                columns = lowered
+                rows = reader
+            else:
+                # Tanpa header: baris pertama juga data
+                columns = [c.lower() for c in HEADERLESS_LAYOUT]
+                rows = chain([first], reader)
+
+            net_col = next((columns.index(c) for c in NETWORK_COLUMNS if c in columns), None)
+            start_col = next((columns.index(c) for c in START_COLUMNS if c in columns), None)
+            end_col = next((columns.index(c) for c in END_COLUMNS if c in columns), None)
+            if net_col is None and (start_col is None or end_col is None):
+                print(f"[!] CSV tidak punya kolom range (network / start,end): {csv_path}")
+                return None
+            fields = [(i, COLUMN_ALIASES[c]) for i, c in enumerate(columns) if c in COLUMN_ALIASES]
+
+            for row in rows:
+                try:
+                    if net_col is not None:
+                        net = ipaddress.ip_network(row[net_col].strip(), strict=False)
+                        version = net.version
+                        if version == 4:
+                            start, end = int(net.network_address), int(net.broadcast_address)
+                        else:
+                            start, end = net.network_address.packed, net.broadcast_address.packed
+                    else:
+                        first_key = _parse_bound(row[start_col])
+                        last_key = _parse_bound(row[end_col])
+                        if first_key is None or last_key is None or first_key[0] != last_key[0]:
+                            continue
+                        version, start, end = first_key[0], first_key[1], last_key[1]
+                except (ValueError, IndexError):
+                    continue
+
+                rec = {}
+                for i, name in fields:
+                    if i < len(row) and row[i].strip() not in ('', '-'):
+                        rec[name] = row[i].strip()
+                if 'as' in rec:
+                    rec['as'] = _normalize_as(rec['as'])
+                    if 'org' in rec and rec['as'].startswith('AS') and ' ' not in rec['as']:
+                        rec['as'] += f" {rec['org']}"
+                coords = []
+                for name in ('lat', 'lon'):
+                    try:
+                        coords.append(float(rec.get(name, 'nan')))
+                    except ValueError:
+                        coords.append(NAN)
+
+                # Record identik (banyak range satu kota) disimpan sekali
+                key = tuple(rec.get(name, '') for name in STRING_FIELDS) + tuple(coords)
+                rec_id = record_ids.get(key)
+                if rec_id is None:
+                    rec_id = len(records)
+                    records.append(key)
+                    record_ids[key] = rec_id
+
+                (v4 if version == 4 else v6).append((start, end, rec_id))
+    except OSError as e:
+        print(f"[!] Gagal membaca CSV: {e}")
+        return None
+
+    v4.sort()
+    v6.sort()
+    _write_compiled(out_path, v4, v6, records)
+    if verbose:
+        print(f"[+] Compiled {len(v4)} IPv4 + {len(v6)} IPv6 range, "
+              f"{len(records)} record -> {out_path}")
+    return out_path
+
+
+def _align(f):
+    pad = (-f.tell()) % 8
+    if pad:
+        f.write(b'\x00' * pad)
+    return f.tell()
+
+
+def _write_compiled(out_path, v4, v6, records):
+    """Tulis file .osxgeo (atomic lewat file .tmp)"""
+    # Tabel string bersama untuk semua field (id 0 = kosong)
+    strings = ['']
+    string_ids = {'': 0}
+    fields = array('I')
+    lats = array('d')
+    lons = array('d')
+    nfields = len(STRING_FIELDS)
+    for rec in records:
+        for value in rec[:nfields]:
+            sid = string_ids.get(value)
+            if sid is None:
+                sid = len(strings)
+                strings.append(value)
+                string_ids[value] = sid
+            fields.append(sid)
+        lats.append(rec[nfields])
+        lons.append(rec[nfields + 1])
+
+    tmp = out_path + '.tmp'
+    offsets = []
+    with open(tmp, 'wb') as f:
+        f.write(b'\x00' * HEADER.size)
+
+        offsets.append(_align(f))
+        array('I', (r[0] for r in v4)).tofile(f)
+        offsets.append(_align(f))
+        array('I', (r[1] for r in v4)).tofile(f)
+        offsets.append(_align(f))
+        array('I', (r[2] for r in v4)).tofile(f)
+
+        offsets.append(_align(f))
+        f.write(b''.join(r[0] for r in v6))
+        offsets.append(_align(f))
+        f.write(b''.join(r[1] for r in v6))
+        offsets.append(_align(f))
+        array('I', (r[2] for r in v6)).tofile(f)
+
+        offsets.append(_align(f))
+        fields.tofile(f)
+        offsets.append(_align(f))
+        lats.tofile(f)
+        offsets.append(_align(f))
+        lons.tofile(f)
+
+        encoded = [value.encode('utf-8') for value in strings]
+        str_offsets = array('I', [0])
+        for blob in encoded:
+            str_offsets.append(str_offsets[-1] + len(blob))
+        offsets.append(_align(f))
+        str_offsets.tofile(f)
+        offsets.append(_align(f))
+        f.write(b''.join(encoded))
+
+        f.seek(0)
+        byteorder = b'l' if sys.byteorder == 'little' else b'b'
+        f.write(HEADER.pack(MAGIC, byteorder, len(v4), len(v6), len(records), len(strings), *offsets))
+    os.replace(tmp, out_path)
+
+
+class _Keys16:
+    """Sequence key IPv6 (16 byte) di atas mmap, untuk bisect"""
+
+    __slots__ = ('buf', 'offset', 'count')
+
+    def __init__(self, buf, offset, count):
+        self.buf = buf
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        start = self.offset + i * 16
+        return self.buf[start:start + 16]
+
+
+class RangeDB:
+    """
+    Database range .osxgeo yang di-mmap: buka instan, lookup binary search.
+    Record disimpan kolumnar (id string + lat/lon), string di-decode saat dipakai.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, byteorder, self.n4, self.n6, self.nrec, self.nstr,
+         o4s, o4e, o4r, o6s, o6e, o6r, ofields, olat, olon, ostr, oblob) = HEADER.unpack_from(self._mm, 0)
+        native = b'l' if sys.byteorder == 'little' else b'b'
+        if magic != MAGIC or byteorder != native:
+            self.close()
+            raise ValueError(f"Format .osxgeo tidak cocok (compile ulang): {path}")
+
+        nfields = len(STRING_FIELDS)
+        view = memoryview(self._mm)
+        self._v4_starts = view[o4s:o4s + 4 * self.n4].cast('I')
+        self._v4_ends = view[o4e:o4e + 4 * self.n4].cast('I')
+        self._v4_recs = view[o4r:o4r + 4 * self.n4].cast('I')
+        self._v6_starts = _Keys16(self._mm, o6s, self.n6)
+        self._v6_ends = _Keys16(self._mm, o6e, self.n6)
+        self._v6_recs = view[o6r:o6r + 4 * self.n6].cast('I')
+        self._fields = view[ofields:ofields + 4 * nfields * self.nrec].cast('I')
+        self._lats = view[olat:olat + 8 * self.nrec].cast('d')
+        self._lons = view[olon:olon + 8 * self.nrec].cast('d')
+        self._str_offsets = view[ostr:ostr + 4 * (self.nstr + 1)].cast('I')
+        self._blob = oblob
+        self._views = (self._v4_starts, self._v4_ends, self._v4_recs, self._v6_recs,
+                       self._fields, self._lats, self._lons, self._str_offsets, view)
+        self._string = lru_cache(maxsize=65536)(self._decode_string)
+
+    def _decode_string(self, sid):
+        start = self._blob + self._str_offsets[sid]
+        end = self._blob + self._str_offsets[sid + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def record(self, rec_id):
+        """Record ke dict field ip-api (field kosong tidak disertakan)"""
+        base = rec_id * len(STRING_FIELDS)
+        fields = self._fields
+        string = self._string
+        rec = {}
+        for j, name in enumerate(STRING_FIELDS):
+            sid = fields[base + j]
+            if sid:
+                rec[name] = string(sid)
+        lat = self._lats[rec_id]
+        if lat == lat:
+            rec['lat'] = lat
+            rec['lon'] = self._lons[rec_id]
+        return rec
+
+    def lookup_key(self, version, key):
+        """Lookup dari hasil ip_key(), kembalikan dict field atau None"""
+        if version == 4:
+            i = bisect_right(self._v4_starts, key) - 1
+            if i >= 0 and key <= self._v4_ends[i]:
+                return self.record(self._v4_recs[i])
+        else:
+            i = bisect_right(self._v6_starts, key) - 1
+            if i >= 0 and key <= self._v6_ends[i]:
+                return self.record(self._v6_recs[i])
+        return None
+
+    def lookup(self, ip):
+        key = ip_key(ip)
+        if key is None:
+            return None
+        return self.lookup_key(*key)
+
+    def close(self):
+        for view in getattr(self, '_views', ()):
+            view.release()
+        self._views = ()
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+class MMDBReader:
+    """Wrapper maxminddb (GeoLite2 City/Country/ASN) -> field ip-api"""
+
+    def __init__(self, path):
+        if not HAS_MAXMINDDB:
+            raise ImportError("Database .mmdb butuh paket maxminddb (pip install maxminddb)")
+        self.path = path
+        self._reader = maxminddb.open_database(path)
+
+    @staticmethod
+    def _name(node):
+        if not node:
+            return None
+        names = node.get('names') or {}
+        return names.get('en') or next(iter(names.values()), None)
+
+    def lookup(self, ip):
+        try:
+            data = self._reader.get(ip)
+        except ValueError:
+            return None
+        if not data:
+            return None
+
+        rec = {}
+        country = data.get('country') or data.get('registered_country')
+        if country:
+            rec['country'] = self._name(country)
+            rec['countryCode'] = country.get('iso_code')
+        subdivisions = data.get('subdivisions')
+        if subdivisions:
+            rec['regionName'] = self._name(subdivisions[0])
+        if data.get('city'):
+            rec['city'] = self._name(data['city'])
+        if data.get('postal'):
+            rec['zip'] = data['postal'].get('code')
+        location = data.get('location') or {}
+        if 'latitude' in location:
+            rec['lat'] = location['latitude']
+            rec['lon'] = location.get('longitude')
+        if location.get('time_zone'):
+            rec['timezone'] = location['time_zone']
+        if data.get('autonomous_system_number'):
+            rec['as'] = f"AS{data['autonomous_system_number']}"
+            org = data.get('autonomous_system_organization')
+            if org:
+                rec['as'] += f" {org}"
+                rec['org'] = org
+        if data.get('isp'):
+            rec['isp'] = data['isp']
+        return {k: v for k, v in rec.items() if v is not None}
+
+    def close(self):
+        self._reader.close()
+
+
+class GeoDB:
+    """
+    Lookup GeoIP offline dari satu atau lebih database lokal.
+
+    - .mmdb   : lewat maxminddb (kalo terinstall)
+    - .csv    : di-compile sekali ke .osxgeo (di-compile ulang kalo CSV lebih baru)
+    - .osxgeo : langsung di-mmap
+
+    Beberapa database digabung (misal GeoLite2-City + GeoLite2-ASN);
+    field dari database pertama yang punya nilai menang.
+    """
+
+    def __init__(self, paths, verbose=False):
+        """
+        Args:
+            paths (str|list): Path database (string dipisah koma atau list)
+            verbose (bool): Mode verbose
+        """
+        if isinstance(paths, str):
+            paths = [p.strip() for p in paths.split(',') if p.strip()]
+        self.verbose = verbose
+        self.readers = [self._open(p) for p in paths]
+
+    def _open(self, path):
+        lower = path.lower()
+        if lower.endswith('.mmdb'):
+            return MMDBReader(path)
+        if lower.endswith(COMPILED_EXT):
+            return RangeDB(path)
+
+        compiled = path + COMPILED_EXT
+        stale = (not os.path.exists(compiled) or
+                 os.path.getmtime(compiled) < os.path.getmtime(path))
+        if not stale:
+            try:
+                return RangeDB(compiled)
+            except ValueError:
+                stale = True
+        if self.verbose:
+            print(f"[*] Compiling {path} -> {compiled}")
+        if compile_csv(path, compiled, self.verbose) is None:
+            raise ValueError(f"Gagal compile database: {path}")
+        return RangeDB(compiled)
+
+    def lookup(self, ip):
+        """
+        Lookup satu IP.
+
+        Returns:
+            dict: Record format ip-api (status, query, country, ...);
+                  status 'fail' kalo tidak ditemukan
+        """
+        result = {}
+        for reader in self.readers:
+            rec = reader.lookup(ip)
+            if rec:
+                for key, value in rec.items():
+                    result.setdefault(key, value)
+        if not result:
+            return {'status': 'fail', 'message': 'not found in geo-db', 'query': ip}
+        record = {'status': 'success', 'query': ip}
+        record.update(result)
+        record['source'] = 'geo-db'
+        return record
+
+    def lookup_many(self, ips):
+        return [self.lookup(ip) for ip in ips]
+
+    def close(self):
+        for reader in self.readers:
+            reader.close()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# OSXNT - HTML Scanner Module
+# Single-pass tokenizer untuk ekstrak resource dari HTML dan CSS
+
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit, urldefrag
+
+# lxml opsional: parser C, jauh lebih cepat untuk halaman multi-MB
+try:
+    import lxml.html as _lxml_html
+    HAS_LXML = True
+except ImportError:
+    _lxml_html = None
+    HAS_LXML = False
+
+# url(...) dan @import di CSS (termasuk inline <style> dan atribut style="")
+CSS_IMPORT_RE = re.compile(r'@import\s+(?:url\(\s*)?["\']?([^"\')\s;]+)["\']?\s*\)?', re.IGNORECASE)
+CSS_URL_RE = re.compile(r'url\(\s*["\']?([^"\')]+?)["\']?\s*\)', re.IGNORECASE)
+
+SKIP_SCHEMES = ('data:', 'javascript:', 'about:', 'blob:', 'mailto:', 'tel:', '#')
+
+FONT_EXT = ('.woff', '.woff2', '.ttf', '.otf', '.eot')
+IMAGE_EXT = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.avif', '.ico', '.bmp')
+MEDIA_EXT = ('.mp4', '.webm', '.ogg', '.mp3', '.wav', '.m4a')
+
+# <link rel=preload as=...> -> kind
+PRELOAD_AS = {
+    'style': 'css',
+    'script': 'js',
+    'font': 'font',
+    'image': 'img',
+    'audio': 'media',
+    'video': 'media'
+}
+
+
+def guess_kind(url, default='other'):
+    """Tebak tipe resource dari ekstensi path"""
+    path = url.split('?', 1)[0].split('#', 1)[0].lower()
+    if path.endswith('.css'):
+        return 'css'
+    if path.endswith(('.js', '.mjs')):
+        return 'js'
+    if path.endswith(FONT_EXT):
+        return 'font'
+    if path.endswith(IMAGE_EXT):
+        return 'img'
+    if path.endswith(MEDIA_EXT):
+        return 'media'
+    return default
+
+
+def _usable(ref):
+    """Skip referensi kosong / data URI / javascript: dll"""
+    return bool(ref) and not ref.lower().startswith(SKIP_SCHEMES)
+
+
+def _parse_srcset(value):
+    """Ambil URL dari atribut srcset ("a.png 1x, b.png 2x")"""
+    urls = []
+    for candidate in value.split(','):
+        parts = candidate.strip().split()
+        if parts:
+            urls.append(parts[0])
+    return urls
+
+
+class URLJoiner:
+    """
+    urljoin dengan fast path untuk bentuk referensi yang umum
+    (absolute, //host, /path, relative sederhana). Bentuk lain (../, ./, ?q)
+    tetap lewat urllib.parse.urljoin. Fragment (#...) selalu dibuang.
+    """
+
+    def __init__(self, base_url):
+        self.set_base(base_url)
+
+    def set_base(self, base_url):
+        self.base = base_url
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.dir = self.origin + parts.path[:parts.path.rfind('/') + 1] if '/' in parts.path else self.origin + '/'
+
+    def join(self, ref):
+        if '#' in ref:
+            ref = ref.split('#', 1)[0]
+        if '/.' not in ref:
+            if ref.startswith(('http://', 'https://')):
+                return ref
+            if ref.startswith('//'):
+                return f"{self.scheme}:{ref}"
+            first = ref[:1]
+            if first == '/':
+                return self.origin + ref
+            if first and first not in '.?' and ':' not in ref.split('/', 1)[0]:
+                return self.dir + ref
+        return urldefrag(urljoin(self.base, ref))[0]
+
+
+def extract_css_urls(css_text, base_url):
+    """
+    Ekstrak URL dari CSS (@import dan url()).
+
+    Args:
+        css_text (str): Isi CSS
+        base_url (str|URLJoiner): URL file CSS (relative URL di-resolve terhadap ini)
+
+    Returns:
+        list: List of (url, kind); @import selalu kind 'css'
+    """
+    joiner = base_url if isinstance(base_url, URLJoiner) else URLJoiner(base_url)
+    found = []
+    imports = set()
+    for ref in CSS_IMPORT_RE.findall(css_text):
+        ref = ref.strip()
+        if _usable(ref):
+            url = joiner.join(ref)
+            imports.add(url)
+            found.append((url, 'css'))
+    for ref in CSS_URL_RE.findall(css_text):
+        ref = ref.strip()
+        if _usable(ref):
+            url = joiner.join(ref)
+            if url not in imports:
+                found.append((url, guess_kind(url)))
+    return found
+
+
+class AssetParser(HTMLParser):
+    """
+    Tokenizer HTML satu kali jalan untuk mengumpulkan semua asset halaman:
+    stylesheet, script, gambar (src/srcset/poster), font & preload link,
+    media, plus url()/@import dari <style> inline dan atribut style="".
+    """
+
+    def __init__(self, base_url):
+        super().__init__(convert_charrefs=True)
+        self.joiner = URLJoiner(base_url)
+        self.assets = []
+        self._seen = set()
+        self._in_style = False
+        self._style_buf = []
+
+    def _add(self, ref, kind):
+        if not ref:
+            return
+        ref = ref.strip()
+        if not _usable(ref):
+            return
+        url = self.joiner.join(ref)
+        if url not in self._seen:
+            self._seen.add(url)
+            self.assets.append((url, kind))
+
+    def _add_css(self, css_text):
+        for url, kind in extract_css_urls(css_text, self.joiner):
+            if url not in self._seen:
+                self._seen.add(url)
+                self.assets.append((url, kind))
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+
+        if tag == 'base' and a.get('href'):
+            self.joiner.set_base(self.joiner.join(a['href'].strip()))
+
+        elif tag == 'link' and a.get('href'):
+            rel = (a.get('rel') or '').lower().split()
+            href = a['href']
+            if 'stylesheet' in rel:
+                self._add(href, 'css')
+            elif 'preload' in rel or 'prefetch' in rel:
+                kind = PRELOAD_AS.get((a.get('as') or '').lower())
+                self._add(href, kind or guess_kind(href))
+            elif 'modulepreload' in rel:
+                self._add(href, 'js')
+            elif 'icon' in rel or 'apple-touch-icon' in rel or 'shortcut' in rel:
+                self._add(href, 'img')
+
+        elif tag == 'script' and a.get('src'):
+            self._add(a['src'], 'js')
+
+        elif tag in ('img', 'source') or (tag == 'input' and (a.get('type') or '').lower() == 'image'):
+            src = a.get('src')
+            if src:
+                default = 'media' if tag == 'source' else 'img'
+                self._add(src, guess_kind(src, default))
+            if a.get('srcset'):
+                for ref in _parse_srcset(a['srcset']):
+                    self._add(ref, 'img')
+
+        elif tag in ('video', 'audio'):
+            if a.get('src'):
+                self._add(a['src'], 'media')
+            if a.get('poster'):
+                self._add(a['poster'], 'img')
+
+        elif tag == 'style':
+            self._in_style = True
+            self._style_buf = []
+
+        if a.get('style') and 'url(' in a['style']:
+            self._add_css(a['style'])
+
+    def handle_endtag(self, tag):
+        if tag == 'style' and self._in_style:
+            self._in_style = False
+            self._add_css(''.join(self._style_buf))
+            self._style_buf = []
+
+    def handle_data(self, data):
+        if self._in_style:
+            self._style_buf.append(data)
+
+
+def extract_assets(html_text, base_url):
+    """
+    Ekstrak semua asset dari HTML dalam satu parse.
+
+    Args:
+        html_text (str): Isi HTML
+        base_url (str): URL halaman
+
+    Returns:
+        list: List of (url, kind) unik, urutan sesuai kemunculan.
+              kind: css, js, img, font, media, other
+    """
+    parser = AssetParser(base_url)
+    try:
+        parser.feed(html_text)
+        parser.close()
+    except Exception:
+        # HTMLParser toleran, tapi jangan sampai buang hasil parsial
+        pass
+    return parser.assets
+
+
+# Atribut URL per tag untuk ekstraksi link (tag -> (atribut, type record))
+LINK_TAGS = {
+    'a': ('href', 'a'),
+    'link': ('href', 'link'),
+    'script': ('src', 'script'),
+    'img': ('src', 'image'),
+    'iframe': ('src', 'iframe'),
+    'form': ('action', 'form')
+}
+
+
+def _link_record(kind, url, attrs):
+    """Bentuk record sama dengan URLExtractor._extract_from_page versi lama"""
+    record = {'url': url, 'type': kind}
+    if kind == 'link':
+        rel = (attrs.get('rel') or '').split()
+        record['rel'] = rel[0] if rel else ''
+    elif kind == 'image':
+        record['alt'] = (attrs.get('alt') or '')[:50]
+    elif kind == 'form':
+        record['method'] = attrs.get('method') or 'get'
+    return record
+
+
+class LinkParser(HTMLParser):
+    """
+    Tokenizer satu kali jalan untuk link halaman: <a>, <link>, <script src>,
+    <img src>, <iframe src>, <form action>. <base href> dihormati.
+    Teks <a> dikumpulkan sampai </a> (maks 100 karakter).
+    """
+
+    def __init__(self, base_url):
+        super().__init__(convert_charrefs=True)
+        self.joiner = URLJoiner(base_url)
+        self.links = []
+        self._anchor = None
+        self._anchor_text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'base':
+            a = dict(attrs)
+            if a.get('href'):
+                self.joiner.set_base(self.joiner.join(a['href'].strip()))
+            return
+
+        spec = LINK_TAGS.get(tag)
+        if spec is None:
+            return
+        a = dict(attrs)
+        ref = (a.get(spec[0]) or '').strip()
+        if not ref:
+            return
+
+        record = _link_record(spec[1], self.joiner.join(ref), a)
+        self.links.append(record)
+        if tag == 'a':
+            self._close_anchor()
+            self._anchor = record
+            self._anchor_text = []
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag == 'a':
+            self._close_anchor()
+
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            self._close_anchor()
+
+    def handle_data(self, data):
+        if self._anchor is not None and sum(map(len, self._anchor_text)) < 200:
+            self._anchor_text.append(data)
+
+    def _close_anchor(self):
+        if self._anchor is not None:
+            self._anchor['text'] = ' '.join(''.join(self._anchor_text).split())[:100]
+            self._anchor = None
+            self._anchor_text = []
+
+    def close(self):
+        super().close()
+        self._close_anchor()
+
+
+def _extract_links_lxml(html_text, base_url):
+    """Backend lxml: satu traversal tree C dalam urutan dokumen"""
+    joiner = URLJoiner(base_url)
+    links = []
+    doc = _lxml_html.fromstring(html_text)
+    for el in doc.iter('base', *LINK_TAGS):
+        attrs = el.attrib
+        if el.tag == 'base':
+            if attrs.get('href'):
+                joiner.set_base(joiner.join(attrs['href'].strip()))
+            continue
+        attr, kind = LINK_TAGS[el.tag]
+        ref = (attrs.get(attr) or '').strip()
+        if not ref:
+            continue
+        record = _link_record(kind, joiner.join(ref), attrs)
+        if kind == 'a':
+            record['text'] = ' '.join(el.text_content().split())[:100]
+        links.append(record)
+    return links
+
+
+def extract_links(html_text, base_url, backend='auto'):
+    """
+    Ekstrak semua link halaman dalam satu traversal.
+
+    Args:
+        html_text (str): Isi HTML
+        base_url (str): URL halaman
+        backend (str): 'auto' (lxml kalo terinstall), 'lxml', atau 'html.parser'
+
+    Returns:
+        list: List of dict {'url', 'type', ...} (a: text, link: rel,
+              image: alt, form: method)
+    """
+    if backend == 'lxml' or (backend == 'auto' and HAS_LXML):
+        if not HAS_LXML:
+            raise ImportError("lxml tidak terinstall (pip install lxml)")
+        if html_text.strip():
+            try:
+                return _extract_links_lxml(html_text, base_url)
+            except (ValueError, TypeError):
+                # Dokumen dengan deklarasi encoding di str, dll -> fallback
+                pass
+
+    parser = LinkParser(base_url)
+    try:
+        parser.feed(html_text)
+        parser.close()
+    except Exception:
+        pass
+    return parser.links
@@ -0,0 +1,46 @@
+# lib/http/__init__.py
+# OSXNT - Shared HTTP Client Module
+
+from .retry import JitterRetry, make_retry, backoff_delay, parse_retry_after, RETRY_STATUS
+from .metrics import HTTPMetrics
+from .client import (
+    HTTPClient,
+    TimedAdapter,
+    create_session,
+    get_client,
+    configure,
+    HAS_HTTP2,
+    DEFAULT_UA,
+    DEFAULT_TIMEOUT,
+    DEFAULT_CACHE_DIR
+)
+from .cache import ResponseCache, CachingAdapter
+
+__all__ = [
+    # Client
+    'HTTPClient',
+    'TimedAdapter',
+    'create_session',
+    'get_client',
+    'configure',
+    'HAS_HTTP2',
+    'DEFAULT_UA',
+    'DEFAULT_TIMEOUT',
+    'DEFAULT_CACHE_DIR',
+    
+    # Cache
+    'ResponseCache',
+    'CachingAdapter',
+    
+    # Retry
+    'JitterRetry',
+    'make_retry',
+    'backoff_delay',
+    'parse_retry_after',
+    'RETRY_STATUS',
+    
+    # Metrics
+    'HTTPMetrics'
+]
+
+__version__ = '1.0.0'
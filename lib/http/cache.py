@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# OSXNT - HTTP Response Cache Module
+# Cache response di disk (SQLite): TTL, LRU berdasarkan ukuran, revalidasi, mode offline
+
+import io
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.structures import CaseInsensitiveDict
+from urllib3.response import HTTPResponse
+from .client import TimedAdapter
+
+CACHE_NAME = 'http_cache.sqlite3'
+
+# Method yang di-cache
+CACHE_METHODS = ('GET', 'HEAD')
+
+# Status yang boleh di-cache tanpa header eksplisit (RFC 9111 heuristic)
+CACHEABLE_STATUS = {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+
+# Header yang tidak ikut disimpan (body disimpan sudah ter-decode)
+DROP_HEADERS = {'content-encoding', 'transfer-encoding', 'connection', 'keep-alive', 'content-length'}
+
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    body BLOB,
+    size INTEGER NOT NULL,
+    stored REAL NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed);
+CREATE TABLE IF NOT EXISTS vary (
+    resource TEXT PRIMARY KEY,
+    names TEXT NOT NULL
+);
+"""
+
+
+def _max_age(headers):
+    """
+    Baca Cache-Control.
+
+    Returns:
+        tuple: (store_allowed, max_age atau None)
+    """
+    value = headers.get('Cache-Control', '')
+    if not value:
+        return True, None
+    max_age = None
+    for part in value.lower().split(','):
+        part = part.strip()
+        if part in ('no-store', 'private'):
+            return False, None
+        if part == 'no-cache':
+            max_age = 0
+        elif part.startswith(('s-maxage=', 'max-age=')) and max_age is None:
+            try:
+                max_age = max(0, int(part.split('=', 1)[1].strip('"')))
+            except ValueError:
+                pass
+    return True, max_age
+
+
+class ResponseCache:
+    """
+    Cache response HTTP di SQLite.
+
+    - key = method + URL + nilai header request yang disebut di Vary
+    - expiry dari Cache-Control max-age, default `ttl`
+    - total ukuran dibatasi `max_size`, yang paling lama tidak diakses dibuang dulu
+    - entry kadaluarsa tetap disimpan untuk revalidasi (ETag / Last-Modified)
+    """
+
+    def __init__(self, cache_dir, ttl=3600, max_size=256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir (str): Folder cache
+            ttl (int): Umur default response (detik)
+            max_size (int): Batas total ukuran cache (byte)
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CACHE_NAME)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(SCHEMA)
+        self._total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        self.stats = {'hits': 0, 'stale': 0, 'misses': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+
+    # ---------- key ----------
+
+    @staticmethod
+    def _resource(method, url):
+        return f"{method} {url}"
+
+    def _vary_names(self, method, url):
+        row = self._db.execute('SELECT names FROM vary WHERE resource = ?',
+                               (self._resource(method, url),)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    @staticmethod
+    def _key(method, url, names, headers):
+        parts = [method, url]
+        for name in names:
+            parts.append(f"{name}:{headers.get(name, '')}")
+        return hashlib.sha256('\n'.join(parts).encode('utf-8', 'surrogatepass')).hexdigest()
+
+    # ---------- baca ----------
+
+    def lookup(self, method, url, headers):
+        """
+        Cari response yang cocok.
+
+        Returns:
+            dict: {status, reason, headers, body, expires, key} atau None
+        """
+        with self._lock:
+            names = self._vary_names(method, url)
+            key = self._key(method, url, names, headers)
+            row = self._db.execute(
+                'SELECT status, reason, headers, body, expires FROM responses WHERE key = ?',
+                (key,)).fetchone()
+            if row is None and method == 'HEAD':
+                # HEAD bisa dijawab dari GET yang sudah di-cache
+                names = self._vary_names('GET', url)
+                key = self._key('GET', url, names, headers)
+                row = self._db.execute(
+                    'SELECT status, reason, headers, body, expires FROM responses WHERE key = ?',
+                    (key,)).fetchone()
+                if row is not None:
+                    row = (row[0], row[1], row[2], b'', row[4])
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (time.time(), key))
+
+        return {
+            'key': key,
+            'status': row[0],
+            'reason': row[1],
+            'headers': CaseInsensitiveDict(json.loads(row[2])),
+            'body': row[3] or b'',
+            'expires': row[4]
+        }
+
+    # ---------- tulis ----------
+
+    def store(self, method, url, request_headers, status, reason, headers, body):
+        """
+        Simpan response (kalo boleh di-cache).
+
+        Returns:
+            bool: True jika disimpan
+        """
+        allowed, max_age = _max_age(headers)
+        vary = headers.get('Vary', '')
+        if not allowed or status not in CACHEABLE_STATUS or vary.strip() == '*':
+            return False
+
+        names = sorted({n.strip().lower() for n in vary.split(',') if n.strip()})
+        kept = {k: v for k, v in headers.items() if k.lower() not in DROP_HEADERS}
+        headers_json = json.dumps(kept)
+        body = body or b''
+        size = len(body) + len(headers_json) + len(url)
+        if size > self.max_size:
+            return False
+
+        now = time.time()
+        expires = now + (self.ttl if max_age is None else max_age)
+        with self._lock:
+            key = self._key(method, url, names, request_headers)
+            old = self._db.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._db.execute('BEGIN')
+            self._db.execute('INSERT OR REPLACE INTO vary (resource, names) VALUES (?, ?)',
+                             (self._resource(method, url), json.dumps(names)))
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, method, url, status, reason, headers, body, size, stored, expires, accessed) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, method, url, status, reason, headers_json, sqlite3.Binary(body),
+                 size, now, expires, now))
+            self._db.execute('COMMIT')
+            self._total += size - (old[0] if old else 0)
+            self.stats['stored'] += 1
+            if self._total > self.max_size:
+                self._evict()
+        return True
+
+    def refresh(self, key, headers):
+        """Revalidasi sukses (304): perpanjang umur + update header"""
+        allowed, max_age = _max_age(headers)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT headers FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return
+            merged = json.loads(row[0])
+            for k, v in headers.items():
+                if k.lower() not in DROP_HEADERS:
+                    merged[k] = v
+            expires = now + (self.ttl if max_age is None else max_age)
+            self._db.execute('UPDATE responses SET headers = ?, expires = ?, accessed = ? WHERE key = ?',
+                             (json.dumps(merged), expires, now, key))
+            self.stats['revalidated'] += 1
+
+    def _evict(self):
+        """Buang entry LRU sampai total <= 90% max_size (dipanggil dengan lock)"""
+        target = self.max_size * 0.9
+        self._db.execute('BEGIN')
+        while self._total > target:
+            rows = self._db.execute(
+                'SELECT key, size FROM responses ORDER BY accessed LIMIT 64').fetchall()
+            if not rows:
+                self._total = 0
+                break
+            for key, size in rows:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._total -= size
+                self.stats['evicted'] += 1
+                if self._total <= target:
+                    break
+        self._db.execute('COMMIT')
+
+    def clear(self):
+        """Hapus semua isi cache"""
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._db.execute('DELETE FROM vary')
+            self._total = 0
+
+    def size(self):
+        """Total ukuran cache (byte)"""
+        return self._total
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class CachingAdapter(TimedAdapter):
+    """
+    TimedAdapter dengan ResponseCache di depannya.
+
+    - fresh hit: dijawab dari cache tanpa request
+    - stale hit: revalidasi pakai ETag / Last-Modified, 304 -> body dari cache
+    - offline: hanya dari cache (fresh atau stale), miss -> ConnectionError
+    - request yang sudah membawa If-None-Match / If-Modified-Since (misal
+      manifest webcode) dilewatkan apa adanya supaya caller tetap dapat 304
+    """
+
+    def __init__(self, cache, offline=False, metrics=None, **kwargs):
+        self.cache = cache
+        self.offline = offline
+        super().__init__(metrics, **kwargs)
+
+    def _from_cache(self, request, entry):
+        raw = HTTPResponse(body=io.BytesIO(entry['body']), headers=entry['headers'],
+                           status=entry['status'], reason=entry['reason'],
+                           preload_content=False, decode_content=False)
+        response = self.build_response(request, raw)
+        response.from_cache = True
+        return response
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method not in CACHE_METHODS:
+            if self.offline:
+                raise RequestsConnectionError(f"Offline: {request.method} {request.url} tidak di-cache",
+                                              request=request)
+            return super().send(request, stream=stream, **kwargs)
+
+        conditional = any(h in request.headers for h in CONDITIONAL_HEADERS)
+        if conditional and not self.offline:
+            return super().send(request, stream=stream, **kwargs)
+
+        entry = self.cache.lookup(request.method, request.url, request.headers)
+        if entry is not None:
+            if self.offline or entry['expires'] > time.time():
+                self.cache.stats['hits'] += 1
+                return self._from_cache(request, entry)
+
+            # Stale: revalidasi kalo ada validator
+            self.cache.stats['stale'] += 1
+            etag = entry['headers'].get('ETag')
+            last_modified = entry['headers'].get('Last-Modified')
+            if etag:
+                request.headers['If-None-Match'] = etag
+            if last_modified:
+                request.headers['If-Modified-Since'] = last_modified
+        elif self.offline:
+            raise RequestsConnectionError(f"Offline: {request.url} tidak ada di cache", request=request)
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            response.close()
+            self.cache.refresh(entry['key'], response.headers)
+            return self._from_cache(request, entry)
+
+        # stream=True (download besar / cek status) tidak di-cache: body tidak dibaca
+        if not stream:
+            self.cache.store(request.method, request.url, request.headers,
+                             response.status_code, response.reason,
+                             response.headers, response.content)
+        return response
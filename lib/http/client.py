@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# OSXNT - Shared HTTP Client Module
+# Satu Session bersama untuk semua modul: pool koneksi, retry, HTTP/2, metrics
+
+import time
+import threading
+import importlib.util
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from lib.verbose import Verbose
+from .retry import make_retry, backoff_delay, parse_retry_after, RETRY_STATUS
+from .metrics import HTTPMetrics
+
+try:
+    import httpx
+    # httpx butuh h2 untuk http2=True; cukup dicek ada, tidak perlu di-import
+    HAS_HTTP2 = importlib.util.find_spec('h2') is not None
+except ImportError:
+    HAS_HTTP2 = False
+
+DEFAULT_UA = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# (connect, read) dalam detik
+DEFAULT_TIMEOUT = (5, 30)
+
+# Folder cache default untuk --offline tanpa --cache-dir
+DEFAULT_CACHE_DIR = '.osxnt_cache'
+
+# kwargs requests yang bisa diterjemahkan ke httpx; selain ini lewat requests
+H2_KWARGS = {'headers', 'params', 'data', 'json', 'timeout', 'allow_redirects'}
+
+
+class TimedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter yang mencatat timing setiap request ke HTTPMetrics.
+    Retry (urllib3) terjadi di dalam send(), jadi ikut terhitung.
+    """
+
+    def __init__(self, metrics=None, **kwargs):
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if self.metrics is None:
+            return super().send(request, **kwargs)
+
+        host = urlsplit(request.url).netloc
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            self.metrics.record(host, request.method, None, time.perf_counter() - start,
+                                error=type(e).__name__)
+            raise
+
+        retries = getattr(response.raw, 'retries', None)
+        history = len(retries.history) if retries is not None and retries.history else 0
+        self.metrics.record(host, request.method, response.status_code,
+                            time.perf_counter() - start, retries=history)
+        return response
+
+
+def create_session(pool_connections=32, pool_maxsize=16, retries=3, backoff=0.5,
+                   user_agent=DEFAULT_UA, metrics=None, proxies=None):
+    """
+    Buat requests.Session dengan adapter yang sudah di-tune.
+
+    Args:
+        pool_connections (int): Jumlah pool host yang di-cache
+        pool_maxsize (int): Koneksi keep-alive maksimum per host
+        retries (int): Jumlah retry untuk error koneksi / 429 / 5xx
+        backoff (float): Faktor backoff (detik)
+        user_agent (str): Header User-Agent default
+        metrics (HTTPMetrics): Tempat mencatat timing (None = tidak dicatat)
+        proxies (dict): Proxy untuk session ini
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    if user_agent:
+        session.headers.update({'User-Agent': user_agent})
+    adapter = TimedAdapter(metrics, pool_connections=pool_connections,
+                           pool_maxsize=pool_maxsize,
+                           max_retries=make_retry(retries, backoff))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if proxies:
+        session.proxies = proxies
+    return session
+
+
+class HTTP2Response:
+    """
+    Bungkus httpx.Response supaya kelihatan seperti requests.Response
+    untuk atribut yang dipakai modul OSXNT.
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.reason = response.reason_phrase
+        self.elapsed = response.elapsed
+        self.http_version = response.http_version
+        self.history = []
+        self.raw = None
+
+    @property
+    def content(self):
+        return self._response.content
+
+    @property
+    def text(self):
+        return self._response.text
+
+    @property
+    def encoding(self):
+        return self._response.encoding
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self, **kwargs):
+        return self._response.json(**kwargs)
+
+    def iter_content(self, chunk_size=8192):
+        return self._response.iter_bytes(chunk_size)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise requests.HTTPError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+                response=self
+            )
+
+    def close(self):
+        self._response.close()
+
+
+class HTTPClient:
+    """
+    HTTP client bersama untuk modul OSXNT:
+    - satu Session (keep-alive) dengan pool per host yang bisa di-tune
+    - retry + jittered backoff untuk error koneksi, 429 dan 5xx (Retry-After dipatuhi)
+    - HTTP/2 opsional lewat httpx (kalo httpx + h2 terinstall)
+    - metrics timing per host di self.metrics
+    """
+
+    def __init__(self, pool_connections=32, pool_maxsize=16, retries=3, backoff=0.5,
+                 timeout=DEFAULT_TIMEOUT, user_agent=DEFAULT_UA, http2=False,
+                 host_pools=None, cache_dir=None, cache_ttl=3600,
+                 cache_size=256 * 1024 * 1024, offline=False, verbose=False):
+        """
+        Args:
+            pool_connections (int): Jumlah pool host yang di-cache
+            pool_maxsize (int): Koneksi keep-alive maksimum per host
+            retries (int): Jumlah retry (0 = tanpa retry)
+            backoff (float): Faktor backoff exponential (detik)
+            timeout (float|tuple): Timeout default (connect, read)
+            user_agent (str): User-Agent default
+            http2 (bool): Pakai HTTP/2 (httpx) kalo tersedia
+            host_pools (dict): host -> pool_maxsize khusus
+            cache_dir (str): Folder cache response di disk (None = tanpa cache)
+            cache_ttl (int): Umur default response di cache (detik)
+            cache_size (int): Batas ukuran cache (byte)
+            offline (bool): Hanya jawab dari cache, tanpa request ke jaringan
+            verbose (bool): Mode verbose
+        """
+        self.v = Verbose(verbose)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.metrics = HTTPMetrics()
+        self._lock = threading.Lock()
+
+        # Cache response (opsional); offline tanpa cache_dir pakai folder default
+        self.cache = None
+        self.offline = offline
+        if offline and not cache_dir:
+            cache_dir = DEFAULT_CACHE_DIR
+        if cache_dir:
+            from .cache import ResponseCache
+            self.cache = ResponseCache(cache_dir, ttl=cache_ttl, max_size=cache_size)
+            self.v.log(f"HTTP cache: {self.cache.path}{' (offline)' if offline else ''}")
+
+        self.session = create_session(pool_connections, pool_maxsize, retries, backoff,
+                                      user_agent, self.metrics)
+        if self.cache is not None:
+            self._mount_default(self._adapter(pool_maxsize))
+        for host, maxsize in (host_pools or {}).items():
+            self.set_host_pool(host, maxsize)
+
+        self._h2 = None
+        if http2 and self.cache is not None:
+            self.v.log("HTTP/2 dimatikan: cache response hanya lewat HTTP/1.1")
+        elif http2:
+            if HAS_HTTP2:
+                self._h2 = self._create_h2()
+                self.v.log("HTTP/2 aktif (httpx)")
+            else:
+                self.v.error("HTTP/2 butuh httpx + h2 (pip install httpx[http2]), pakai HTTP/1.1")
+
+    def _adapter(self, maxsize):
+        options = dict(pool_connections=self.pool_connections, pool_maxsize=maxsize,
+                       max_retries=make_retry(self.retries, self.backoff))
+        if self.cache is not None:
+            from .cache import CachingAdapter
+            return CachingAdapter(self.cache, self.offline, self.metrics, **options)
+        return TimedAdapter(self.metrics, **options)
+
+    def _mount_default(self, adapter):
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _create_h2(self):
+        limits = httpx.Limits(max_connections=self.pool_connections * self.pool_maxsize,
+                              max_keepalive_connections=self.pool_connections)
+        return httpx.Client(http2=True, limits=limits, follow_redirects=True,
+                            headers={'User-Agent': self.user_agent} if self.user_agent else None)
+
+    def set_host_pool(self, host, maxsize):
+        """
+        Ukuran pool khusus untuk satu host (misal API dengan batas koneksi).
+
+        Args:
+            host (str): host[:port]
+            maxsize (int): Koneksi keep-alive maksimum ke host ini
+        """
+        adapter = self._adapter(maxsize)
+        with self._lock:
+            for scheme in ('http', 'https'):
+                self.session.mount(f"{scheme}://{host}/", adapter)
+
+    def ensure_pool_size(self, maxsize):
+        """Perbesar pool default kalo worker lebih banyak dari pool_maxsize"""
+        with self._lock:
+            if maxsize <= self.pool_maxsize:
+                return
+            self.pool_maxsize = maxsize
+            self._mount_default(self._adapter(maxsize))
+
+    @staticmethod
+    def _h2_timeout(timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _h2_request(self, method, url, **kwargs):
+        """Request lewat httpx (HTTP/2) dengan retry yang sama seperti adapter"""
+        timeout = self._h2_timeout(kwargs.pop('timeout'))
+        follow = kwargs.pop('allow_redirects', method.upper() != 'HEAD')
+        if isinstance(kwargs.get('data'), (bytes, str)):
+            kwargs['content'] = kwargs.pop('data')
+        host = urlsplit(url).netloc
+
+        attempt = 0
+        start = time.perf_counter()
+        while True:
+            try:
+                response = self._h2.request(method, url, timeout=timeout,
+                                            follow_redirects=follow, **kwargs)
+            except httpx.TransportError as e:
+                if attempt < self.retries:
+                    attempt += 1
+                    time.sleep(backoff_delay(attempt, self.backoff))
+                    continue
+                self.metrics.record(host, method, None, time.perf_counter() - start,
+                                    retries=attempt, error=type(e).__name__)
+                raise requests.ConnectionError(str(e)) from e
+
+            if response.status_code in RETRY_STATUS and attempt < self.retries:
+                attempt += 1
+                wait = parse_retry_after(response.headers.get('Retry-After'))
+                response.close()
+                time.sleep(wait if wait is not None else backoff_delay(attempt, self.backoff))
+                continue
+
+            self.metrics.record(host, method, response.status_code,
+                                time.perf_counter() - start, retries=attempt)
+            return HTTP2Response(response)
+
+    def request(self, method, url, **kwargs):
+        """
+        Request HTTP (API sama seperti requests.Session.request).
+
+        stream=True, proxies, dan kwargs lain yang tidak dikenal httpx
+        selalu lewat requests (HTTP/1.1).
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        if self._h2 is not None and set(kwargs) <= H2_KWARGS:
+            return self._h2_request(method, url, **kwargs)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def display_stats(self):
+        """Tampilkan statistik HTTP (+ cache kalo aktif)"""
+        self.metrics.display()
+        if self.cache is not None:
+            stats = self.cache.stats
+            print(f"[*] Cache: {stats['hits']} hits, {stats['misses']} misses, "
+                  f"{stats['revalidated']} revalidated, {stats['stored']} stored, "
+                  f"{stats['evicted']} evicted ({self.cache.size() / 1024 / 1024:.1f} MB)")
+
+    def close(self):
+        self.session.close()
+        if self._h2 is not None:
+            self._h2.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+# ========== CLIENT BERSAMA ==========
+
+_client = None
+_client_lock = threading.Lock()
+_options = {}
+
+
+def configure(**options):
+    """
+    Set opsi client bersama (dipanggil sekali dari CLI sebelum modul jalan).
+    Client lama (kalo sudah dibuat) ditutup dan dibuat ulang saat get_client().
+    """
+    global _client
+    with _client_lock:
+        _options.update(options)
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def get_client():
+    """
+    Returns:
+        HTTPClient: Client bersama (dibuat saat pertama dipanggil)
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient(**_options)
+    return _client
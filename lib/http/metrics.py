@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# OSXNT - HTTP Metrics Module
+# Statistik timing per host (thread-safe)
+
+import threading
+from collections import deque
+
+# Jumlah sampel latency terakhir per host untuk p50/p95
+SAMPLES = 1024
+
+
+class HTTPMetrics:
+    """
+    Kumpulkan timing setiap request, dikelompokkan per host.
+
+    elapsed = waktu sampai header response diterima (termasuk connect,
+    TLS handshake, dan retry di dalam adapter).
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = {}
+    
+    def record(self, host, method, status, elapsed, retries=0, error=None):
+        """
+        Catat satu request.
+
+        Args:
+            host (str): host[:port]
+            method (str): HTTP method
+            status (int): Status code (None kalo error)
+            elapsed (float): Detik
+            retries (int): Jumlah retry yang terjadi
+            error (str): Pesan error (kalo gagal)
+        """
+        with self._lock:
+            stats = self._hosts.get(host)
+            if stats is None:
+                stats = {
+                    'requests': 0,
+                    'errors': 0,
+                    'retries': 0,
+                    'total': 0.0,
+                    'max': 0.0,
+                    'methods': {},
+                    'status': {},
+                    'samples': deque(maxlen=SAMPLES)
+                }
+                self._hosts[host] = stats
+            stats['requests'] += 1
+            stats['retries'] += retries
+            stats['total'] += elapsed
+            stats['max'] = max(stats['max'], elapsed)
+            stats['samples'].append(elapsed)
+            stats['methods'][method] = stats['methods'].get(method, 0) + 1
+            if error or status is None:
+                stats['errors'] += 1
+            else:
+                stats['status'][status] = stats['status'].get(status, 0) + 1
+    
+    @staticmethod
+    def _percentile(samples, pct):
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+    
+    def summary(self):
+        """
+        Returns:
+            dict: host -> {requests, errors, retries, avg_ms, p50_ms, p95_ms, max_ms, methods, status}
+        """
+        with self._lock:
+            hosts = {host: dict(stats, samples=list(stats['samples']),
+                                methods=dict(stats['methods']), status=dict(stats['status']))
+                     for host, stats in self._hosts.items()}
+        
+        result = {}
+        for host, stats in hosts.items():
+            count = stats['requests']
+            result[host] = {
+                'requests': count,
+                'errors': stats['errors'],
+                'retries': stats['retries'],
+                'avg_ms': round(stats['total'] / count * 1000, 2) if count else 0.0,
+                'p50_ms': round(self._percentile(stats['samples'], 50) * 1000, 2),
+                'p95_ms': round(self._percentile(stats['samples'], 95) * 1000, 2),
+                'max_ms': round(stats['max'] * 1000, 2),
+                'methods': stats['methods'],
+                'status': stats['status']
+            }
+        return result
+    
+    def totals(self):
+        """Total semua host: requests, errors, retries"""
+        with self._lock:
+            return {
+                'hosts': len(self._hosts),
+                'requests': sum(s['requests'] for s in self._hosts.values()),
+                'errors': sum(s['errors'] for s in self._hosts.values()),
+                'retries': sum(s['retries'] for s in self._hosts.values())
+            }
+    
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+    
+    def display(self, limit=10):
+        """Tampilkan ringkasan per host (host tersibuk dulu)"""
+        summary = self.summary()
+        if not summary:
+            return
+        totals = self.totals()
+        print(f"\n[*] HTTP: {totals['requests']} requests, {totals['errors']} errors, "
+              f"{totals['retries']} retries, {totals['hosts']} hosts")
+        ranked = sorted(summary.items(), key=lambda x: x[1]['requests'], reverse=True)
+        for host, stats in ranked[:limit]:
+            print(f"    {host[:40]:40} {stats['requests']:>6} req  "
+                  f"avg {stats['avg_ms']:>8.1f} ms  p95 {stats['p95_ms']:>8.1f} ms  "
+                  f"err {stats['errors']}")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# OSXNT - HTTP Retry Module
+# Retry dengan jittered exponential backoff + Retry-After
+
+import time
+import random
+from email.utils import parsedate_to_datetime
+from urllib3.util.retry import Retry
+
+# Status yang layak di-retry (rate limit + error sementara server)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# Batas atas tunggu dari header Retry-After (server bisa minta 1 jam)
+MAX_RETRY_AFTER = 60.0
+
+
+def backoff_delay(attempt, backoff=0.5, jitter=0.5, maximum=30.0):
+    """
+    Jeda sebelum retry ke-`attempt` (mulai dari 1).
+
+    Exponential (backoff * 2^(attempt-1)), lalu diacak di rentang
+    [delay * (1 - jitter), delay] supaya banyak worker tidak retry bersamaan.
+    """
+    if attempt <= 0 or backoff <= 0:
+        return 0.0
+    delay = min(maximum, backoff * (2 ** (attempt - 1)))
+    return random.uniform(delay * (1 - jitter), delay)
+
+
+def parse_retry_after(value, maximum=MAX_RETRY_AFTER):
+    """
+    Parse header Retry-After (detik atau HTTP-date) -> detik, None kalo invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+    return min(max(0.0, seconds), maximum)
+
+
+class JitterRetry(Retry):
+    """
+    urllib3 Retry dengan jitter di backoff dan Retry-After yang dibatasi.
+
+    urllib3 sendiri sudah menunggu Retry-After kalo ada (429/503);
+    kalo tidak ada, backoff exponential dipakai dengan jitter.
+    """
+    
+    JITTER = 0.5
+    
+    def get_backoff_time(self):
+        delay = super().get_backoff_time()
+        if delay <= 0:
+            return 0
+        return random.uniform(delay * (1 - self.JITTER), delay)
+    
+    def get_retry_after(self, response):
+        return parse_retry_after(response.headers.get('Retry-After'))
+
+
+def make_retry(retries=3, backoff=0.5, status=RETRY_STATUS):
+    """
+    Buat JitterRetry standar OSXNT.
+
+    Response terakhir dikembalikan apa adanya kalo retry habis
+    (raise_on_status=False), jadi caller tetap lihat 429/503-nya.
+    """
+    return JitterRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=status,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        raise_on_redirect=False
+    )
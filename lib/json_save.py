@@ -1,17 +1,295 @@
+import os
 import json
+import tempfile
 from datetime import datetime
 
-def save_to_json(data, filename):
-    """Save data to JSON file with timestamp"""
+# orjson (opsional): encoder C, langsung ke bytes
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Default -s: pretty (indent 4) atau compact; diubah lewat configure_json()
+_options = {'compact': False}
+
+# Encoder stdlib dibuat sekali (json.dumps membuat encoder baru tiap panggilan)
+_encoder = json.JSONEncoder(default=str, ensure_ascii=False, separators=(',', ':'))
+
+# datetime lewat default=str juga di orjson, supaya formatnya sama dengan
+# fallback stdlib ('2024-01-01 12:00:00', bukan ISO 'T')
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if HAS_ORJSON else 0
+
+# Ukuran buffer writer streaming sebelum di-flush ke file
+BUFFER_SIZE = 1024 * 1024
+
+# mkstemp membuat file 0600; hasil disamakan dengan open() biasa (0666 - umask)
+_umask = os.umask(0)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+def configure_json(compact=False):
+    """Set default save_to_json (dipanggil dari CLI, misal --compact-json)"""
+    _options['compact'] = compact
+
+def dumps(obj):
+    """
+    Encode compact ke bytes (orjson kalo ada, fallback json stdlib).
+
+    Returns:
+        bytes: JSON tanpa spasi
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=str, option=ORJSON_OPTIONS)
+        except TypeError:
+            # Misal integer > 64 bit: stdlib masih bisa
+            pass
+    return _encoder.encode(obj).encode('utf-8')
+
+class AtomicFile:
+    """
+    File tujuan ditulis lewat file sementara di folder yang sama lalu
+    os.replace(); kalo gagal di tengah, file lama tetap utuh.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        folder = os.path.dirname(os.path.abspath(filename))
+        fd, self.tmp_path = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(filename)}.",
+                                             suffix='.tmp')
+        self.file = os.fdopen(fd, 'wb')
+        try:
+            os.chmod(self.tmp_path, FILE_MODE)
+        except OSError:
+            pass
+
+    def write(self, data):
+        self.file.write(data)
+
+    def commit(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.tmp_path, self.filename)
+
+    def abort(self):
+        self.file.close()
+        try:
+            os.unlink(self.tmp_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+class JSONLWriter:
+    """
+    Writer JSON Lines: satu record per baris, di-buffer.
+
+    mode 'a' menambah ke file yang ada (incremental antar run),
+    mode 'w' menulis ulang secara atomic saat close().
+
+        with JSONLWriter('hasil.jsonl') as w:
+            for record in records:
+                w.write(record)
+    """
+
+    def __init__(self, filename, mode='a', buffer_size=BUFFER_SIZE):
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer = []
+        self._size = 0
+        if mode == 'w':
+            self._atomic = AtomicFile(filename)
+            self._file = self._atomic
+        else:
+            self._atomic = None
+            self._file = open(filename, 'ab')
+
+    def write(self, record):
+        line = dumps(record)
+        self._buffer.append(line)
+        self._buffer.append(b'\n')
+        self._size += len(line) + 1
+        self.count += 1
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, records):
+        # Versi inline dari write() untuk banyak record sekaligus
+        buffer = self._buffer
+        encode = dumps
+        for record in records:
+            line = encode(record)
+            buffer.append(line)
+            buffer.append(b'\n')
+            self._size += len(line) + 1
+            self.count += 1
+            if self._size >= self.buffer_size:
+                self.flush()
+                buffer = self._buffer
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(b''.join(self._buffer))
+            self._buffer = []
+            self._size = 0
+        if self._atomic is None:
+            self._file.flush()
+
+    def close(self):
+        self.flush()
+        if self._atomic is not None:
+            self._atomic.commit()
+        else:
+            self._file.close()
+
+    def abort(self):
+        """Batalkan mode 'w' (file lama tetap); mode 'a' hanya ditutup"""
+        if self._atomic is not None:
+            self._atomic.abort()
+        else:
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+class JSONWriter:
+    """
+    Writer JSON streaming untuk hasil besar: format sama dengan
+    save_to_json(prepare_output(...)), tapi record `data` ditulis satu per satu
+    tanpa perlu list lengkap di memori. File ditulis atomic saat close().
+
+        with JSONWriter('hasil.json', target, 'scanport') as w:
+            w.write_many(records)
+    """
+
+    def __init__(self, filename, target=None, module=None, buffer_size=BUFFER_SIZE):
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._file = AtomicFile(filename)
+        self._buffer = []
+        self._size = 0
+        if module is not None:
+            header = dumps({"timestamp": str(datetime.now()), "target": target, "module": module})
+            # '{"timestamp":...,"module":"x"}' -> '{...,"module":"x","data":['
+            self._file.write(header[:-1] + b',"data":[')
+            self._tail = b']}\n'
+        else:
+            self._file.write(b'[')
+            self._tail = b']\n'
+
+    def write(self, record):
+        data = dumps(record)
+        if self.count:
+            self._buffer.append(b',\n')
+            self._size += 2
+        else:
+            self._buffer.append(b'\n')
+        self._buffer.append(data)
+        self._size += len(data) + 1
+        self.count += 1
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, records):
+        buffer = self._buffer
+        encode = dumps
+        for record in records:
+            data = encode(record)
+            buffer.append(b',\n' if self.count else b'\n')
+            buffer.append(data)
+            self._size += len(data) + 2
+            self.count += 1
+            if self._size >= self.buffer_size:
+                self.flush()
+                buffer = self._buffer
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(b''.join(self._buffer))
+            self._buffer = []
+            self._size = 0
+
+    def close(self):
+        self.flush()
+        self._file.write(self._tail)
+        self._file.commit()
+
+    def abort(self):
+        self._file.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+def save_to_json(data, filename, compact=None):
+    """
+    Save data to JSON file (atomic: file lama diganti hanya kalo penulisan sukses)
+
+    Args:
+        data: Data (biasanya hasil prepare_output)
+        filename (str): File tujuan; akhiran .jsonl = append satu baris per record
+        compact (bool): Tanpa indent (default dari configure_json)
+
+    Returns:
+        bool: True jika berhasil
+    """
+    if compact is None:
+        compact = _options['compact']
     try:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4, default=str)
+        if filename.endswith('.jsonl'):
+            # Incremental: record `data` ditambahkan, tidak menimpa hasil run sebelumnya
+            if isinstance(data, dict) and isinstance(data.get('data'), list) and 'module' in data:
+                meta = {k: v for k, v in data.items() if k != 'data'}
+                records = ({**meta, 'data': record} for record in data['data'])
+            else:
+                records = [data]
+            with JSONLWriter(filename, 'a') as writer:
+                writer.write_many(records)
+        else:
+            with AtomicFile(filename) as f:
+                if compact:
+                    f.write(dumps(data))
+                else:
+                    f.write(json.dumps(data, indent=4, default=str).encode('utf-8'))
+                f.write(b'\n')
         print(f"[+] Results saved to {filename}")
         return True
     except Exception as e:
         print(f"[!] Failed to save JSON: {e}")
         return False
 
+def append_to_jsonl(records, filename):
+    """Append record ke file JSON Lines (satu object per baris, untuk output streaming)"""
+    try:
+        with JSONLWriter(filename, 'a') as writer:
+            writer.write_many(records)
+        return True
+    except Exception as e:
+        print(f"[!] Failed to append JSONL: {e}")
+        return False
+
 def prepare_output(data, target, module):
     """Wrap data with metadata"""
     return {
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# OSXNT - Lookup Cache Module
+# Cache hasil resolve / DNS / PTR / GeoIP / WHOIS: LRU di memori + SQLite di disk
+
+import os
+import json
+import time
+import atexit
+import socket
+import sqlite3
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = '.osxnt_cache'
+CACHE_NAME = 'lookups.sqlite3'
+
+# TTL default per jenis lookup (detik). DNS record pakai TTL dari jawaban server.
+DEFAULT_TTLS = {
+    'resolve': 300,
+    'addrinfo': 300,
+    'ptr': 3600,
+    'dns': 300,
+    'geo': 86400,
+    'whois': 86400,
+    'negative': 60
+}
+
+# Tulis ke disk per batch (bukan commit per lookup)
+FLUSH_EVERY = 200
+FLUSH_INTERVAL = 2.0
+
+MISS = object()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lookups (
+    kind TEXT NOT NULL,
+    query TEXT NOT NULL,
+    value TEXT,
+    expires REAL NOT NULL,
+    PRIMARY KEY (kind, query)
+);
+"""
+
+
+class LookupCache:
+    """
+    Cache lookup dengan key (kind, query).
+
+    - depan: LRU di memori (OrderedDict), cepat untuk lookup berulang dalam satu run
+    - belakang: SQLite (opsional), supaya run berikutnya tidak query ulang
+    - nilai None juga di-cache (negative caching, misal NXDOMAIN / PTR kosong)
+    """
+
+    def __init__(self, path=None, ttls=None, memory_size=4096, enabled=True):
+        """
+        Args:
+            path (str): File SQLite (None = memori saja)
+            ttls (dict): Override TTL per kind
+            memory_size (int): Jumlah entry maksimum di LRU memori
+            enabled (bool): False = semua get() miss, set() diabaikan (--no-cache)
+        """
+        self.enabled = enabled
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.memory_size = memory_size
+        self.path = path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self.stats = {}
+        self._db = None
+
+        if enabled and path:
+            try:
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute('PRAGMA journal_mode=WAL')
+                self._db.execute('PRAGMA synchronous=NORMAL')
+                self._db.executescript(SCHEMA)
+            except sqlite3.Error as e:
+                print(f"[!] Lookup cache disk tidak bisa dibuka ({e}), pakai memori saja")
+                self._db = None
+
+    def _count(self, kind, name):
+        stats = self.stats.get(kind)
+        if stats is None:
+            stats = self.stats[kind] = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0}
+        stats[name] += 1
+
+    def _remember(self, key, expires, value):
+        """Masukkan ke LRU memori (dipanggil dengan lock)"""
+        self._memory[key] = (expires, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, kind, query):
+        """
+        Returns:
+            Nilai yang di-cache, atau MISS
+        """
+        if not self.enabled:
+            return MISS
+        key = (kind, query)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self._count(kind, 'memory_hits')
+                    return entry[1]
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT value, expires FROM lookups WHERE kind = ? AND query = ?',
+                    (kind, query)).fetchone()
+                if row is not None and row[1] > now:
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value)
+                    self._count(kind, 'disk_hits')
+                    return value
+
+            self._count(kind, 'misses')
+        return MISS
+
+    def set(self, kind, query, value, ttl=None):
+        """
+        Simpan hasil lookup.
+
+        Args:
+            kind (str): Jenis lookup (resolve, ptr, dns, geo, whois, ...)
+            query (str): Query (hostname, IP, "domain/TYPE", ...)
+            value: Nilai yang bisa di-JSON-kan (None = hasil negatif)
+            ttl (float): Umur (detik); default dari self.ttls
+        """
+        if not self.enabled:
+            return
+        if ttl is None:
+            ttl = self.ttls['negative'] if value is None else self.ttls.get(kind, 300)
+        if ttl <= 0:
+            return
+        expires = time.time() + ttl
+        with self._lock:
+            self._remember((kind, query), expires, value)
+            self._count(kind, 'stores')
+            if self._db is not None:
+                self._pending.append((kind, query, json.dumps(value, default=str), expires))
+                if (len(self._pending) >= FLUSH_EVERY or
+                        time.monotonic() - self._last_flush >= FLUSH_INTERVAL):
+                    self._flush()
+
+    def cached(self, kind, query, fetch, ttl=None):
+        """
+        Ambil dari cache, atau panggil fetch() dan simpan hasilnya.
+
+        Args:
+            fetch (callable): Fungsi tanpa argumen yang melakukan lookup asli
+            ttl (float|callable): TTL, atau fungsi ttl(value) (misal TTL record DNS)
+
+        Returns:
+            Hasil lookup (dari cache atau fetch)
+        """
+        value = self.get(kind, query)
+        if value is not MISS:
+            return value
+        value = fetch()
+        self.set(kind, query, value, ttl(value) if callable(ttl) else ttl)
+        return value
+
+    def _flush(self):
+        """Tulis entry pending ke SQLite (dipanggil dengan lock)"""
+        if not self._pending or self._db is None:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO lookups (kind, query, value, expires) VALUES (?, ?, ?, ?)',
+                    self._pending)
+        except sqlite3.Error as e:
+            print(f"[!] Gagal menulis lookup cache: {e}")
+        self._pending = []
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def purge_expired(self):
+        """Hapus entry kadaluarsa dari disk"""
+        with self._lock:
+            self._flush()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute('DELETE FROM lookups WHERE expires <= ?', (time.time(),))
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._pending = []
+            if self._db is not None:
+                with self._db:
+                    self._db.execute('DELETE FROM lookups')
+
+    def summary(self):
+        """
+        Returns:
+            dict: kind -> {memory_hits, disk_hits, misses, stores, hit_rate}
+        """
+        with self._lock:
+            result = {}
+            for kind, stats in self.stats.items():
+                hits = stats['memory_hits'] + stats['disk_hits']
+                total = hits + stats['misses']
+                result[kind] = dict(stats, hit_rate=round(hits / total * 100, 1) if total else 0.0)
+            return result
+
+    def display(self):
+        """Tampilkan statistik cache per kind"""
+        summary = self.summary()
+        if not summary:
+            return
+        print(f"\n[*] Lookup cache{' (' + self.path + ')' if self._db is not None else ''}:")
+        for kind, stats in sorted(summary.items()):
+            print(f"    {kind:<10} hit {stats['hit_rate']:5.1f}%  "
+                  f"(memory {stats['memory_hits']}, disk {stats['disk_hits']}, "
+                  f"miss {stats['misses']}, stored {stats['stores']})")
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# ========== CACHE BERSAMA ==========
+
+_cache = None
+_cache_lock = threading.Lock()
+_options = {}
+
+
+def configure_lookup_cache(cache_dir=None, enabled=True, ttls=None, memory_size=4096):
+    """
+    Set opsi cache bersama (dipanggil dari CLI sebelum modul jalan).
+
+    Args:
+        cache_dir (str): Folder cache (default: .osxnt_cache)
+        enabled (bool): False untuk --no-cache
+        ttls (dict): Override TTL per kind
+        memory_size (int): Ukuran LRU memori
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+        _options.clear()
+        _options.update(cache_dir=cache_dir, enabled=enabled, ttls=ttls, memory_size=memory_size)
+
+
+def get_lookup_cache():
+    """
+    Returns:
+        LookupCache: Cache bersama (dibuat saat pertama dipanggil)
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                enabled = _options.get('enabled', True)
+                cache_dir = _options.get('cache_dir') or DEFAULT_CACHE_DIR
+                _cache = LookupCache(os.path.join(cache_dir, CACHE_NAME) if enabled else None,
+                                     ttls=_options.get('ttls'),
+                                     memory_size=_options.get('memory_size', 4096),
+                                     enabled=enabled)
+                atexit.register(_cache.close)
+    return _cache
+
+
+def resolve_cached(host):
+    """
+    socket.gethostbyname dengan cache (gagal resolve juga di-cache sebentar).
+
+    Returns:
+        str: IP, atau None kalo tidak bisa di-resolve
+    """
+    def fetch():
+        try:
+            return socket.gethostbyname(host)
+        except (socket.gaierror, socket.herror, UnicodeError):
+            return None
+    return get_lookup_cache().cached('resolve', host.lower(), fetch)
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# OSXNT - Metrics Module
+# Counter, histogram latency, span bertingkat (di bawah Timer) dan report JSON (--profile)
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+from .json_save import AtomicFile
+
+# pyinstrument opsional (sampling profiler); cProfile selalu ada di stdlib
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+    HAS_PYINSTRUMENT = True
+except ImportError:
+    HAS_PYINSTRUMENT = False
+
+# Sampel terakhir per histogram untuk p50/p95/p99 (sama dengan HTTPMetrics)
+SAMPLES = 1024
+
+# Batas atas bucket histogram (ms); bucket terakhir = sisanya
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Fungsi teratas (cumulative) dari cProfile yang ikut di report JSON
+PROFILE_TOP = 30
+
+
+class _Histogram:
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets', 'samples')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.samples = deque(maxlen=SAMPLES)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect_left(BUCKETS_MS, seconds * 1000)] += 1
+        self.samples.append(seconds)
+
+    @staticmethod
+    def _percentile(ordered, pct):
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        labels = [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'total_s': round(self.total, 6),
+            'avg_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'min_ms': round((self.min or 0.0) * 1000, 3),
+            'p50_ms': round(self._percentile(ordered, 50) * 1000, 3),
+            'p95_ms': round(self._percentile(ordered, 95) * 1000, 3),
+            'p99_ms': round(self._percentile(ordered, 99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+            'buckets': {label: n for label, n in zip(labels, self.buckets) if n}
+        }
+
+
+class _NullSpan:
+    """Span kosong saat metrics nonaktif (tanpa alokasi per panggilan)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('registry', 'name', 'path', 'start')
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.path = self.registry._push(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.registry._pop(self.path, time.perf_counter() - self.start)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Registry metrics bersama untuk semua modul (thread-safe).
+
+    - incr(name): counter
+    - observe(name, seconds): histogram latency (per request / per query)
+    - span(name): waktu per tahap; span bertingkat jadi path 'Total execution/Port Scan/resolve'.
+      Timer otomatis membuka span dengan namanya. Span di thread worker
+      ditempel di bawah span aktif thread utama.
+    - add_collector(name, func): statistik modul lain (HTTP, lookup cache) diambil saat report
+
+    Selama nonaktif semua method langsung return (span = context kosong bersama).
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._main_stack = []
+        self._main_ident = threading.main_thread().ident
+        self.counters = {}
+        self.histograms = {}
+        self.spans = {}
+        self._collectors = {}
+        self.started = datetime.now()
+        self._start = time.perf_counter()
+
+    # ---------- counter / histogram ----------
+
+    def incr(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = _Histogram()
+            histogram.add(seconds)
+
+    # ---------- span ----------
+
+    def _stack(self):
+        if threading.get_ident() == self._main_ident:
+            return self._main_stack
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, name):
+        stack = self._stack()
+        if stack:
+            parent = stack[-1]
+        elif stack is not self._main_stack and self._main_stack:
+            parent = self._main_stack[-1]
+        else:
+            parent = None
+        path = f"{parent}/{name}" if parent else name
+        stack.append(path)
+        return path
+
+    def _pop(self, path, seconds):
+        stack = self._stack()
+        # Timer start/stop manual bisa tidak berurutan: buang sampai path ini
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i] == path:
+                del stack[i:]
+                break
+        with self._lock:
+            histogram = self.spans.get(path)
+            if histogram is None:
+                histogram = self.spans[path] = _Histogram()
+            histogram.add(seconds)
+
+    def span(self, name):
+        """
+        Context manager waktu satu tahap.
+
+            with get_metrics().span('resolve'):
+                ...
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def timed(self, name=None):
+        """Decorator: setiap panggilan fungsi jadi span"""
+        def decorator(func):
+            label = name or func.__qualname__
+
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, label):
+                    return func(*args, **kwargs)
+            wrapper.__name__ = func.__name__
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+        return decorator
+
+    # ---------- report ----------
+
+    def add_collector(self, name, func):
+        """
+        Args:
+            name (str): Key di report (misal 'http', 'lookup_cache')
+            func (callable): Dipanggil saat report, return dict / None
+        """
+        self._collectors[name] = func
+
+    def report(self):
+        """
+        Returns:
+            dict: {started, duration_s, command, spans, counters, histograms, <collector>...}
+        """
+        with self._lock:
+            # Urut path: induk langsung diikuti anak-anaknya
+            spans = {path: self.spans[path].summary() for path in sorted(self.spans)}
+            counters = dict(sorted(self.counters.items()))
+            histograms = {name: h.summary() for name, h in sorted(self.histograms.items())}
+        for summary in spans.values():
+            # Span tanpa percentile / bucket (biasanya dipanggil sekali)
+            if summary['count'] == 1:
+                for key in ('min_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'buckets'):
+                    summary.pop(key)
+        report = {
+            'started': self.started.isoformat(timespec='seconds'),
+            'duration_s': round(time.perf_counter() - self._start, 3),
+            'command': ' '.join(sys.argv[1:]),
+            'spans': spans,
+            'counters': counters,
+            'histograms': histograms
+        }
+        for name, func in self._collectors.items():
+            try:
+                data = func()
+            except Exception as e:
+                data = {'error': str(e)}
+            if data:
+                report[name] = data
+        return report
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.spans.clear()
+
+
+class HotPathProfiler:
+    """
+    Capture profiler untuk seluruh eksekusi: 'cprofile' (stdlib, deterministik)
+    atau 'pyinstrument' (sampling, overhead kecil). Tidak dibuat kalo tidak diminta.
+    Keduanya hanya melihat thread yang memulai (thread utama); kerja di thread
+    worker terlihat lewat span / histogram.
+    """
+
+    def __init__(self, kind='cprofile'):
+        if kind == 'pyinstrument' and not HAS_PYINSTRUMENT:
+            raise ImportError("pyinstrument tidak terinstall (pip install pyinstrument)")
+        self.kind = kind
+        if kind == 'pyinstrument':
+            self._profiler = PyinstrumentProfiler()
+        else:
+            import cProfile
+            self._profiler = cProfile.Profile()
+        self._running = False
+
+    def start(self):
+        if self.kind == 'pyinstrument':
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+        self._running = True
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self.kind == 'pyinstrument':
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+
+    def save(self, base):
+        """
+        Simpan hasil di sebelah report: <base>.prof (pstats) atau <base>.pyinstrument.html
+
+        Returns:
+            dict: Info untuk report JSON (file + fungsi teratas untuk cProfile)
+        """
+        self.stop()
+        if self.kind == 'pyinstrument':
+            filename = f"{base}.pyinstrument.html"
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(self._profiler.output_html())
+            return {'profiler': 'pyinstrument', 'file': filename}
+
+        import pstats
+        filename = f"{base}.prof"
+        self._profiler.dump_stats(filename)
+        stats = pstats.Stats(self._profiler)
+        rows = []
+        for (path, line, func), (cc, nc, tt, ct, callers) in stats.stats.items():
+            rows.append({'function': f"{os.path.basename(path)}:{line}({func})", 'calls': nc,
+                         'tottime_s': round(tt, 6), 'cumtime_s': round(ct, 6)})
+        rows.sort(key=lambda r: r['cumtime_s'], reverse=True)
+        return {'profiler': 'cprofile', 'file': filename, 'top': rows[:PROFILE_TOP]}
+
+
+# Registry bersama; nonaktif sampai configure_metrics(enabled=True) (--profile)
+_metrics = MetricsRegistry()
+_profile = {'path': None, 'profiler': None}
+
+
+def configure_metrics(enabled=False, report_path=None, profiler=None):
+    """
+    Aktifkan metrics bersama dan tulis report JSON saat exit.
+
+    Args:
+        enabled (bool): Kumpulkan counter / histogram / span
+        report_path (str): File report JSON (--profile)
+        profiler (str): None, 'cprofile' atau 'pyinstrument'
+
+    Returns:
+        MetricsRegistry: Registry bersama
+    """
+    _metrics.enabled = bool(enabled or report_path)
+    _profile['path'] = report_path
+    if _profile['profiler'] is not None:
+        _profile['profiler'].stop()
+        _profile['profiler'] = None
+    if profiler:
+        try:
+            _profile['profiler'] = HotPathProfiler(profiler)
+            _profile['profiler'].start()
+        except ImportError as e:
+            print(f"[!] {e}")
+    if report_path:
+        atexit.register(write_report)
+    return _metrics
+
+
+def get_metrics():
+    """Registry metrics bersama (selalu ada, nonaktif kalo --profile tidak dipakai)"""
+    return _metrics
+
+
+def incr(name, value=1):
+    """Tambah counter di registry bersama"""
+    if _metrics.enabled:
+        _metrics.incr(name, value)
+
+
+def observe(name, seconds):
+    """Catat satu latency (detik) ke histogram registry bersama"""
+    if _metrics.enabled:
+        _metrics.observe(name, seconds)
+
+
+def span(name):
+    """Span di registry bersama (context kosong kalo nonaktif)"""
+    if not _metrics.enabled:
+        return _NULL_SPAN
+    return _Span(_metrics, name)
+
+
+def stage(name):
+    """
+    Span untuk tahap kasar (Timer): selalu dicatat, juga sebelum --profile
+    terbaca, supaya 'Total execution' jadi akar span. Murah karena jarang dipanggil.
+    """
+    return _Span(_metrics, name)
+
+
+def write_report(path=None):
+    """
+    Tulis report JSON (dan file profiler) ke path / --profile.
+
+    Returns:
+        str: Path report, None kalo tidak ada / gagal
+    """
+    path = path or _profile['path']
+    if not path:
+        return None
+    _profile['path'] = None  # sekali saja (atexit + panggilan manual)
+    report = _metrics.report()
+    profiler = _profile['profiler']
+    try:
+        if profiler is not None:
+            _profile['profiler'] = None
+            report['profile'] = profiler.save(os.path.splitext(path)[0])
+        with AtomicFile(path) as f:
+            f.write(json.dumps(report, indent=2, ensure_ascii=False, default=str).encode('utf-8'))
+        print(f"[+] Profile report disimpan ke {path}")
+        return path
+    except (OSError, ValueError) as e:
+        print(f"[!] Gagal menulis profile report: {e}")
+        return None
@@ -1,14 +1,41 @@
 # lib/multi_target.py
 import os
+import re
+import sys
+import glob
+import socket
+import ipaddress
+from itertools import product
+
+# Batas ekspansi satu CIDR / range / glob (setara /8)
+MAX_EXPAND = 1 << 24
+
+# 10.0.0.1-50 (oktet terakhir) dan 10.0.0.1-10.0.3.255 (range penuh)
+OCTET_RANGE_RE = re.compile(r'^(\d{1,3}\.\d{1,3}\.\d{1,3}\.)(\d{1,3})-(\d{1,3})$')
+FULL_RANGE_RE = re.compile(r'^([0-9a-fA-F.:]+)-([0-9a-fA-F.:]+)$')
+
+# Baris tanpa karakter ini pasti satu target (tanpa ekspansi)
+SPEC_CHARS_RE = re.compile(r'[,/{\[#-]')
+
+# Glob hostname: {www,mail}.example.com, srv[01-20].corp.local
+GLOB_TOKEN_RE = re.compile(r'\{([^{}]*)\}|\[(\d+)-(\d+)\]')
+GLOB_RE = re.compile(r'\{[^{}]*,[^{}]*\}|\[\d+-\d+\]')
+
+# TargetSet: blok /16 pindah ke bitmap 8 KB kalo isinya lebih dari ini
+# (1024 integer di set ~60 KB, bitmap tetap 8 KB)
+DENSE_AFTER = 1024
+
 
 def read_targets_from_file(filename):
-    """Baca daftar target dari file (satu per baris, abaikan komentar #)"""
+    """Baca daftar target dari file (satu per baris, abaikan komentar #, tanpa duplikat)"""
     targets = []
+    seen = set()
     try:
         with open(filename, 'r') as f:
             for line in f:
                 line = line.strip()
-                if line and not line.startswith('#'):
+                if line and not line.startswith('#') and line not in seen:
+                    seen.add(line)
                     targets.append(line)
         return targets
     except FileNotFoundError:
@@ -18,6 +45,374 @@ def read_targets_from_file(filename):
         print(f"[!] Error membaca file: {e}")
         return None
 
+
+def _ipv4_str(n):
+    return f"{n >> 24}.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+
+
+def _ipv4_int(value):
+    """'a.b.c.d' -> integer tanpa lewat ipaddress; None kalo bukan IPv4 kanonik"""
+    # inet_pton ketat: tolak nol di depan (ambigu oktal) dan bentuk pendek '10.1'
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, value), 'big')
+    except (OSError, ValueError):
+        return None
+
+
+def _parse_ip(value):
+    """
+    Returns:
+        int untuk IPv4, IPv6Address untuk IPv6, None kalo bukan IP
+    """
+    # Cek karakter dulu: hostname biasa tidak perlu lewat parser
+    if not value:
+        return None
+    if value[0].isdigit() and ':' not in value:
+        return _ipv4_int(value)
+    if ':' not in value:
+        return None
+    try:
+        ip = ipaddress.ip_address(value)
+    except ValueError:
+        return None
+    return int(ip) if ip.version == 4 else ip
+
+
+class TargetSet:
+    """
+    Set target untuk dedupe dengan memori kecil.
+
+    - IPv4 disimpan sebagai integer; blok /16 yang padat (> DENSE_AFTER)
+      pindah ke bitmap 8 KB (satu /16 penuh = 8 KB, bukan ~8 MB string di set)
+    - IPv6 sebagai integer, hostname / URL sebagai string
+    """
+
+    def __init__(self):
+        self._v4 = set()
+        self._blocks = {}
+        self._dense = {}
+        self._v6 = set()
+        self._names = set()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _promote(self, block):
+        bitmap = bytearray(8192)
+        base = block << 16
+        v4 = self._v4
+        for low in range(65536):
+            if base | low in v4:
+                v4.discard(base | low)
+                bitmap[low >> 3] |= 1 << (low & 7)
+        self._dense[block] = bitmap
+        del self._blocks[block]
+
+    def _add_v4(self, n):
+        block = n >> 16
+        bitmap = self._dense.get(block)
+        if bitmap is not None:
+            byte, bit = (n & 0xFFFF) >> 3, 1 << (n & 7)
+            if bitmap[byte] & bit:
+                return False
+            bitmap[byte] |= bit
+        else:
+            if n in self._v4:
+                return False
+            self._v4.add(n)
+            count = self._blocks.get(block, 0) + 1
+            self._blocks[block] = count
+            if count > DENSE_AFTER:
+                self._promote(block)
+        self._count += 1
+        return True
+
+    def _has_v4(self, n):
+        bitmap = self._dense.get(n >> 16)
+        if bitmap is None:
+            return n in self._v4
+        return bool(bitmap[(n & 0xFFFF) >> 3] & (1 << (n & 7)))
+
+    def add(self, target, ip=None):
+        """
+        Args:
+            target (str): Target yang sudah dinormalisasi
+            ip: integer IPv4 / IPv6Address kalo sudah diketahui (hemat parsing)
+
+        Returns:
+            bool: True kalo target baru
+        """
+        if ip is None:
+            ip = _parse_ip(target)
+        if isinstance(ip, int):
+            return self._add_v4(ip)
+        if ip is not None:
+            if int(ip) in self._v6:
+                return False
+            self._v6.add(int(ip))
+        else:
+            if target in self._names:
+                return False
+            self._names.add(target)
+        self._count += 1
+        return True
+
+    def __contains__(self, target):
+        ip = _parse_ip(target)
+        if ip is None:
+            return target in self._names
+        if isinstance(ip, int):
+            return self._has_v4(ip)
+        return int(ip) in self._v6
+
+
+def _normalize(value):
+    """normalize_target + hasil parse IP (integer IPv4 / IPv6Address / None)"""
+    value = value.strip()
+    if '://' in value:
+        scheme, rest = value.split('://', 1)
+        end = len(rest)
+        for sep in '/?#':
+            i = rest.find(sep)
+            if i != -1 and i < end:
+                end = i
+        return f"{scheme.lower()}://{rest[:end].lower()}{rest[end:]}", None
+    ip = _parse_ip(value)
+    if ip is None:
+        return value.lower().rstrip('.'), None
+    if isinstance(ip, int):
+        # Sudah kanonik kalo lolos _ipv4_int
+        return value, ip
+    return str(ip), ip
+
+
+def normalize_target(value):
+    """
+    Bentuk kanonik target: IPv6 dikompres, hostname lowercase tanpa titik
+    di akhir, URL: scheme + host lowercase.
+    """
+    return _normalize(value)[0]
+
+
+def _split_spec(spec):
+    """Pisah 'a,b,{c,d}.x' di koma yang tidak berada di dalam {}"""
+    parts = []
+    depth = 0
+    current = []
+    for ch in spec:
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth = max(0, depth - 1)
+        if ch == ',' and depth == 0:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(ch)
+    parts.append(''.join(current))
+    return parts
+
+
+def _expand_glob(pattern):
+    """{a,b} dan [01-20] -> semua kombinasi (lazy), lebar angka dipertahankan"""
+    pieces = []
+    pos = 0
+    for match in GLOB_TOKEN_RE.finditer(pattern):
+        pieces.append([pattern[pos:match.start()]])
+        token = match.group(0)
+        if token.startswith('{'):
+            pieces.append(token[1:-1].split(','))
+        else:
+            start_s, end_s = token[1:-1].split('-')
+            start, end = int(start_s), int(end_s)
+            width = len(start_s) if start_s.startswith('0') else 0
+            step = 1 if end >= start else -1
+            pieces.append(range(start, end + step, step) if not width else
+                          [str(n).zfill(width) for n in range(start, end + step, step)])
+        pos = match.end()
+    pieces.append([pattern[pos:]])
+    for combo in product(*pieces):
+        yield ''.join(str(p) for p in combo)
+
+
+def _glob_size(pattern):
+    size = 1
+    for match in GLOB_TOKEN_RE.finditer(pattern):
+        if match.group(1) is not None:
+            size *= len(match.group(1).split(','))
+        else:
+            size *= abs(int(match.group(3)) - int(match.group(2))) + 1
+    return size
+
+
+def _int_range(first, last, version):
+    """Range alamat (inklusif) sebagai (string, ip) lazy"""
+    if version == 4:
+        for n in range(first, last + 1):
+            yield _ipv4_str(n), n
+    else:
+        for n in range(first, last + 1):
+            ip = ipaddress.IPv6Address(n)
+            yield str(ip), ip
+
+
+def _expand_spec(spec, max_expand, errors):
+    """
+    Satu spec -> (target, ip) lazy. ip: integer IPv4, ipaddress object, atau None.
+    """
+    spec = spec.strip()
+    if not spec or spec.startswith('#'):
+        return
+    if ',' in spec and '://' not in spec:
+        parts = _split_spec(spec)
+        if len(parts) > 1:
+            for part in parts:
+                yield from _expand_spec(part, max_expand, errors)
+            return
+
+    if '/' in spec and '://' not in spec:
+        try:
+            net = ipaddress.ip_network(spec, strict=False)
+        except ValueError:
+            net = None
+        if net is not None:
+            if net.num_addresses > max_expand:
+                errors(f"CIDR terlalu besar ({net.num_addresses} alamat), dilewati: {spec}")
+                return
+            first, last = int(net.network_address), int(net.broadcast_address)
+            # /31, /32 (dan /127, /128) tidak punya network/broadcast
+            if net.num_addresses > 2:
+                first, last = first + 1, last - (1 if net.version == 4 else 0)
+            yield from _int_range(first, last, net.version)
+            return
+
+    if '-' in spec:
+        match = OCTET_RANGE_RE.match(spec)
+        if match:
+            prefix, start, end = match.groups()
+            try:
+                first = int(ipaddress.IPv4Address(prefix + start))
+                last = int(ipaddress.IPv4Address(prefix + end))
+            except ValueError:
+                errors(f"Range tidak valid: {spec}")
+                return
+            if last < first:
+                errors(f"Range terbalik (awal > akhir), dilewati: {spec}")
+                return
+            yield from _int_range(first, last, 4)
+            return
+        match = FULL_RANGE_RE.match(spec)
+        if match:
+            try:
+                start, end = (ipaddress.ip_address(x) for x in match.groups())
+            except ValueError:
+                start = end = None
+            if start is not None:
+                if start.version != end.version or int(end) < int(start):
+                    errors(f"Range tidak valid: {spec}")
+                    return
+                if int(end) - int(start) + 1 > max_expand:
+                    errors(f"Range terlalu besar ({int(end) - int(start) + 1} alamat), dilewati: {spec}")
+                    return
+                yield from _int_range(int(start), int(end), start.version)
+                return
+
+    if '://' not in spec and GLOB_RE.search(spec):
+        size = _glob_size(spec)
+        if size > max_expand:
+            errors(f"Glob terlalu besar ({size} nama), dilewati: {spec}")
+            return
+        for name in _expand_glob(spec):
+            yield from _expand_spec(name, max_expand, errors)
+        return
+
+    yield _normalize(spec)
+
+
+def _source_lines(source, errors):
+    """'-' = stdin, '@file' / '@folder/*.txt' = isi file, lainnya = spec langsung"""
+    if source == '-':
+        for line in sys.stdin:
+            yield line
+        return
+    if source.startswith('@'):
+        pattern = source[1:]
+        files = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not files:
+            errors(f"File {pattern} tidak ditemukan")
+        for filename in files:
+            try:
+                with open(filename, 'r') as f:
+                    for line in f:
+                        yield line
+            except FileNotFoundError:
+                errors(f"File {filename} tidak ditemukan")
+            except OSError as e:
+                errors(f"Error membaca file: {e}")
+        return
+    yield source
+
+
+def iter_targets(sources, dedupe=True, max_expand=MAX_EXPAND):
+    """
+    Sumber target lazy untuk semua modul.
+
+    Sumber: '-' (stdin), '@file' atau '@folder/*.txt', atau spec langsung.
+    Spec (juga per baris file, boleh dipisah koma):
+        192.0.2.0/24, 10.0.0.1-50, 10.0.0.1-10.0.1.20, {www,mail}.example.com,
+        srv[01-20].corp.local, hostname, URL, IP
+
+    Args:
+        sources (str | iterable): Satu sumber atau beberapa
+        dedupe (bool): Lewati target yang sudah pernah keluar (TargetSet)
+        max_expand (int): Maksimum alamat / nama per CIDR, range atau glob
+
+    Yields:
+        str: Target yang sudah dinormalisasi, urutan input dipertahankan
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+
+    def errors(message):
+        print(f"[!] {message}")
+
+    seen = TargetSet() if dedupe else None
+    for source in sources:
+        for line in _source_lines(source.strip(), errors):
+            if SPEC_CHARS_RE.search(line) is None:
+                # Jalur cepat: IP / hostname biasa (mayoritas baris file target)
+                target, ip = _normalize(line)
+                if target and (seen is None or seen.add(target, ip)):
+                    yield target
+                continue
+            for target, ip in _expand_spec(line, max_expand, errors):
+                if seen is None or seen.add(target, ip):
+                    yield target
+
+
+def is_multi_target(spec):
+    """True kalo spec menghasilkan lebih dari satu target (file, stdin, CIDR, range, glob, daftar)"""
+    spec = spec.strip()
+    if spec == '-' or spec.startswith('@'):
+        return True
+    if '://' in spec:
+        return False
+    if ',' in spec or GLOB_RE.search(spec):
+        return True
+    if OCTET_RANGE_RE.match(spec):
+        return True
+    if '/' in spec or '-' in spec:
+        try:
+            ipaddress.ip_network(spec, strict=False)
+            return True
+        except ValueError:
+            pass
+        match = FULL_RANGE_RE.match(spec)
+        return bool(match and all(_parse_ip(x) is not None for x in match.groups()))
+    return False
+
+
 def sanitize_filename(name):
     """Bersihkan string untuk digunakan sebagai nama file/folder"""
     import re
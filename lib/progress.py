@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# OSXNT - Progress Reporter Module
+# Progress live (rate, ETA, selesai/total, error) untuk modul yang lama jalan
+
+import sys
+import json
+import time
+import threading
+from datetime import timedelta
+from .converter import size_to_human
+
+MODES = ('auto', 'tty', 'json', 'off')
+
+# Interval render default (detik)
+INTERVAL = 0.5
+
+# Bobot sampel terbaru untuk rate (EWMA); sisanya dari rate sebelumnya
+RATE_SMOOTHING = 0.3
+
+# Opsi bersama, diset sekali dari CLI (--progress, --progress-interval)
+_options = {'mode': 'auto', 'interval': INTERVAL, 'stream': None}
+
+
+def configure_progress(mode='auto', interval=INTERVAL, stream=None):
+    """
+    Set cara tampil progress untuk semua modul.
+
+    Args:
+        mode (str): 'auto' (status line kalo stream TTY, selain itu diam),
+                    'tty', 'json' (satu JSON per interval, untuk job runner) atau 'off'
+        interval (float): Detik antar render
+        stream: Tujuan output (default sys.stderr, stdout tetap untuk hasil)
+    """
+    if mode not in MODES:
+        raise ValueError(f"Mode progress tidak dikenal: {mode}")
+    _options.update(mode=mode, interval=max(0.05, interval), stream=stream)
+
+
+class Progress:
+    """
+    Reporter progress yang murah dipanggil dari loop panas.
+
+    Counter tanpa lock: tiap thread menambah slot miliknya sendiri (satu penulis
+    per slot), thread ticker menjumlahkan semua slot tiap interval lalu render.
+    Loop single-thread bisa pakai update(done) sesekali (misal tiap 1024 item).
+
+        with progress(len(ports), 'Port Scan', 'port') as p:
+            ...  # di worker: p.advance() / p.error()
+    """
+
+    def __init__(self, total=None, label='', unit='item', mode=None, interval=None, stream=None):
+        """
+        Args:
+            total (int): Jumlah total (None = tidak diketahui, tanpa persen / ETA)
+            label (str): Nama proses
+            unit (str): Satuan ('B' ditampilkan sebagai ukuran file)
+            mode (str): Override mode bersama
+            interval (float): Override interval bersama
+            stream: Override stream bersama
+        """
+        self.total = total
+        self.label = label
+        self.unit = unit
+        self.stream = stream or _options['stream'] or sys.stderr
+        self.interval = interval or _options['interval']
+        mode = mode or _options['mode']
+        if mode == 'auto':
+            isatty = getattr(self.stream, 'isatty', None)
+            mode = 'tty' if isatty is not None and isatty() else 'off'
+        self.mode = mode
+        self._base = 0
+        self._slots = []
+        self._slots_lock = threading.Lock()
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = None
+        self._last = (0.0, 0)
+        self._rate = None
+        self._width = 0
+        self._closed = False
+
+    # ---------- dipanggil dari loop ----------
+
+    def _slot(self):
+        slot = [0, 0]
+        with self._slots_lock:
+            self._slots.append(slot)
+        self._local.slot = slot
+        return slot
+
+    def advance(self, n=1):
+        """Tambah n item selesai (aman dari banyak thread)"""
+        try:
+            self._local.slot[0] += n
+        except AttributeError:
+            self._slot()[0] += n
+
+    def error(self, n=1):
+        """Tambah n error (item tetap dihitung lewat advance)"""
+        try:
+            self._local.slot[1] += n
+        except AttributeError:
+            self._slot()[1] += n
+
+    def update(self, done):
+        """Set jumlah selesai absolut (untuk loop satu penulis, misal byte download)"""
+        self._base = done
+
+    # ---------- sampling & render ----------
+
+    def counts(self):
+        """
+        Returns:
+            tuple: (done, errors) saat ini
+        """
+        done, errors = self._base, 0
+        for slot in list(self._slots):
+            done += slot[0]
+            errors += slot[1]
+        return done, errors
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {label, done, total, errors, elapsed_s, rate, eta_s, percent}
+        """
+        now = time.perf_counter()
+        done, errors = self.counts()
+        elapsed = now - self._start if self._start is not None else 0.0
+        last_time, last_done = self._last
+        if now > last_time and last_time:
+            current = (done - last_done) / (now - last_time)
+            self._rate = current if self._rate is None else \
+                RATE_SMOOTHING * current + (1 - RATE_SMOOTHING) * self._rate
+        elif self._rate is None and elapsed > 0:
+            self._rate = done / elapsed
+        self._last = (now, done)
+        rate = self._rate or 0.0
+        eta = None
+        if self.total and rate > 0:
+            eta = max(0.0, (self.total - done) / rate)
+        return {
+            'label': self.label,
+            'done': done,
+            'total': self.total,
+            'errors': errors,
+            'elapsed_s': round(elapsed, 2),
+            'rate': round(rate, 2),
+            'eta_s': round(eta, 1) if eta is not None else None,
+            'percent': round(done / self.total * 100, 1) if self.total else None
+        }
+
+    def _amount(self, value):
+        if self.unit == 'B':
+            return size_to_human(value)
+        return f"{value:,}"
+
+    def format(self, snap):
+        """Satu baris status untuk TTY"""
+        parts = [f"[*] {self.label}" if self.label else "[*]"]
+        if self.total:
+            parts.append(f"{self._amount(snap['done'])}/{self._amount(self.total)} ({snap['percent']:.1f}%)")
+        else:
+            parts.append(self._amount(snap['done']))
+        if self.unit == 'B':
+            parts.append(f"{size_to_human(snap['rate'])}/s")
+        else:
+            parts.append(f"{snap['rate']:,.1f} {self.unit}/s")
+        if snap['eta_s'] is not None:
+            parts.append(f"ETA {str(timedelta(seconds=int(snap['eta_s'])))}")
+        if snap['errors']:
+            parts.append(f"err {snap['errors']:,}")
+        return '  '.join(parts)
+
+    def render(self, final=False):
+        snap = self.snapshot()
+        try:
+            if self.mode == 'json':
+                event = {'event': 'done' if final else 'progress', 'ts': round(time.time(), 3), **snap}
+                self.stream.write(json.dumps(event) + '\n')
+            else:
+                line = self.format(snap)
+                # Spasi untuk menghapus sisa baris sebelumnya yang lebih panjang
+                pad = ' ' * max(0, self._width - len(line))
+                self._width = len(line)
+                self.stream.write(f"\r{line}{pad}" + ('\n' if final else ''))
+            self.stream.flush()
+        except (OSError, ValueError):
+            # Stream tertutup (pipe putus): progress berhenti, modul jalan terus
+            self.mode = 'off'
+        return snap
+
+    def clear(self):
+        """Hapus status line TTY (sebelum print baris hasil di tengah progress)"""
+        if self.mode != 'tty' or not self._width:
+            return
+        try:
+            self.stream.write('\r' + ' ' * self._width + '\r')
+            self.stream.flush()
+        except (OSError, ValueError):
+            self.mode = 'off'
+        self._width = 0
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.render()
+
+    # ---------- lifecycle ----------
+
+    def start(self):
+        self._start = time.perf_counter()
+        self._last = (self._start, 0)
+        if self.mode != 'off':
+            self._thread = threading.Thread(target=self._run, name='osxnt-progress', daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Stop ticker dan render baris akhir"""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.mode != 'off':
+            # Rate akhir = rata-rata seluruh proses
+            self._rate = None
+            self._last = (0.0, 0)
+            self.render(final=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def progress(total=None, label='', unit='item', **kwargs):
+    """Buat Progress dengan opsi bersama (belum di-start; pakai with)"""
+    return Progress(total=total, label=label, unit=unit, **kwargs)
@@ -3,8 +3,8 @@
 # Developed by alzzdevmaret
 
 import random
-import requests
 from lib.verbose import Verbose
+from lib.http import create_session, get_client
 
 class PortProxy:
     """
@@ -227,15 +227,11 @@ class PortProxy:
             # Untuk rotate, kita return session khusus
             return RotatingProxySession(self)
         
-        session = requests.Session()
-        
-        if proxy:
-            session.proxies = proxy['dict']
-        elif self.proxies:
+        if not proxy and self.proxies:
             proxy = self.get_random_proxy()
-            session.proxies = proxy['dict']
         
-        return session
+        # Session dengan pool + retry standar lib.http
+        return create_session(proxies=proxy['dict'] if proxy else None)
     
     def test_proxy(self, proxy, test_url='https://api.ipify.org', timeout=10):
         """
@@ -250,11 +246,11 @@ class PortProxy:
             bool: True jika proxy bekerja
         """
         try:
-            session = requests.Session()
-            session.proxies = proxy['dict']
-            session.timeout = timeout
+            # Tanpa retry: proxy mati harus cepat ketahuan
+            session = create_session(retries=0, proxies=proxy['dict'])
             
             r = session.get(test_url, timeout=timeout)
+            session.close()
             
             if r.status_code == 200:
                 self.v.log(f"✅ Proxy {proxy['ip']}:{proxy['port']} is working")
@@ -337,28 +333,26 @@ class RotatingProxySession:
             proxy_manager (PortProxy): Proxy manager instance
         """
         self.proxy_manager = proxy_manager
-        self.session = requests.Session()
+        # Client bersama; proxy dikirim per request (aman dipakai banyak thread)
+        self.session = get_client().session
     
-    def get(self, url, **kwargs):
-        """GET request dengan proxy random"""
+    def _with_proxy(self, kwargs):
         proxy = self.proxy_manager.get_random_proxy()
         if proxy:
-            self.session.proxies = proxy['dict']
-        return self.session.get(url, **kwargs)
+            kwargs['proxies'] = proxy['dict']
+        return kwargs
+    
+    def get(self, url, **kwargs):
+        """GET request dengan proxy random"""
+        return self.session.get(url, **self._with_proxy(kwargs))
     
     def post(self, url, data=None, **kwargs):
         """POST request dengan proxy random"""
-        proxy = self.proxy_manager.get_random_proxy()
-        if proxy:
-            self.session.proxies = proxy['dict']
-        return self.session.post(url, data=data, **kwargs)
+        return self.session.post(url, data=data, **self._with_proxy(kwargs))
     
     def request(self, method, url, **kwargs):
         """Request dengan proxy random"""
-        proxy = self.proxy_manager.get_random_proxy()
-        if proxy:
-            self.session.proxies = proxy['dict']
-        return self.session.request(method, url, **kwargs)
+        return self.session.request(method, url, **self._with_proxy(kwargs))
 
 
 # ========== CONTOH PENGGUNAAN ==========
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# OSXNT - Rate Limit Module
+# Batas koneksi paralel + jeda minimum per host (thread-safe)
+
+import time
+import threading
+from contextlib import contextmanager
+
+
+class HostLimiter:
+    """
+    Politeness per host untuk worker thread:
+    - max_per_host: jumlah request paralel maksimum ke satu host
+    - delay: jeda minimum (detik) antar request yang dimulai ke host yang sama
+
+    Key tidak harus hostname; bisa apa saja yang mewakili satu server
+    (misal nama WHOIS server).
+    """
+
+    def __init__(self, max_per_host=2, delay=0.0):
+        self.max_per_host = max(1, int(max_per_host))
+        self.delay = max(0.0, float(delay))
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._delays = {}
+        self._next_start = {}
+
+    def _semaphore(self, host):
+        with self._lock:
+            sem = self._slots.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_per_host)
+                self._slots[host] = sem
+            return sem
+
+    def set_delay(self, host, delay):
+        """Override jeda untuk satu host (misal dari robots.txt Crawl-delay)"""
+        with self._lock:
+            self._delays[host] = max(0.0, float(delay))
+
+    def get_delay(self, host):
+        with self._lock:
+            return self._delays.get(host, self.delay)
+
+    def acquire(self, host):
+        """Tunggu slot kosong + jadwal start berikutnya untuk host"""
+        self._semaphore(host).acquire()
+        with self._lock:
+            delay = self._delays.get(host, self.delay)
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + delay
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def release(self, host):
+        self._semaphore(host).release()
+
+    def defer(self, host, seconds):
+        """Mundurkan start berikutnya untuk host (misal setelah 429 / rate limit habis)"""
+        with self._lock:
+            now = time.monotonic()
+            self._next_start[host] = max(self._next_start.get(host, now), now + seconds)
+
+    @contextmanager
+    def slot(self, host):
+        """Context manager: with limiter.slot(host): ..."""
+        self.acquire(host)
+        try:
+            yield
+        finally:
+            self.release(host)
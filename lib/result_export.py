@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# OSXNT - Result Export Module
+# Export hasil scan ke format kolom: Parquet (pyarrow) atau SQLite ber-index
+
+import os
+import json
+import atexit
+import sqlite3
+import threading
+from datetime import datetime
+
+# pyarrow opsional; tanpa pyarrow export jatuh ke SQLite
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+# Baris yang dibuffer per tabel sebelum ditulis (satu transaksi / row group)
+BATCH_SIZE = 5000
+
+# Kolom bersama di semua tabel
+COMMON_COLUMNS = [('ts', 'TEXT'), ('module', 'TEXT'), ('target', 'TEXT')]
+
+TABLES = {
+    'ports': [('host', 'TEXT'), ('port', 'INTEGER'), ('protocol', 'TEXT'), ('service', 'TEXT')],
+    'subdomains': [('subdomain', 'TEXT'), ('ip', 'TEXT')],
+    'urls': [('url', 'TEXT'), ('category', 'TEXT'), ('status', 'TEXT')],
+    'hashes': [('input', 'TEXT'), ('algorithm', 'TEXT'), ('hash', 'TEXT')],
+    # Modul lain (iptrack, webtrack, dns, ptrsweep, email, ...): key + JSON record
+    'records': [('key', 'TEXT'), ('data', 'TEXT')]
+}
+
+INDEXES = {
+    'ports': [('port',), ('host', 'port')],
+    'subdomains': [('subdomain',), ('ip',)],
+    'urls': [('url',), ('category',)],
+    'hashes': [('hash',)],
+    'records': [('module', 'key')]
+}
+
+# Field yang dipakai sebagai key tabel records, urut prioritas
+RECORD_KEYS = ('query', 'domain', 'name', 'ip', 'email', 'url', 'subdomain', 'target')
+
+
+def _record_key(record, default):
+    if isinstance(record, dict):
+        for field in RECORD_KEYS:
+            value = record.get(field)
+            if value:
+                return str(value)
+    return default
+
+
+def _dumps(value):
+    return json.dumps(value, default=str, ensure_ascii=False, separators=(',', ':'))
+
+
+# ---------- hasil modul -> (tabel, row) ----------
+
+def _ports(target, result):
+    for r in result or []:
+        yield 'ports', {'host': r.get('host') or target, 'port': r.get('port'),
+                        'protocol': r.get('protocol') or 'tcp', 'service': r.get('service')}
+
+
+def _subdomains(target, result):
+    for r in result or []:
+        yield 'subdomains', {'subdomain': r.get('subdomain'), 'ip': r.get('ip')}
+
+
+def _urlextract(target, result):
+    for category, urls in (result or {}).get('categories', {}).items():
+        for url in urls:
+            yield 'urls', {'url': url, 'category': category, 'status': None}
+
+
+def _urlcheck(target, result):
+    for res_type, resources in (result or {}).get('resources', {}).items():
+        for res in resources:
+            yield 'urls', {'url': res.get('url'), 'category': res_type, 'status': res.get('status')}
+
+
+def _hashes(target, result):
+    rows = result if isinstance(result, list) else [result]
+    for r in rows:
+        if r:
+            yield 'hashes', r
+
+
+def _emails(target, result):
+    emails = result.get('emails', []) if isinstance(result, dict) else result
+    for r in emails or []:
+        yield 'records', {'key': r.get('email'), 'data': r}
+
+
+EXTRACTORS = {
+    'scanport': _ports,
+    'subdomain': _subdomains,
+    'urlextract': _urlextract,
+    'urlcheck': _urlcheck,
+    'hash': _hashes,
+    'email': _emails
+}
+
+
+def _records(target, result):
+    """Default: satu baris records per item (list) atau per hasil (dict)"""
+    items = result if isinstance(result, list) else [result]
+    for r in items:
+        if r is not None:
+            yield 'records', {'key': _record_key(r, target), 'data': r}
+
+
+def result_rows(module, target, result):
+    """
+    Pecah hasil modul jadi baris tabel.
+
+    Returns:
+        generator: (tabel, dict kolom) per baris
+    """
+    return EXTRACTORS.get(module, _records)(target, result)
+
+
+class ResultExporter:
+    """
+    Writer hasil scan ke format kolom.
+
+    - Parquet (kalo pyarrow ada): folder berisi <tabel>-<run>.parquet,
+      satu row group per batch; dibaca sebagai dataset oleh pandas/duckdb/spark.
+    - SQLite: tabel ports, subdomains, urls, hashes + records (JSON),
+      dengan index; insert per batch dalam satu transaksi.
+
+    Semua modul menulis lewat add_result(module, target, result).
+    """
+
+    def __init__(self, path, backend='auto', batch_size=BATCH_SIZE, verbose=False):
+        """
+        Args:
+            path (str): File .db/.sqlite/.sqlite3 (SQLite) atau folder Parquet
+            backend (str): 'auto', 'parquet' atau 'sqlite'
+            batch_size (int): Baris per tabel sebelum ditulis
+            verbose (bool): Mode verbose
+        """
+        # 'auto' jatuh ke SQLite karena pyarrow tidak ada (bukan karena path .db)
+        fallback = backend == 'auto' and not HAS_PYARROW and not path.lower().endswith(SQLITE_SUFFIXES)
+        if backend == 'auto':
+            backend = 'parquet' if HAS_PYARROW and not path.lower().endswith(SQLITE_SUFFIXES) else 'sqlite'
+        if backend == 'parquet' and not HAS_PYARROW:
+            raise ImportError("pyarrow tidak terinstall (pip install pyarrow)")
+        if backend == 'sqlite' and not path.lower().endswith(SQLITE_SUFFIXES):
+            path = os.path.splitext(path)[0] + '.sqlite'
+        if fallback:
+            print(f"[*] pyarrow tidak ada, export ke SQLite: {path}")
+
+        self.path = path
+        self.backend = backend
+        self.batch_size = max(1, batch_size)
+        self.verbose = verbose
+        self.ts = datetime.now().isoformat(timespec='seconds')
+        self.counts = {table: 0 for table in TABLES}
+        self._buffers = {table: [] for table in TABLES}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        if backend == 'sqlite':
+            self._open_sqlite()
+        else:
+            os.makedirs(path, exist_ok=True)
+            self._writers = {}
+            self._run = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    # ---------- SQLite ----------
+
+    def _open_sqlite(self):
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        self.db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        for table, columns in TABLES.items():
+            cols = ', '.join(f"{name} {kind}" for name, kind in COMMON_COLUMNS + columns)
+            self.db.execute(f"CREATE TABLE IF NOT EXISTS {table} ({cols})")
+            for index in INDEXES[table]:
+                self.db.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(index)} "
+                                f"ON {table} ({', '.join(index)})")
+        self._inserts = {
+            table: f"INSERT INTO {table} VALUES ({', '.join('?' * (len(COMMON_COLUMNS) + len(columns)))})"
+            for table, columns in TABLES.items()
+        }
+
+    def _write_sqlite(self, table, rows):
+        self.db.execute("BEGIN")
+        try:
+            self.db.executemany(self._inserts[table], rows)
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+
+    # ---------- Parquet ----------
+
+    def _schema(self, table):
+        types = {'TEXT': pa.string(), 'INTEGER': pa.int64()}
+        return pa.schema([(name, types[kind]) for name, kind in COMMON_COLUMNS + TABLES[table]])
+
+    def _write_parquet(self, table, rows):
+        writer = self._writers.get(table)
+        if writer is None:
+            schema = self._schema(table)
+            filename = os.path.join(self.path, f"{table}-{self._run}.parquet")
+            writer = pq.ParquetWriter(filename, schema, compression='zstd')
+            self._writers[table] = writer
+        columns = list(zip(*rows))
+        writer.write_table(pa.Table.from_arrays(
+            [pa.array(col, type=field.type) for col, field in zip(columns, writer.schema)],
+            schema=writer.schema))
+
+    # ---------- API ----------
+
+    def _row(self, table, module, target, record):
+        values = [self.ts, module, target]
+        for name, kind in TABLES[table]:
+            value = record.get(name)
+            if value is None:
+                values.append(None)
+            elif kind == 'INTEGER':
+                try:
+                    values.append(int(value))
+                except (TypeError, ValueError):
+                    values.append(None)
+            elif isinstance(value, str):
+                values.append(value)
+            else:
+                values.append(_dumps(value) if isinstance(value, (dict, list, tuple)) else str(value))
+        return tuple(values)
+
+    def add(self, table, records, module, target=None):
+        """
+        Tambah record (dict dengan kolom tabel) ke buffer tabel.
+
+        Args:
+            table (str): Nama tabel (lihat TABLES)
+            records (iterable): dict per baris
+            module (str): Nama modul
+            target (str): Target scan
+        """
+        if table not in TABLES:
+            raise ValueError(f"Tabel tidak dikenal: {table}")
+        rows = [self._row(table, module, target, r) for r in records]
+        with self._lock:
+            buffer = self._buffers[table]
+            buffer.extend(rows)
+            if len(buffer) >= self.batch_size:
+                self._flush_table(table)
+
+    def add_result(self, module, target, result):
+        """
+        Export hasil modul (format yang sama dengan yang disimpan ke -s).
+
+        Args:
+            module (str): scanport, subdomain, urlextract, urlcheck, hash, email, atau modul lain
+            target (str): Target scan
+            result: Hasil modul (list / dict)
+
+        Returns:
+            int: Jumlah baris yang ditambahkan
+        """
+        grouped = {}
+        for table, record in result_rows(module, target, result):
+            grouped.setdefault(table, []).append(record)
+        for table, records in grouped.items():
+            self.add(table, records, module, target)
+        return sum(len(r) for r in grouped.values())
+
+    def _flush_table(self, table):
+        rows = self._buffers[table]
+        if not rows:
+            return
+        self._buffers[table] = []
+        if self.backend == 'sqlite':
+            self._write_sqlite(table, rows)
+        else:
+            self._write_parquet(table, rows)
+        self.counts[table] += len(rows)
+
+    def flush(self):
+        with self._lock:
+            for table in TABLES:
+                self._flush_table(table)
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self.backend == 'sqlite':
+            self.db.execute("PRAGMA optimize")
+            self.db.close()
+        else:
+            for writer in self._writers.values():
+                writer.close()
+        total = sum(self.counts.values())
+        if total:
+            detail = ', '.join(f"{t} {n}" for t, n in self.counts.items() if n)
+            print(f"[+] {total} baris di-export ke {self.path} ({detail})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# Exporter bersama, diset sekali dari CLI (--export)
+_exporter = None
+
+
+def configure_export(path=None, backend='auto', batch_size=BATCH_SIZE, verbose=False):
+    """
+    Buat exporter bersama; path None = export nonaktif.
+
+    Returns:
+        ResultExporter: Exporter, None kalo nonaktif / gagal dibuka
+    """
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+        _exporter = None
+    if not path:
+        return None
+    try:
+        _exporter = ResultExporter(path, backend=backend, batch_size=batch_size, verbose=verbose)
+    except (OSError, ImportError, sqlite3.Error) as e:
+        print(f"[!] Gagal membuka export {path}: {e}")
+        return None
+    atexit.register(_exporter.close)
+    return _exporter
+
+
+def get_exporter():
+    """Exporter bersama (None kalo --export tidak dipakai)"""
+    return _exporter
+
+
+def export_result(module, target, result):
+    """Export hasil modul ke exporter bersama; no-op kalo export tidak aktif"""
+    if _exporter is None or not result:
+        return 0
+    try:
+        return _exporter.add_result(module, target, result)
+    except Exception as e:
+        print(f"[!] Gagal export {module}: {e}")
+        return 0
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# OSXNT - Scan History Module
+# Riwayat hasil scan per run di SQLite, plus diff antar run (port / subdomain baru, dll)
+
+import os
+import json
+import atexit
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from .lookup_cache import DEFAULT_CACHE_DIR
+from .result_export import result_rows
+
+HISTORY_NAME = 'history.sqlite3'
+
+# Record per transaksi saat ingest
+BATCH_SIZE = 5000
+
+# Field yang berubah tiap run tanpa arti (tidak ikut dibandingkan)
+VOLATILE_FIELDS = frozenset(('ts', 'timestamp', 'ttl', 'rtt_ms', 'nameserver', 'tcp', 'errors'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    module TEXT NOT NULL,
+    target TEXT,
+    command TEXT,
+    records INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_module_target ON runs (module, target, id);
+CREATE TABLE IF NOT EXISTS keys (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    UNIQUE (kind, key)
+);
+CREATE TABLE IF NOT EXISTS payloads (
+    id INTEGER PRIMARY KEY,
+    hash BLOB NOT NULL UNIQUE,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    run_id INTEGER NOT NULL,
+    key_id INTEGER NOT NULL,
+    payload_id INTEGER NOT NULL,
+    PRIMARY KEY (run_id, key_id)
+) WITHOUT ROWID;
+CREATE TEMP TABLE IF NOT EXISTS staging (kind TEXT, key TEXT, hash BLOB, data TEXT);
+"""
+
+# Ingest set-based: staging -> keys / payloads (intern) -> items (integer saja)
+INGEST_SQL = (
+    "INSERT OR IGNORE INTO keys (kind, key) SELECT kind, key FROM staging",
+    "INSERT OR IGNORE INTO payloads (hash, data) SELECT hash, data FROM staging",
+    "INSERT OR REPLACE INTO items SELECT ?, k.id, p.id FROM staging s "
+    "JOIN keys k ON k.kind = s.kind AND k.key = s.key JOIN payloads p ON p.hash = s.hash",
+    "DELETE FROM staging"
+)
+
+# Diff: semua query lewat primary key items (run_id, key_id), bandingkan id integer
+ADDED_SQL = """
+SELECT k.kind, k.key, p.data FROM items b
+JOIN keys k ON k.id = b.key_id
+JOIN payloads p ON p.id = b.payload_id
+WHERE b.run_id = ? AND NOT EXISTS (
+    SELECT 1 FROM items a WHERE a.run_id = ? AND a.key_id = b.key_id)
+ORDER BY k.kind, k.key
+"""
+
+CHANGED_SQL = """
+SELECT k.kind, k.key, pa.data, pb.data FROM items b
+JOIN items a ON a.run_id = ? AND a.key_id = b.key_id
+JOIN keys k ON k.id = b.key_id
+JOIN payloads pa ON pa.id = a.payload_id
+JOIN payloads pb ON pb.id = b.payload_id
+WHERE b.run_id = ? AND a.payload_id != b.payload_id
+ORDER BY k.kind, k.key
+"""
+
+
+def item_key(table, record):
+    """Identitas record antar run (port di host yang sama = record yang sama)"""
+    if table == 'ports':
+        return f"{record.get('host')}:{record.get('port')}/{record.get('protocol') or 'tcp'}"
+    if table == 'subdomains':
+        return str(record.get('subdomain'))
+    if table == 'urls':
+        return f"{record.get('category')} {record.get('url')}"
+    if table == 'hashes':
+        return f"{record.get('algorithm')}:{record.get('hash')}"
+    data = record.get('data')
+    key = str(record.get('key'))
+    if isinstance(data, dict) and data.get('type'):
+        key = f"{key}/{data['type']}"
+    return key
+
+
+def _stable(value):
+    """Buang field volatile di semua level (misal ttl per record DNS)"""
+    if isinstance(value, dict):
+        return {k: _stable(v) for k, v in value.items() if k not in VOLATILE_FIELDS}
+    if isinstance(value, list):
+        return [_stable(v) for v in value]
+    return value
+
+
+def item_payload(table, record):
+    """Isi record yang dibandingkan (records: data JSON-nya, tanpa field volatile)"""
+    data = _stable(record.get('data') if table == 'records' else record)
+    return json.dumps(data, default=str, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def field_changes(old, new):
+    """Field yang berbeda antara dua payload: {field: [lama, baru]}"""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return {'value': [old, new]}
+    return {k: [old.get(k), new.get(k)] for k in sorted(set(old) | set(new)) if old.get(k) != new.get(k)}
+
+
+class ScanHistory:
+    """
+    Riwayat run di SQLite.
+
+    - runs: satu baris per (modul, target) per eksekusi
+    - keys / payloads: identitas dan isi record disimpan sekali (intern ke id)
+    - items: (run, key_id) -> payload_id, tiga integer per record per run;
+      ratusan run dengan hasil yang hampir sama tidak menggandakan data
+    """
+
+    def __init__(self, path, verbose=False):
+        """
+        Args:
+            path (str): File SQLite
+            verbose (bool): Mode verbose
+        """
+        self.path = path
+        self.verbose = verbose
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self.db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._runs = {}
+        self.command = None
+
+    # ---------- ingest ----------
+
+    def start_run(self, module, target):
+        """
+        Returns:
+            int: id run baru
+        """
+        cursor = self.db.execute("INSERT INTO runs (ts, module, target, command) VALUES (?, ?, ?, ?)",
+                                 (datetime.now().isoformat(timespec='seconds'), module, target, self.command))
+        return cursor.lastrowid
+
+    def record(self, module, target, result):
+        """
+        Simpan hasil modul ke run (modul, target) milik proses ini; dipanggil
+        berulang (misal per batch bulk) tetap masuk ke run yang sama.
+
+        Returns:
+            int: Jumlah record yang disimpan
+        """
+        items = []
+        for table, row in result_rows(module, target, result):
+            payload = item_payload(table, row)
+            digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=12).digest()
+            items.append((table, item_key(table, row), digest, payload))
+        with self._lock:
+            run_id = self._runs.get((module, target))
+            if run_id is None:
+                run_id = self._runs[(module, target)] = self.start_run(module, target)
+            for i in range(0, len(items), BATCH_SIZE):
+                self.db.execute("BEGIN")
+                try:
+                    self.db.executemany("INSERT INTO staging VALUES (?, ?, ?, ?)", items[i:i + BATCH_SIZE])
+                    for sql in INGEST_SQL:
+                        self.db.execute(sql, (run_id,) if '?' in sql else ())
+                    self.db.execute("UPDATE runs SET records = "
+                                    "(SELECT COUNT(*) FROM items WHERE run_id = ?) WHERE id = ?",
+                                    (run_id, run_id))
+                    self.db.execute("COMMIT")
+                except Exception:
+                    self.db.execute("ROLLBACK")
+                    raise
+        return len(items)
+
+    # ---------- query ----------
+
+    def get_run(self, run_id):
+        row = self.db.execute("SELECT id, ts, module, target, command, records FROM runs WHERE id = ?",
+                              (run_id,)).fetchone()
+        if not row:
+            return None
+        return dict(zip(('id', 'ts', 'module', 'target', 'command', 'records'), row))
+
+    def runs(self, module=None, target=None, limit=20):
+        """
+        Returns:
+            list: Run terbaru dulu
+        """
+        sql = "SELECT id FROM runs"
+        params = []
+        where = []
+        if module:
+            where.append("module = ?")
+            params.append(module)
+        if target:
+            where.append("target = ?")
+            params.append(target)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return [self.get_run(r[0]) for r in self.db.execute(sql, params).fetchall()]
+
+    def previous_run(self, run_id):
+        """Run sebelumnya dengan modul + target yang sama"""
+        run = self.get_run(run_id)
+        if not run:
+            return None
+        row = self.db.execute("SELECT id FROM runs WHERE module = ? AND target IS ? AND id < ? "
+                              "ORDER BY id DESC LIMIT 1", (run['module'], run['target'], run_id)).fetchone()
+        return row[0] if row else None
+
+    def resolve(self, ref):
+        """
+        'last' / 'latest' = run terakhir, angka = id run
+
+        Returns:
+            int: id run, None kalo tidak ada
+        """
+        if str(ref).lower() in ('last', 'latest'):
+            row = self.db.execute("SELECT MAX(id) FROM runs").fetchone()
+            return row[0] if row else None
+        try:
+            run_id = int(ref)
+        except (TypeError, ValueError):
+            return None
+        return run_id if self.get_run(run_id) else None
+
+    def diff(self, old_id, new_id):
+        """
+        Bandingkan dua run.
+
+        Returns:
+            dict: {'old', 'new', 'added', 'removed', 'changed'}
+        """
+        added = [{'kind': k, 'key': key, 'data': json.loads(d)}
+                 for k, key, d in self.db.execute(ADDED_SQL, (new_id, old_id))]
+        removed = [{'kind': k, 'key': key, 'data': json.loads(d)}
+                   for k, key, d in self.db.execute(ADDED_SQL, (old_id, new_id))]
+        changed = []
+        for kind, key, old, new in self.db.execute(CHANGED_SQL, (old_id, new_id)):
+            old, new = json.loads(old), json.loads(new)
+            changed.append({'kind': kind, 'key': key, 'changes': field_changes(old, new), 'old': old, 'new': new})
+        return {'old': self.get_run(old_id), 'new': self.get_run(new_id),
+                'added': added, 'removed': removed, 'changed': changed}
+
+    def close(self):
+        with self._lock:
+            if self.db is None:
+                return
+            runs = [self.get_run(r) for r in self._runs.values()]
+            self.db.close()
+            self.db = None
+        for run in runs:
+            if run:
+                print(f"[+] Run #{run['id']} ({run['module']} {run['target']}) disimpan ke history: "
+                      f"{run['records']} record")
+
+
+def print_diff(diff, limit=50):
+    """Tampilkan hasil diff; limit baris per jenis perubahan (0 = semua)"""
+    old, new = diff['old'], diff['new']
+    print(f"[*] Diff run #{old['id']} ({old['ts']}) -> #{new['id']} ({new['ts']}) "
+          f"{new['module']} {new['target'] or ''}")
+    print(f"[*] +{len(diff['added'])} baru, -{len(diff['removed'])} hilang, ~{len(diff['changed'])} berubah")
+    for sign, entries in (('+', diff['added']), ('-', diff['removed']), ('~', diff['changed'])):
+        shown = entries if not limit else entries[:limit]
+        for entry in shown:
+            line = f"  [{sign}] {entry['kind']:<10} {entry['key']}"
+            if sign == '~':
+                line += '  ' + ', '.join(f"{f}: {a} -> {b}" for f, (a, b) in entry['changes'].items())
+            print(line)
+        if len(entries) > len(shown):
+            print(f"  [{sign}] ... dan {len(entries) - len(shown)} lagi")
+
+
+def flatten_diff(diff):
+    """Diff -> baris kolom tetap (untuk CSV / TXT)"""
+    rows = []
+    for change, entries in (('added', diff['added']), ('removed', diff['removed'])):
+        for entry in entries:
+            rows.append({'change': change, 'kind': entry['kind'], 'key': entry['key'],
+                         'detail': json.dumps(entry['data'], default=str, sort_keys=True)})
+    for entry in diff['changed']:
+        rows.append({'change': 'changed', 'kind': entry['kind'], 'key': entry['key'],
+                     'detail': json.dumps(entry['changes'], default=str, sort_keys=True)})
+    return rows
+
+
+# History bersama, diset dari CLI (--history / --history-db)
+_history = None
+_options = {}
+
+
+def configure_history(path=None, enabled=False, command=None, verbose=False):
+    """
+    Set opsi history bersama.
+
+    Args:
+        path (str): File SQLite (default: .osxnt_cache/history.sqlite3)
+        enabled (bool): True = hasil setiap modul disimpan per run
+        command (str): Command line run ini (disimpan di tabel runs)
+        verbose (bool): Mode verbose
+    """
+    global _history
+    if _history is not None:
+        _history.close()
+        _history = None
+    _options.clear()
+    _options.update(path=path or os.path.join(DEFAULT_CACHE_DIR, HISTORY_NAME), enabled=enabled,
+                    command=command, verbose=verbose)
+
+
+def history_path():
+    return _options.get('path') or os.path.join(DEFAULT_CACHE_DIR, HISTORY_NAME)
+
+
+def get_history():
+    """
+    Returns:
+        ScanHistory: History bersama (dibuka saat pertama dipanggil)
+    """
+    global _history
+    if _history is None:
+        _history = ScanHistory(history_path(), verbose=_options.get('verbose', False))
+        _history.command = _options.get('command')
+        atexit.register(_history.close)
+    return _history
+
+
+def record_result(module, target, result):
+    """
+    Simpan hasil modul ke history kalo --history aktif (no-op kalo tidak).
+    Hasil kosong tetap jadi run (0 record) supaya -diff menampilkan item yang hilang;
+    None (modul gagal) tidak dicatat.
+    """
+    if not _options.get('enabled') or result is None:
+        return 0
+    try:
+        return get_history().record(module, target, result)
+    except (sqlite3.Error, OSError) as e:
+        print(f"[!] Gagal menyimpan history {module}: {e}")
+        return 0
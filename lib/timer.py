@@ -4,18 +4,26 @@
 
 import time
 from datetime import timedelta
+from .metrics import span, stage
 
 class Timer:
-    """Simple timer untuk tracking execution time"""
+    """
+    Simple timer untuk tracking execution time.
+    Kalo metrics aktif (--profile), timer juga jadi span bernama self.name;
+    Timer di dalam Timer lain tercatat bertingkat.
+    """
     
     def __init__(self, name="Process"):
         self.name = name
         self.start_time = None
         self.end_time = None
+        self._span = None
     
     def start(self):
         """Start timer"""
         self.start_time = time.time()
+        self._span = stage(self.name)
+        self._span.__enter__()
         print(f"[*] {self.name} started...")
         return self
     
@@ -23,6 +31,9 @@ class Timer:
         """Stop timer"""
         if self.start_time:
             self.end_time = time.time()
+            if self._span is not None:
+                self._span.__exit__(None, None, None)
+                self._span = None
             elapsed = self.end_time - self.start_time
             print(f"[+] {self.name} completed in {self.format_time(elapsed)}")
             return elapsed
@@ -50,7 +61,8 @@ def measure_time(func):
     """Decorator untuk measure function execution time"""
     def wrapper(*args, **kwargs):
         start = time.time()
-        result = func(*args, **kwargs)
+        with span(func.__name__):
+            result = func(*args, **kwargs)
         end = time.time()
         print(f"[i] {func.__name__} took {end-start:.2f} seconds")
         return result
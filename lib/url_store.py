@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# OSXNT - URL Store Module
+# Tabel URL ter-dedupe dengan counter, hemat memori untuk crawl besar
+
+import json
+from array import array
+from urllib.parse import urlsplit
+
+NO_CATEGORY = 0xFF
+
+
+def _netloc(url):
+    """Ambil host[:port] dari URL, fast path untuk scheme://host/..."""
+    pos = url.find('://')
+    if pos > 0:
+        rest = url[pos + 3:]
+        end = len(rest)
+        for sep in '/?#':
+            i = rest.find(sep)
+            if i != -1 and i < end:
+                end = i
+        netloc = rest[:end]
+        if '@' in netloc:
+            netloc = netloc.rsplit('@', 1)[1]
+        return netloc
+    try:
+        return urlsplit(url).netloc
+    except ValueError:
+        return ''
+
+
+class URLStore:
+    """
+    Tabel URL untuk crawler: setiap URL unik disimpan sekali dan diberi id.
+
+    Per URL disimpan (dalam array kompak, bukan dict per URL):
+    - kategori (internal/external/static/...)
+    - domain (id ke tabel domain, dihitung sekali saat insert)
+    - tipe tag pertama (a/link/script/image/...)
+    - hits: jumlah kemunculan total
+    - pages: jumlah halaman sumber yang berbeda
+    - first_source: id halaman tempat URL pertama kali ditemukan
+    """
+
+    def __init__(self, categories):
+        """
+        Args:
+            categories (list): Nama kategori, urutannya dipertahankan di output
+        """
+        self.categories = list(categories)
+        self._cat_index = {name: i for i, name in enumerate(self.categories)}
+        self._ids = {}
+        self._urls = []
+        self._category = array('B')
+        self._domain = array('I')
+        self._kind = array('B')
+        self._hits = array('I')
+        self._pages = array('I')
+        self._first_source = array('i')
+        self._last_source = array('i')
+        self._domains = []
+        self._domain_ids = {}
+        self._kinds = ['']
+        self._kind_ids = {'': 0}
+        self.occurrences = 0
+
+    def __len__(self):
+        return len(self._urls)
+
+    def __contains__(self, url):
+        return url in self._ids
+
+    def _intern_domain(self, url):
+        domain = _netloc(url)
+        domain_id = self._domain_ids.get(domain)
+        if domain_id is None:
+            domain_id = len(self._domains)
+            self._domains.append(domain)
+            self._domain_ids[domain] = domain_id
+        return domain_id
+
+    def _intern_kind(self, kind):
+        kind_id = self._kind_ids.get(kind)
+        if kind_id is None:
+            kind_id = len(self._kinds)
+            self._kinds.append(kind)
+            self._kind_ids[kind] = kind_id
+        return kind_id
+
+    def intern(self, url):
+        """Dapatkan id URL (insert tanpa kategori kalo belum ada)"""
+        url_id = self._ids.get(url)
+        if url_id is None:
+            url_id = len(self._urls)
+            self._ids[url] = url_id
+            self._urls.append(url)
+            self._category.append(NO_CATEGORY)
+            self._domain.append(self._intern_domain(url))
+            self._kind.append(0)
+            self._hits.append(0)
+            self._pages.append(0)
+            self._first_source.append(-1)
+            self._last_source.append(-1)
+        return url_id
+
+    def add(self, url, category, source=-1, kind=''):
+        """
+        Catat satu kemunculan URL.
+
+        Args:
+            url (str): URL yang ditemukan
+            category (str): Kategori URL
+            source (int): id halaman sumber (dari intern())
+            kind (str): Tipe tag (a, link, script, image, ...)
+
+        Returns:
+            int: id URL
+        """
+        url_id = self.intern(url)
+        self.occurrences += 1
+        self._hits[url_id] += 1
+
+        if self._category[url_id] == NO_CATEGORY:
+            self._category[url_id] = self._cat_index[category]
+            self._kind[url_id] = self._intern_kind(kind)
+        if self._first_source[url_id] == -1:
+            self._first_source[url_id] = source
+        # Link satu halaman dicatat berurutan, cukup bandingkan sumber terakhir
+        if self._last_source[url_id] != source:
+            self._last_source[url_id] = source
+            self._pages[url_id] += 1
+        return url_id
+
+    def urls_in(self, category):
+        """List URL unik dalam satu kategori (urutan insert)"""
+        cat = self._cat_index[category]
+        urls = self._urls
+        return [urls[i] for i, c in enumerate(self._category) if c == cat]
+
+    def by_category(self):
+        """dict kategori -> list URL unik"""
+        result = {name: [] for name in self.categories}
+        urls = self._urls
+        for i, cat in enumerate(self._category):
+            if cat != NO_CATEGORY:
+                result[self.categories[cat]].append(urls[i])
+        return result
+
+    def counts_by_category(self):
+        """dict kategori -> jumlah URL unik"""
+        counts = [0] * len(self.categories)
+        for cat in self._category:
+            if cat != NO_CATEGORY:
+                counts[cat] += 1
+        return {name: counts[i] for i, name in enumerate(self.categories)}
+
+    def counts_by_domain(self):
+        """dict domain -> jumlah URL unik, urut terbanyak"""
+        counts = [0] * len(self._domains)
+        for i, cat in enumerate(self._category):
+            if cat != NO_CATEGORY:
+                counts[self._domain[i]] += 1
+        pairs = [(self._domains[i], n) for i, n in enumerate(counts) if n and self._domains[i]]
+        pairs.sort(key=lambda x: x[1], reverse=True)
+        return dict(pairs)
+
+    def record(self, url_id):
+        """Record lengkap satu URL"""
+        cat = self._category[url_id]
+        source = self._first_source[url_id]
+        return {
+            'id': url_id,
+            'url': self._urls[url_id],
+            'category': self.categories[cat] if cat != NO_CATEGORY else None,
+            'domain': self._domains[self._domain[url_id]],
+            'type': self._kinds[self._kind[url_id]],
+            'hits': self._hits[url_id],
+            'pages': self._pages[url_id],
+            'first_source': self._urls[source] if source >= 0 else None
+        }
+
+    def records(self):
+        """Generator semua record yang punya kategori"""
+        for url_id, cat in enumerate(self._category):
+            if cat != NO_CATEGORY:
+                yield self.record(url_id)
+
+    def export_jsonl(self, filename):
+        """
+        Export semua URL ke JSON Lines (satu record per baris, streaming).
+
+        Returns:
+            int: Jumlah record yang ditulis
+        """
+        count = 0
+        with open(filename, 'w', encoding='utf-8') as f:
+            for rec in self.records():
+                f.write(json.dumps(rec, ensure_ascii=False))
+                f.write('\n')
+                count += 1
+        return count
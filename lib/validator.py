@@ -6,21 +6,58 @@ import re
 import ipaddress
 from urllib.parse import urlparse
 
-def is_valid_ip(ip):
-    """Check if string is valid IP address"""
+# Pattern di-compile sekali; dipanggil per baris di list target / email besar
+DOMAIN_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}$')
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# IPv4 tanpa exception: oktet 0-255, tanpa nol di depan (sama dengan ipaddress)
+_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+IPV4_RE = re.compile(rf'{_OCTET}(?:\.{_OCTET}){{3}}')
+
+# Karakter yang mungkin ada di IPv6 (sebelum %scope); selain ini langsung ditolak
+IPV6_CHARS_RE = re.compile(r'[0-9a-fA-F:.]+')
+
+INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Satu pass translate untuk semua karakter tidak aman. Nama ASCII (mayoritas)
+# lewat bytes.translate: str.translate lookup dict per karakter, lebih lambat
+UNSAFE_FILENAME_CHARS = '<>:"/\\|?* '
+UNSAFE_FILENAME_TABLE = str.maketrans(UNSAFE_FILENAME_CHARS, '_' * len(UNSAFE_FILENAME_CHARS))
+UNSAFE_FILENAME_BYTES = bytes.maketrans(UNSAFE_FILENAME_CHARS.encode(), b'_' * len(UNSAFE_FILENAME_CHARS))
+
+
+def _is_ipv6(ip):
+    if IPV6_CHARS_RE.fullmatch(ip.split('%', 1)[0]) is None:
+        return False
     try:
-        ipaddress.ip_address(ip)
+        ipaddress.IPv6Address(ip)
         return True
-    except:
+    except ValueError:
         return False
 
+
+def is_valid_ip(ip):
+    """Check if string is valid IP address"""
+    if not isinstance(ip, str):
+        # int / bytes: biarkan ipaddress yang menentukan
+        try:
+            ipaddress.ip_address(ip)
+            return True
+        except ValueError:
+            return False
+    if ':' in ip:
+        return _is_ipv6(ip)
+    return IPV4_RE.fullmatch(ip) is not None
+
 def is_valid_domain(domain):
     """Check if string is valid domain name"""
-    pattern = r'^[a-zA-Z0-9][a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, domain) is not None
+    return DOMAIN_RE.match(domain) is not None
 
 def is_valid_url(url):
     """Check if string is valid URL"""
+    # Tanpa '//' urlparse tidak pernah mengisi netloc
+    if isinstance(url, str) and '//' not in url:
+        return False
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -29,8 +66,7 @@ def is_valid_url(url):
 
 def is_valid_email(email):
     """Check if string is valid email"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_RE.match(email) is not None
 
 def is_valid_port(port):
     """Check if port number is valid"""
@@ -42,9 +78,8 @@ def is_valid_port(port):
 
 def is_valid_filename(filename):
     """Check if filename is valid"""
-    # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    return not any(c in invalid_chars for c in filename)
+    # Tidak boleh ada karakter invalid
+    return INVALID_FILENAME_RE.search(filename) is None
 
 def validate_input(input_str, input_type='any'):
     """Validate input based on type"""
@@ -56,21 +91,91 @@ def validate_input(input_str, input_type='any'):
         'port': is_valid_port,
         'filename': is_valid_filename
     }
-    
+
     if input_type in validators:
         return validators[input_type](input_str)
     return True  # 'any' always valid
 
+def classify(value):
+    """
+    Tentukan jenis satu input.
+
+    Returns:
+        str: 'ipv4', 'ipv6', 'url', 'email', 'domain', atau None kalo tidak valid
+    """
+    if not value:
+        return None
+    if '://' in value:
+        return 'url' if is_valid_url(value) else None
+    if '@' in value:
+        return 'email' if EMAIL_RE.match(value) is not None else None
+    if ':' in value:
+        return 'ipv6' if _is_ipv6(value) else None
+    if value[0].isdigit() and IPV4_RE.fullmatch(value) is not None:
+        return 'ipv4'
+    if DOMAIN_RE.match(value) is not None:
+        return 'domain'
+    return None
+
+def _check(kind):
+    """Validator per kind untuk validate_many -> fungsi value -> label / None"""
+    if kind == 'auto':
+        return classify
+    if kind == 'ip':
+        def check(value):
+            if ':' in value:
+                return 'ipv6' if _is_ipv6(value) else None
+            return 'ipv4' if IPV4_RE.fullmatch(value) is not None else None
+        return check
+    if kind == 'ipv4':
+        return lambda value: 'ipv4' if IPV4_RE.fullmatch(value) is not None else None
+    if kind == 'ipv6':
+        return lambda value: 'ipv6' if ':' in value and _is_ipv6(value) else None
+    validators = {
+        'domain': is_valid_domain,
+        'url': is_valid_url,
+        'email': is_valid_email,
+        'port': is_valid_port,
+        'filename': is_valid_filename
+    }
+    if kind not in validators:
+        raise ValueError(f"Jenis validasi tidak dikenal: {kind}")
+    func = validators[kind]
+    return lambda value: kind if func(value) else None
+
+def validate_many(iterable, kind='auto', skip_blank=True):
+    """
+    Validasi / klasifikasi banyak input dalam satu pass (lazy).
+
+    Args:
+        iterable: Iterable string, misal file handle list target / email
+        kind (str): 'auto' (klasifikasi ipv4/ipv6/url/email/domain), 'ip', 'ipv4',
+                    'ipv6', 'domain', 'url', 'email', 'port', 'filename'
+        skip_blank (bool): Lewati baris kosong dan komentar '#'
+
+    Yields:
+        tuple: (value, label) - value sudah di-strip, label None kalo tidak valid
+
+    Raises:
+        ValueError: kind tidak dikenal
+    """
+    check = _check(kind)
+    for value in iterable:
+        value = value.strip()
+        if skip_blank and (not value or value[0] == '#'):
+            continue
+        yield value, check(value)
+
 def sanitize_filename(filename):
     """Sanitize filename (remove unsafe characters)"""
     # Replace unsafe chars with underscore
-    unsafe = '<>:"/\\|?* '
-    for char in unsafe:
-        filename = filename.replace(char, '_')
-    return filename
+    if filename.isascii():
+        return filename.encode('ascii').translate(UNSAFE_FILENAME_BYTES).decode('ascii')
+    return filename.translate(UNSAFE_FILENAME_TABLE)
 
 # Contoh penggunaan
 if __name__ == "__main__":
     print(is_valid_ip("8.8.8.8"))  # True
     print(is_valid_domain("google.com"))  # True
     print(is_valid_email("test@example.com"))  # True
+    print(list(validate_many(["8.8.8.8", "::1", "google.com", "https://x.id", "a@b.co", "???"])))
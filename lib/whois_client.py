@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+# OSXNT - WHOIS / RDAP Client Module
+# Client WHOIS (port 43) + RDAP bawaan: cache server per TLD, referral, rate limit per server
+
+import re
+import socket
+import ipaddress
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from .ratelimit import HostLimiter
+from .lookup_cache import get_lookup_cache, MISS
+
+IANA_WHOIS = 'whois.iana.org'
+WHOIS_PORT = 43
+RDAP_BOOTSTRAP_URL = 'https://data.iana.org/rdap/dns.json'
+
+# Server registry yang sering dipakai (tanpa perlu tanya IANA)
+KNOWN_SERVERS = {
+    'com': 'whois.verisign-grs.com',
+    'net': 'whois.verisign-grs.com',
+    'org': 'whois.pir.org',
+    'info': 'whois.nic.info',
+    'io': 'whois.nic.io',
+    'id': 'whois.id',
+    'co': 'whois.nic.co',
+    'me': 'whois.nic.me',
+    'uk': 'whois.nic.uk',
+    'de': 'whois.denic.de',
+    'nl': 'whois.domain-registry.nl',
+    'au': 'whois.auda.org.au'
+}
+
+# Format query khusus per server (default: "<domain>\r\n")
+QUERY_FORMATS = {
+    'whois.verisign-grs.com': 'domain {domain}\r\n',
+    'whois.denic.de': '-T dn,ace {domain}\r\n'
+}
+
+# Label second-level umum di bawah ccTLD (co.uk, com.au, co.id, ac.id, ...)
+SECOND_LEVEL_LABELS = {'ac', 'co', 'com', 'edu', 'gov', 'go', 'net', 'or', 'org', 'web', 'mil',
+                       'sch', 'ne', 'gob', 'nom', 'ltd', 'plc', 'my', 'biz', 'info'}
+
+# Umur cache mapping TLD -> server / bootstrap RDAP (detik)
+SERVER_TTL = 30 * 86400
+BOOTSTRAP_TTL = 7 * 86400
+
+# Batas ukuran response WHOIS (byte)
+MAX_RESPONSE = 1024 * 1024
+
+# Baris "Key: value" (dikompilasi sekali)
+LINE_RE = re.compile(r'^\s*([A-Za-z][\w /().\'-]{0,60}?)\s*\.*:\s*(.*?)\s*$')
+NOT_FOUND_RE = re.compile(
+    r'^[%#\s]*(no match|not found|no data found|no entries found|domain not found|'
+    r'status:\s*(free|available)|the queried object does not exist)', re.I | re.M)
+
+LIST_FIELDS = ('name_servers', 'emails')
+
+# Nama field dari berbagai registry -> field hasil (key sudah lowercase)
+FIELD_MAP = {}
+for _field, _names in {
+    'registrar': ('registrar', 'registrar name', 'sponsoring registrar', 'registrar organization',
+                  'registrar organisation'),
+    'creation_date': ('creation date', 'created', 'created on', 'created date', 'registered on',
+                      'registered', 'registration time', 'domain registration date',
+                      'domain record activated', 'registration date'),
+    'expiration_date': ('registry expiry date', 'registrar registration expiration date',
+                        'expiration date', 'expiry date', 'expires', 'expires on', 'expire date',
+                        'paid-till', 'expiration time', 'domain expiration date', 'renewal date'),
+    'updated_date': ('updated date', 'last updated', 'last modified', 'changed', 'last-update',
+                     'modified', 'last updated on', 'domain record last updated'),
+    'name_servers': ('name server', 'nameserver', 'nameservers', 'name servers', 'nserver'),
+    'emails': ('registrar abuse contact email', 'registrant email', 'admin email', 'tech email',
+               'e-mail', 'email', 'abuse-mailbox'),
+    'org': ('registrant organization', 'registrant organisation', 'org', 'organization',
+            'organisation', 'registrant', 'owner', 'holder'),
+    'country': ('registrant country', 'registrant country/economy', 'country'),
+    '_referral': ('registrar whois server', 'whois server', 'whois', 'refer', 'referralserver')
+}.items():
+    for _name in _names:
+        FIELD_MAP[_name] = _field
+del _field, _names, _name
+
+RESULT_FIELDS = ('registrar', 'creation_date', 'expiration_date', 'updated_date',
+                 'name_servers', 'emails', 'org', 'country')
+
+
+def _empty_result():
+    result = dict.fromkeys(RESULT_FIELDS)
+    result['name_servers'] = []
+    result['emails'] = []
+    return result
+
+
+def parse_whois(text):
+    """
+    Parse response WHOIS teks.
+
+    Returns:
+        dict: Field RESULT_FIELDS + '_referral' (server WHOIS berikutnya, kalo ada)
+    """
+    result = _empty_result()
+    result['_referral'] = None
+    block = None
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith(('%', '#', '>>>')):
+            block = None
+            continue
+        match = LINE_RE.match(line)
+        if match is None:
+            # Format blok (.uk, .nl): "Name servers:" lalu nilainya di baris berikut
+            if block and line[:1].isspace():
+                value = line.strip()
+                if block in LIST_FIELDS:
+                    value = value.split()[0].lower().rstrip('.')
+                    if value not in result[block]:
+                        result[block].append(value)
+                else:
+                    if result[block] is None:
+                        result[block] = value
+                    block = None
+            continue
+        field = FIELD_MAP.get(match.group(1).lower())
+        value = match.group(2)
+        block = field if field and not value else None
+        if field is None or not value:
+            continue
+        if field in LIST_FIELDS:
+            if field == 'name_servers':
+                value = value.split()[0].lower().rstrip('.')
+            if value not in result[field]:
+                result[field].append(value)
+        elif result[field] is None:
+            result[field] = value
+    return result
+
+
+def _vcard(entity):
+    """vcardArray RDAP -> dict {fn, org, email, country}"""
+    card = {}
+    try:
+        properties = entity.get('vcardArray', [None, []])[1]
+    except (IndexError, TypeError):
+        return card
+    for prop in properties:
+        if len(prop) < 4:
+            continue
+        name, params, value = prop[0], prop[1] or {}, prop[3]
+        if name in ('fn', 'org', 'email') and name not in card:
+            card[name] = value[0] if isinstance(value, list) else value
+        elif name == 'adr' and 'country' not in card:
+            if params.get('cc'):
+                card['country'] = params['cc']
+            elif isinstance(value, list) and value and value[-1]:
+                card['country'] = value[-1]
+    return card
+
+
+def parse_rdap(data):
+    """
+    Parse response RDAP (JSON domain object).
+
+    Returns:
+        dict: Field RESULT_FIELDS
+    """
+    result = _empty_result()
+    events = {e.get('eventAction'): e.get('eventDate') for e in data.get('events', [])}
+    result['creation_date'] = events.get('registration')
+    result['expiration_date'] = events.get('expiration')
+    result['updated_date'] = events.get('last changed')
+    result['name_servers'] = [ns['ldhName'].lower().rstrip('.')
+                              for ns in data.get('nameservers', []) if ns.get('ldhName')]
+
+    entities = list(data.get('entities', []))
+    while entities:
+        entity = entities.pop()
+        entities.extend(entity.get('entities', []))
+        roles = entity.get('roles', [])
+        card = _vcard(entity)
+        if 'registrar' in roles and not result['registrar']:
+            result['registrar'] = card.get('fn') or card.get('org')
+        if 'registrant' in roles:
+            result['org'] = result['org'] or card.get('org') or card.get('fn')
+            result['country'] = result['country'] or card.get('country')
+        if card.get('email') and card['email'] not in result['emails']:
+            result['emails'].append(card['email'])
+    return result
+
+
+def registrable_domain(name):
+    """
+    Potong hostname / URL jadi domain terdaftar (www.example.co.id -> example.co.id).
+    Tanpa public suffix list: dua label terakhir, atau tiga kalo second-level
+    umum di bawah ccTLD.
+
+    Returns:
+        tuple: (domain, certain) - certain False kalo batasnya tebakan
+               (IP, satu label, atau second-level pendek yang tidak dikenal)
+    """
+    name = name.strip().lower()
+    if '://' in name:
+        name = urlsplit(name).hostname or ''
+    name = name.rstrip('.')
+    try:
+        ipaddress.ip_address(name)
+        return name, False
+    except ValueError:
+        pass
+    labels = [label for label in name.split('.') if label]
+    if len(labels) < 2:
+        return name, False
+    if len(labels) == 2:
+        return '.'.join(labels), True
+    tld, sld = labels[-1], labels[-2]
+    if len(tld) == 2 and sld in SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:]), True
+    # ccTLD dengan second-level pendek yang tidak dikenal: bisa jadi suffix juga
+    return '.'.join(labels[-2:]), not (len(tld) == 2 and len(sld) <= 3)
+
+
+def _split_server(server, default_port):
+    host, sep, port = server.rpartition(':')
+    if sep and port.isdigit() and host and ']' not in port:
+        return host, int(port)
+    return server, default_port
+
+
+class WhoisClient:
+    """
+    Client WHOIS / RDAP.
+
+    - TLD -> server WHOIS dari IANA (whois.iana.org), di-cache di lookup cache
+    - RDAP kalo TLD ada di bootstrap IANA (dns.json, di-cache), lewat session
+      HTTP bersama (keep-alive); fallback ke WHOIS port 43 kalo gagal
+    - referral registry -> registrar diikuti (maks `max_referrals`)
+    - rate limit per server: HostLimiter(max_per_server, delay)
+    """
+
+    def __init__(self, timeout=10, delay=0.5, max_per_server=2, rdap=True, max_referrals=1,
+                 iana_server=IANA_WHOIS, whois_port=WHOIS_PORT, bootstrap_url=RDAP_BOOTSTRAP_URL,
+                 servers=None):
+        """
+        Args:
+            timeout (float): Timeout koneksi / baca (detik)
+            delay (float): Jeda minimum antar query ke server yang sama
+            max_per_server (int): Query paralel maksimum per server
+            rdap (bool): Coba RDAP dulu kalo TLD mendukung
+            max_referrals (int): Jumlah referral WHOIS yang diikuti
+            iana_server (str): Server WHOIS IANA ("host" atau "host:port")
+            whois_port (int): Port default server WHOIS
+            bootstrap_url (str): URL bootstrap RDAP IANA
+            servers (dict): Override TLD -> server WHOIS
+        """
+        self.timeout = timeout
+        self.rdap = rdap
+        self.max_referrals = max_referrals
+        self.iana_server = iana_server
+        self.whois_port = whois_port
+        self.bootstrap_url = bootstrap_url
+        self.limiter = HostLimiter(max_per_host=max_per_server, delay=delay)
+        self.servers = dict(KNOWN_SERVERS)
+        self.servers.update(servers or {})
+        self._rdap_bases = None
+        self._lock = threading.Lock()
+        self._tld_locks = {}
+        self.stats = {'whois': 0, 'rdap': 0, 'iana': 0, 'referrals': 0, 'errors': 0}
+
+    # ---------- server ----------
+
+    def query(self, server, text):
+        """
+        Kirim satu query WHOIS (port 43) dan baca sampai server menutup koneksi.
+
+        Returns:
+            str: Response
+        """
+        host, port = _split_server(server, self.whois_port)
+        chunks = []
+        size = 0
+        with self.limiter.slot(server):
+            with socket.create_connection((host, port), timeout=self.timeout) as sock:
+                sock.sendall(text.encode('utf-8'))
+                while size < MAX_RESPONSE:
+                    chunk = sock.recv(16384)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+        return b''.join(chunks).decode('utf-8', 'replace')
+
+    def whois_server(self, tld):
+        """
+        Server WHOIS untuk TLD (static map -> lookup cache -> tanya IANA).
+
+        Returns:
+            str: Server, None kalo TLD tidak punya WHOIS
+        """
+        tld = tld.lower()
+        server = self.servers.get(tld)
+        if server:
+            return server
+        # Satu query IANA per TLD walaupun banyak thread miss bersamaan
+        with self._lock:
+            tld_lock = self._tld_locks.setdefault(tld, threading.Lock())
+        with tld_lock:
+            server = self.servers.get(tld)
+            if server:
+                return server
+            cache = get_lookup_cache()
+            server = cache.get('whois-server', tld)
+            if server is MISS:
+                self.stats['iana'] += 1
+                server = parse_whois(self.query(self.iana_server, f"{tld}\r\n"))['_referral']
+                cache.set('whois-server', tld, server, SERVER_TTL if server else None)
+            if server:
+                self.servers[tld] = server
+        return server
+
+    def rdap_base(self, tld):
+        """
+        Base URL RDAP untuk TLD dari bootstrap IANA.
+
+        Returns:
+            str: Base URL (diakhiri '/'), None kalo tidak ada
+        """
+        if self._rdap_bases is None:
+            with self._lock:
+                if self._rdap_bases is None:
+                    self._rdap_bases = self._load_bootstrap()
+        return self._rdap_bases.get(tld.lower())
+
+    def _load_bootstrap(self):
+        cache = get_lookup_cache()
+        bases = cache.get('rdap-bootstrap', self.bootstrap_url)
+        if bases is not MISS:
+            return bases or {}
+        bases = {}
+        try:
+            from .http import get_client
+            data = get_client().get(self.bootstrap_url, timeout=self.timeout).json()
+            for tlds, urls in data.get('services', []):
+                urls = sorted(urls, key=lambda u: not u.startswith('https'))
+                if not urls:
+                    continue
+                base = urls[0] if urls[0].endswith('/') else urls[0] + '/'
+                for tld in tlds:
+                    bases[tld.lower()] = base
+        except Exception:
+            # Tanpa bootstrap: WHOIS saja
+            cache.set('rdap-bootstrap', self.bootstrap_url, {}, 3600)
+            return {}
+        cache.set('rdap-bootstrap', self.bootstrap_url, bases, BOOTSTRAP_TTL)
+        return bases
+
+    # ---------- lookup ----------
+
+    def lookup_rdap(self, domain, base):
+        from .http import get_client
+        url = f"{base}domain/{domain}"
+        server = urlsplit(base).netloc
+        with self.limiter.slot(server):
+            response = get_client().get(url, timeout=self.timeout,
+                                        headers={'Accept': 'application/rdap+json'})
+        self.stats['rdap'] += 1
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        result = parse_rdap(response.json())
+        result['whois_server'] = server
+        return result
+
+    def lookup_whois(self, domain):
+        tld = domain.rsplit('.', 1)[-1]
+        server = self.whois_server(tld)
+        if not server:
+            raise ValueError(f"Tidak ada server WHOIS untuk .{tld}")
+
+        result = None
+        for hop in range(self.max_referrals + 1):
+            fmt = QUERY_FORMATS.get(_split_server(server, self.whois_port)[0], '{domain}\r\n')
+            try:
+                text = self.query(server, fmt.format(domain=domain))
+            except OSError:
+                if result is None:
+                    raise
+                # Registrar tidak bisa dihubungi: pakai data registry saja
+                self.stats['errors'] += 1
+                break
+            self.stats['whois'] += 1
+            if NOT_FOUND_RE.search(text):
+                return result
+            parsed = parse_whois(text)
+            parsed['whois_server'] = server
+            if result is None:
+                result = parsed
+            else:
+                # Data registrar lebih lengkap; field kosong diisi dari registry
+                for key, value in parsed.items():
+                    if value:
+                        result[key] = value
+            referral = parsed.pop('_referral', None)
+            if not referral or referral.lower() == server.lower() or hop == self.max_referrals:
+                break
+            referral = referral.split('://')[-1].rstrip('/')
+            self.stats['referrals'] += 1
+            server = referral
+        if result is not None:
+            result.pop('_referral', None)
+        return result
+
+    def lookup(self, domain):
+        """
+        WHOIS satu domain (RDAP dulu kalo bisa).
+
+        Returns:
+            dict: Field RESULT_FIELDS + whois_server, None kalo domain tidak terdaftar
+        """
+        domain = registrable_domain(domain)[0]
+        try:
+            domain = domain.encode('idna').decode('ascii')
+        except UnicodeError:
+            pass
+        tld = domain.rsplit('.', 1)[-1]
+        if self.rdap:
+            base = self.rdap_base(tld)
+            if base:
+                try:
+                    return self.lookup_rdap(domain, base)
+                except Exception:
+                    self.stats['errors'] += 1
+        return self.lookup_whois(domain)
+
+    def server_key(self, domain):
+        """Key pacing untuk domain: server RDAP / WHOIS yang akan dipakai"""
+        tld = registrable_domain(domain)[0].rsplit('.', 1)[-1]
+        if self.rdap:
+            base = self.rdap_base(tld)
+            if base:
+                return urlsplit(base).netloc
+        return self.servers.get(tld) or tld
+
+    def lookup_many(self, domains, workers=8):
+        """
+        WHOIS banyak domain paralel (rate limit per server tetap berlaku).
+
+        Returns:
+            dict: domain -> hasil (None kalo tidak terdaftar / gagal)
+        """
+        def one(domain):
+            try:
+                return self.lookup(domain)
+            except Exception:
+                self.stats['errors'] += 1
+                return None
+
+        domains = list(domains)
+        if not domains:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(domains))) as pool:
+            return dict(zip(domains, pool.map(one, domains)))
+
+
+# ========== CLIENT BERSAMA ==========
+
+_client = None
+_client_lock = threading.Lock()
+_options = {}
+
+
+def configure_whois(**options):
+    """Set opsi WhoisClient bersama (timeout, delay, rdap, ...)"""
+    global _client
+    with _client_lock:
+        _client = None
+        _options.clear()
+        _options.update(options)
+
+
+def get_whois_client():
+    """
+    Returns:
+        WhoisClient: Client bersama (dibuat saat pertama dipanggil)
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = WhoisClient(**_options)
+    return _client
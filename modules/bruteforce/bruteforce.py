@@ -9,6 +9,7 @@ import time
 from queue import Queue
 from lib.verbose import Verbose
 from lib.timer import Timer
+from lib.progress import progress
 from .wordlist import WordlistManager
 
 class BruteForceEngine:
@@ -125,15 +126,20 @@ class HashCracker:
         print(f"Wordlist: {wordlist_name} ({len(words)} words)")
         print("-" * 50)
         
-        with Timer("Wordlist attack"):
+        target = target_hash.lower()
+        with Timer("Wordlist attack"), progress(len(words), 'Wordlist attack', 'word') as p:
             for i, word in enumerate(words):
-                if i % 10000 == 0 and i > 0:
-                    print(f"  Progress: {i}/{len(words)} words")
+                # Ticker yang render; loop cukup update sesekali
+                if not i & 0x3FF:
+                    p.update(i)
                 
                 calculated = hash_func(word.encode()).hexdigest()
-                if calculated.lower() == target_hash.lower():
+                if calculated == target:
+                    p.update(i + 1)
+                    p.close()
                     print(f"\n✅ Found! Password: {word}")
                     return word
+            p.update(len(words))
         
         print("\n❌ Not found in wordlist")
         return None
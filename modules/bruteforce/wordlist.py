@@ -2,10 +2,11 @@
 # OSXNT - Wordlist Manager for Bruteforce
 
 import os
-import requests
 import zipfile
 from lib.verbose import Verbose
 from lib.file_helper import ensure_dir, get_file_size
+from lib.http import get_client
+from lib.progress import progress
 
 class WordlistManager:
     """Manage wordlists for bruteforce attacks"""
@@ -87,23 +88,20 @@ class WordlistManager:
         self.v.log(f"URL: {info['url']}")
         
         try:
-            response = requests.get(info['url'], stream=True)
+            response = get_client().get(info['url'], stream=True)
             response.raise_for_status()
             
             total_size = int(response.headers.get('content-length', 0))
             downloaded = 0
             
-            with open(filename, 'wb') as f:
+            with open(filename, 'wb') as f, progress(total_size or None, f"Download {name}", 'B') as p:
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
-                        
-                        if total_size:
-                            percent = (downloaded / total_size) * 100
-                            print(f"\rProgress: {percent:.1f}%", end='')
+                        p.update(downloaded)
             
-            print("\n✅ Download complete!")
+            print("✅ Download complete!")
             return True
             
         except Exception as e:
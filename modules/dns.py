@@ -1,21 +1,594 @@
+import time
+import ipaddress
+import threading
+import dns.flags
+import dns.message
+import dns.name
+import dns.query
+import dns.rcode
+import dns.rdatatype
+import dns.exception
 import dns.resolver
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from lib.verbose import Verbose
 from lib.json_save import save_to_json, prepare_output
+from lib.lookup_cache import get_lookup_cache, MISS
+from lib.metrics import incr, observe
+
+# Ukuran buffer UDP EDNS0 yang diiklankan (rekomendasi DNS flag day 2020)
+EDNS_PAYLOAD = 1232
+
+# Nameserver kalo konfigurasi sistem tidak bisa dibaca
+FALLBACK_NAMESERVERS = ['1.1.1.1', '8.8.8.8']
+
+# Sink dipanggil per batch
+FLUSH_EVERY = 200
+FLUSH_INTERVAL = 1.0
+
+def resolve_records(domain, record_type='A', lifetime=None):
+    """
+    Resolve satu record type, di-cache sesuai TTL jawaban DNS.
+
+    Args:
+        domain (str): Domain
+        record_type (str): A, AAAA, MX, NS, TXT, ...
+        lifetime (float): Batas waktu total query (None = default resolver)
+
+    Returns:
+        list: Record (string), [] kalo tidak ada jawaban, None kalo NXDOMAIN
+    """
+    cache = get_lookup_cache()
+    key = f"{domain.lower().rstrip('.')}/{record_type.upper()}"
+    records = cache.get('dns', key)
+    if records is not MISS:
+        return records
+
+    try:
+        answers = dns.resolver.resolve(domain, record_type, raise_on_no_answer=False,
+                                       lifetime=lifetime)
+    except dns.resolver.NXDOMAIN:
+        cache.set('dns', key, None)
+        return None
+    records = [str(r) for r in answers]
+    # Tanpa jawaban: negative TTL; selain itu pakai TTL rrset dari server
+    ttl = answers.rrset.ttl if answers.rrset is not None else cache.ttls['negative']
+    cache.set('dns', key, records, ttl)
+    return records
 
 def dns_lookup(domain, record_type='A', verbose=False, save=None):
+    """
+    Returns:
+        dict: {record_type: [records]}, None kalo gagal
+    """
     v = Verbose(verbose)
     v.log(f"DNS lookup for {domain} ({record_type})")
-    
+
     try:
-        answers = dns.resolver.resolve(domain, record_type)
-        results = [str(r) for r in answers]
+        results = resolve_records(domain, record_type)
+        if results is None:
+            v.error(f"DNS lookup failed: {domain} tidak ada (NXDOMAIN)")
+            return None
         print(f"\n[ {record_type} Records for {domain} ]")
         for r in results:
             print(f"  - {r}")
-        
+
         if save:
             output = prepare_output({record_type: results}, domain, "dns")
             save_to_json(output, save)
-            
+
+        return {record_type: results}
+
     except Exception as e:
         v.error(f"DNS lookup failed: {e}")
+        return None
+
+# ========== BULK ==========
+
+def parse_nameserver(value, default_port=53):
+    """'1.1.1.1', '127.0.0.1:5353', '[::1]:53' -> (host, port)"""
+    value = value.strip()
+    if value.startswith('['):
+        host, _, port = value[1:].partition(']')
+        port = port.lstrip(':')
+        return host, int(port) if port.isdigit() else default_port
+    if value.count(':') == 1:
+        host, port = value.split(':')
+        return host, int(port)
+    return value, default_port
+
+def read_queries(lines, types=('A',)):
+    """
+    Baris input -> pasangan (name, type), tanpa duplikat.
+
+    Format per baris: "name", "name TYPE" atau "name,TYPE"; baris kosong / # dilewati.
+    Tanpa TYPE, semua `types` di-query.
+
+    Yields:
+        tuple: (name, TYPE)
+    """
+    seen = set()
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.replace(',', ' ').split()
+        name = parts[0].lower().rstrip('.')
+        wanted = [t.upper() for t in parts[1:]] or [t.upper() for t in types]
+        for rtype in wanted:
+            key = (name, rtype)
+            if key not in seen:
+                seen.add(key)
+                yield key
+
+class BulkResolver:
+    """
+    Resolver untuk banyak query (name, type) sekaligus.
+
+    - query langsung ke nameserver yang dikonfigurasi (round-robin, retry ke server lain)
+    - EDNS0 dengan buffer EDNS_PAYLOAD, ulang lewat TCP kalo jawaban UDP terpotong (TC)
+    - hasil terstruktur per query: status, TTL, semua RR di answer section
+    """
+
+    def __init__(self, nameservers=None, timeout=3.0, retries=2, workers=64,
+                 edns_payload=EDNS_PAYLOAD, tcp_fallback=True, verbose=False):
+        """
+        Args:
+            nameservers (list): IP / "host:port" (default: resolver sistem)
+            timeout (float): Timeout per percobaan
+            retries (int): Percobaan ulang (ke nameserver berikutnya)
+            workers (int): Query paralel
+            edns_payload (int): Buffer EDNS0 (0 = tanpa EDNS)
+            tcp_fallback (bool): Ulang lewat TCP kalo flag TC
+            verbose (bool): Mode verbose
+        """
+        self.v = Verbose(verbose)
+        if not nameservers:
+            try:
+                nameservers = dns.resolver.get_default_resolver().nameservers
+            except Exception:
+                nameservers = FALLBACK_NAMESERVERS
+        self.nameservers = [parse_nameserver(ns) for ns in nameservers]
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.workers = max(1, workers)
+        self.edns_payload = edns_payload
+        self.tcp_fallback = tcp_fallback
+        self._next = 0
+        self._lock = threading.Lock()
+        self.stats = {'queries': 0, 'answers': 0, 'nxdomain': 0, 'failed': 0, 'tcp': 0, 'retries': 0}
+
+    def _nameserver(self):
+        with self._lock:
+            ns = self.nameservers[self._next % len(self.nameservers)]
+            self._next += 1
+        return ns
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def query(self, name, rtype='A'):
+        """
+        Satu query.
+
+        Returns:
+            dict: {name, type, status, ttl, records: [{name, type, ttl, value}],
+                   nameserver, tcp, rtt_ms}
+        """
+        result = {'name': name, 'type': rtype, 'status': None, 'ttl': None, 'records': [],
+                  'nameserver': None, 'tcp': False, 'rtt_ms': None}
+        try:
+            request = dns.message.make_query(name, rtype, use_edns=0 if self.edns_payload else False,
+                                             payload=self.edns_payload or 512)
+        except (dns.exception.DNSException, ValueError) as e:
+            result['status'] = 'INVALID'
+            result['error'] = str(e)
+            self._count('failed')
+            return result
+
+        self._count('queries')
+        status = 'TIMEOUT'
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count('retries')
+            host, port = self._nameserver()
+            start = time.perf_counter()
+            try:
+                response = dns.query.udp(request, host, timeout=self.timeout, port=port)
+                if response.flags & dns.flags.TC and self.tcp_fallback:
+                    response = dns.query.tcp(request, host, timeout=self.timeout, port=port)
+                    result['tcp'] = True
+                    self._count('tcp')
+            except dns.exception.Timeout:
+                status = 'TIMEOUT'
+                incr('dns.timeout')
+                continue
+            except (OSError, dns.exception.DNSException) as e:
+                status = 'ERROR'
+                result['error'] = str(e)
+                continue
+
+            rcode = response.rcode()
+            if rcode in (dns.rcode.SERVFAIL, dns.rcode.REFUSED) and attempt < self.retries:
+                status = dns.rcode.to_text(rcode)
+                continue
+
+            result['status'] = dns.rcode.to_text(rcode)
+            result['nameserver'] = f"{host}:{port}" if port != 53 else host
+            elapsed = time.perf_counter() - start
+            result['rtt_ms'] = round(elapsed * 1000, 2)
+            observe('dns.query', elapsed)
+            incr(f"dns.{result['status'].lower()}")
+            result.pop('error', None)
+            for rrset in response.answer:
+                owner = rrset.name.to_text(omit_final_dot=True)
+                rrtype = dns.rdatatype.to_text(rrset.rdtype)
+                for rdata in rrset:
+                    result['records'].append({'name': owner, 'type': rrtype,
+                                              'ttl': rrset.ttl, 'value': rdata.to_text()})
+            if result['records']:
+                result['ttl'] = min(r['ttl'] for r in result['records'])
+            self._count('nxdomain' if rcode == dns.rcode.NXDOMAIN else 'answers')
+            return result
+
+        result['status'] = status
+        self._count('failed')
+        return result
+
+    def resolve_many(self, queries, sink=None, collect=True, query=None):
+        """
+        Jalankan banyak query paralel; hasil dialirkan ke sink per batch.
+
+        Args:
+            queries (iterable): Pasangan (name, type); dibaca lazy
+            sink (callable): Dipanggil dengan list hasil (urutan selesai)
+            collect (bool): False supaya hasil tidak disimpan di memori
+            query (callable): Pengganti self.query(name, type); hasil None tidak diteruskan
+
+        Returns:
+            list: Semua hasil (kalo collect)
+        """
+        results = []
+        batch = []
+        last_flush = time.monotonic()
+        window = self.workers * 4
+        pending = set()
+        queries = iter(queries)
+        exhausted = False
+        query = query or self.query
+
+        def flush():
+            nonlocal batch, last_flush
+            if sink and batch:
+                sink(batch)
+            batch = []
+            last_flush = time.monotonic()
+
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        name, rtype = next(queries)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.add(pool.submit(query, name, rtype))
+                if not pending:
+                    break
+                done, pending = wait(pending, timeout=FLUSH_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result is None:
+                        continue
+                    batch.append(result)
+                    if collect:
+                        results.append(result)
+                if len(batch) >= FLUSH_EVERY or time.monotonic() - last_flush >= FLUSH_INTERVAL:
+                    flush()
+        except KeyboardInterrupt:
+            print("\n[!] Dihentikan")
+            for future in pending:
+                future.cancel()
+        finally:
+            flush()
+            pool.shutdown(wait=False)
+        return results
+
+def print_result(result):
+    """Satu baris per query"""
+    if result['status'] != 'NOERROR':
+        print(f"[!] {result['name']:<32} {result['type']:<6} {result['status']}")
+        return
+    values = [r['value'] for r in result['records'] if r['type'] == result['type']] or \
+             [r['value'] for r in result['records']]
+    shown = ', '.join(values[:3]) + (f" (+{len(values) - 3})" if len(values) > 3 else '')
+    ttl = result['ttl'] if result['ttl'] is not None else '-'
+    print(f"[+] {result['name']:<32} {result['type']:<6} {ttl!s:>6}  {shown or '(kosong)'}")
+
+def flatten_result(result):
+    """Hasil BulkResolver -> dict kolom tetap (untuk CSV)"""
+    return {
+        'name': result['name'],
+        'type': result['type'],
+        'status': result['status'],
+        'ttl': result['ttl'] if result['ttl'] is not None else '',
+        'records': ' | '.join(r['value'] for r in result['records']),
+        'nameserver': result['nameserver'] or '',
+        'tcp': result['tcp'],
+        'rtt_ms': result['rtt_ms'] if result['rtt_ms'] is not None else ''
+    }
+
+def dns_bulk(lines, types=('A',), nameservers=None, workers=64, timeout=3.0, verbose=False, sink=None):
+    """
+    Bulk DNS dari baris input (file / stdin).
+
+    Args:
+        lines (iterable): Baris "name [TYPE]"
+        types (tuple): Type default untuk baris tanpa TYPE
+        nameservers (list): Nameserver (default: resolver sistem)
+        workers (int): Query paralel
+        timeout (float): Timeout per percobaan
+        verbose (bool): Mode verbose
+        sink (callable): Output streaming per batch
+
+    Returns:
+        list: Hasil per query
+    """
+    resolver = BulkResolver(nameservers, timeout=timeout, workers=workers, verbose=verbose)
+    servers = ', '.join(f"{h}:{p}" if p != 53 else h for h, p in resolver.nameservers)
+    print(f"[*] Bulk DNS via {servers} ({workers} paralel)")
+
+    def output(batch):
+        for result in batch:
+            print_result(result)
+        if sink:
+            sink(batch)
+
+    start = time.perf_counter()
+    results = resolver.resolve_many(read_queries(lines, types), sink=output)
+    elapsed = time.perf_counter() - start
+    stats = resolver.stats
+    qps = stats['queries'] / elapsed if elapsed > 0 else 0
+    print(f"\n[+] {stats['queries']} query dalam {elapsed:.2f}s ({qps:.0f} q/s): "
+          f"{stats['answers']} jawaban, {stats['nxdomain']} NXDOMAIN, {stats['failed']} gagal, "
+          f"{stats['tcp']} via TCP, {stats['retries']} retry")
+    return results
+
+# ========== PTR SWEEP ==========
+
+# Satu zone reverse = 256 alamat (/24 IPv4, 2 nibble terakhir IPv6)
+PTR_CHUNK = 256
+
+# Batas ukuran satu CIDR (/16 IPv4)
+MAX_SWEEP_HOSTS = 1 << 16
+
+# Gagal berturut-turut (SERVFAIL / timeout) sebelum zone dianggap lame
+LAME_AFTER = 3
+
+# Umur negative cache zone kosong / lame (detik)
+ZONE_TTL = 3600
+
+ZONE_FAILURES = ('SERVFAIL', 'REFUSED', 'TIMEOUT', 'ERROR')
+
+# Jawaban probe SOA yang langsung berarti lame; timeout / error cuma dihitung
+# sebagai satu kegagalan (bisa jadi paket hilang)
+LAME_STATUSES = ('SERVFAIL', 'REFUSED')
+
+# Label terakhir nama reverse, dibuat sekali (tanpa objek per IP)
+LAST_OCTETS = [str(i) for i in range(256)]
+LAST_NIBBLES = [f"{i & 15:x}.{i >> 4:x}" for i in range(256)]
+
+def reverse_suffix(version, base):
+    """
+    Nama zone reverse untuk blok 256 alamat.
+
+    Args:
+        version (int): 4 atau 6
+        base (int): Alamat pertama blok (kelipatan 256)
+
+    Returns:
+        str: "c.b.a.in-addr.arpa" / "<30 nibble>.ip6.arpa"
+    """
+    if version == 4:
+        return f"{(base >> 8) & 255}.{(base >> 16) & 255}.{base >> 24}.in-addr.arpa"
+    return '.'.join(reversed(f"{base >> 8:030x}")) + '.ip6.arpa'
+
+def reverse_to_ip(name):
+    """Nama reverse -> IP (string)"""
+    labels = name.rstrip('.').split('.')
+    if labels[-2] == 'in-addr':
+        return '.'.join(reversed(labels[:4]))
+    return str(ipaddress.IPv6Address(int(''.join(reversed(labels[:32])), 16)))
+
+def sweep_blocks(cidrs, verbose=False):
+    """
+    CIDR -> blok 256 alamat.
+
+    Returns:
+        list: (version, base, first_index, last_index) per blok
+    """
+    v = Verbose(verbose)
+    blocks = []
+    for cidr in cidrs:
+        cidr = cidr.strip()
+        if not cidr or cidr.startswith('#'):
+            continue
+        try:
+            net = ipaddress.ip_network(cidr, strict=False)
+        except ValueError:
+            v.error(f"CIDR tidak valid: {cidr}")
+            continue
+        if net.num_addresses > MAX_SWEEP_HOSTS:
+            v.error(f"CIDR terlalu besar ({net.num_addresses} alamat, maks {MAX_SWEEP_HOSTS}): {cidr}")
+            continue
+        first = int(net.network_address)
+        last = int(net.broadcast_address)
+        for base in range(first - first % PTR_CHUNK, last + 1, PTR_CHUNK):
+            blocks.append((net.version, base, max(first, base) - base,
+                           min(last, base + PTR_CHUNK - 1) - base))
+    return blocks
+
+class PTRSweeper:
+    """
+    Reverse DNS untuk range alamat.
+
+    - nama in-addr.arpa / ip6.arpa dibangun dari suffix zone + label terakhir
+      yang sudah disiapkan (tanpa objek ipaddress per IP)
+    - zone tiap blok 256 alamat di-probe dulu (SOA): NXDOMAIN berarti tidak ada
+      nama di bawahnya (RFC 8020), SERVFAIL / REFUSED berarti delegasi lame;
+      keduanya dilewati dan di-cache negatif
+    - timeout / error probe dihitung satu kegagalan; zone yang gagal LAME_AFTER
+      kali berturut-turut (probe + sweep) dihentikan
+    - hanya IP yang punya PTR yang diteruskan ke output
+    """
+
+    def __init__(self, resolver, probe=True, lame_after=LAME_AFTER, verbose=False):
+        self.resolver = resolver
+        self.probe = probe
+        self.lame_after = lame_after
+        self.v = Verbose(verbose)
+        self.cache = get_lookup_cache()
+        self.dead = {}
+        self._failures = {}
+        self._lock = threading.Lock()
+        self.stats = {'addresses': 0, 'queried': 0, 'found': 0, 'skipped': 0,
+                      'empty_zones': 0, 'lame_zones': 0}
+
+    def _mark(self, suffix, state, cached=False):
+        with self._lock:
+            if suffix in self.dead:
+                return
+            self.dead[suffix] = state
+            self.stats['lame_zones' if state == 'lame' else 'empty_zones'] += 1
+        # State dari cache tidak ditulis ulang: TTL tetap dihitung dari probe asli
+        if not cached:
+            self.cache.set('ptr-zone', suffix, state, ZONE_TTL)
+        self.v.log(f"Zone {suffix}: {state}, dilewati")
+
+    def _fail(self, suffix):
+        """Catat satu kegagalan zone; lame setelah lame_after kali berturut-turut"""
+        with self._lock:
+            failures = self._failures.get(suffix, 0) + 1
+            self._failures[suffix] = failures
+        if failures >= self.lame_after:
+            self._mark(suffix, 'lame')
+
+    def probe_zones(self, blocks):
+        """Probe zone semua blok; zone kosong / lame masuk self.dead"""
+        suffixes = []
+        for version, base, _, _ in blocks:
+            suffix = reverse_suffix(version, base)
+            state = self.cache.get('ptr-zone', suffix)
+            if state is not MISS:
+                self._mark(suffix, state, cached=True)
+            elif self.probe:
+                suffixes.append((suffix, 'SOA'))
+        if not suffixes:
+            return
+        print(f"[*] Probe {len(suffixes)} zone reverse...")
+        for result in self.resolver.resolve_many(suffixes):
+            if result['status'] == 'NXDOMAIN':
+                self._mark(result['name'], 'empty')
+            elif result['status'] in LAME_STATUSES:
+                self._mark(result['name'], 'lame')
+            elif result['status'] in ZONE_FAILURES:
+                self._fail(result['name'])
+
+    def names(self, blocks):
+        """
+        Nama PTR yang perlu di-query (lazy; zone yang mati di tengah jalan ikut dilewati).
+
+        Yields:
+            tuple: (reverse_name, 'PTR')
+        """
+        for version, base, lo, hi in blocks:
+            suffix = reverse_suffix(version, base)
+            labels = LAST_OCTETS if version == 4 else LAST_NIBBLES
+            self.stats['addresses'] += hi - lo + 1
+            for i in range(lo, hi + 1):
+                if suffix in self.dead:
+                    self.stats['skipped'] += hi - i + 1
+                    break
+                yield f"{labels[i]}.{suffix}", 'PTR'
+
+    def query(self, name, rtype):
+        """
+        Query satu nama PTR + catat kegagalan per zone.
+
+        Returns:
+            dict: {ip, ptr, ttl} kalo ada PTR, selain itu None
+        """
+        suffix = name.split('.', 1 if name.endswith('in-addr.arpa') else 2)[-1]
+        if suffix in self.dead:
+            with self._lock:
+                self.stats['skipped'] += 1
+            return None
+
+        result = self.resolver.query(name, rtype)
+        with self._lock:
+            self.stats['queried'] += 1
+        if result['status'] in ZONE_FAILURES:
+            self._fail(suffix)
+        else:
+            with self._lock:
+                self._failures.pop(suffix, None)
+
+        ptr = [r['value'].rstrip('.') for r in result['records'] if r['type'] == 'PTR']
+        if result['status'] != 'NOERROR' or not ptr:
+            return None
+        ip = reverse_to_ip(name)
+        with self._lock:
+            self.stats['found'] += 1
+        self.cache.set('ptr', ip, ptr[0], result['ttl'])
+        return {'ip': ip, 'ptr': ptr, 'ttl': result['ttl']}
+
+    def run(self, cidrs, sink=None):
+        """
+        Sweep semua CIDR.
+
+        Returns:
+            list: {ip, ptr, ttl} untuk IP yang punya PTR
+        """
+        blocks = sweep_blocks(cidrs, verbose=self.v.enabled)
+        if not blocks:
+            print("[!] Tidak ada CIDR untuk di-sweep")
+            return []
+        self.probe_zones(blocks)
+        return self.resolver.resolve_many(self.names(blocks), sink=sink, query=self.query)
+
+def ptr_sweep(cidrs, nameservers=None, workers=64, timeout=3.0, probe=True, verbose=False, sink=None):
+    """
+    Reverse DNS sweep untuk daftar CIDR (IPv4 / IPv6).
+
+    Args:
+        cidrs (iterable): CIDR (satu per item)
+        nameservers (list): Nameserver (default: resolver sistem)
+        workers (int): Query in-flight
+        timeout (float): Timeout per percobaan
+        probe (bool): Probe zone per /24 dulu
+        verbose (bool): Mode verbose
+        sink (callable): Output streaming per batch
+
+    Returns:
+        list: {ip, ptr, ttl} untuk IP yang punya PTR
+    """
+    resolver = BulkResolver(nameservers, timeout=timeout, retries=1, workers=workers, verbose=verbose)
+    sweeper = PTRSweeper(resolver, probe=probe, verbose=verbose)
+
+    def output(batch):
+        for record in batch:
+            print(f"[+] {record['ip']:<16} {', '.join(record['ptr'])}")
+        if sink:
+            sink(batch)
+
+    start = time.perf_counter()
+    results = sweeper.run(cidrs, sink=output)
+    elapsed = time.perf_counter() - start
+    stats = sweeper.stats
+    qps = stats['queried'] / elapsed if elapsed > 0 else 0
+    print(f"\n[+] {stats['found']} PTR dari {stats['addresses']} alamat dalam {elapsed:.1f}s "
+          f"({stats['queried']} query, {qps:.0f} q/s)")
+    print(f"[*] Dilewati: {stats['skipped']} alamat ({stats['empty_zones']} zone kosong, "
+          f"{stats['lame_zones']} zone lame)")
+    return results
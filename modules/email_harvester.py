@@ -8,6 +8,8 @@ from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from lib.verbose import Verbose
 from lib.json_save import save_to_json, prepare_output
+from lib.http import get_client
+from lib.validator import EMAIL_RE
 
 class EmailHarvester:
     """
@@ -16,10 +18,8 @@ class EmailHarvester:
     
     def __init__(self, verbose=False):
         self.v = Verbose(verbose)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # Session bersama (keep-alive + retry), User-Agent sudah di-set
+        self.session = get_client().session
         self.emails_found = set()
         self.pages_scanned = 0
         
@@ -172,7 +172,7 @@ class EmailHarvester:
             return False
         
         # Cek karakter valid
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+        if not EMAIL_RE.match(email):
             return False
         
         return True
@@ -1,37 +1,84 @@
-import requests
-import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from core.banner import Fore
 from lib.json_save import save_to_json, prepare_output
 from lib.verbose import Verbose
+from lib.http import get_client
+from lib.ratelimit import HostLimiter
+from lib.lookup_cache import get_lookup_cache, resolve_cached, MISS
+from lib.multi_target import iter_targets
+from lib.validator import is_valid_ip
+
+# Endpoint ip-api (free tier: HTTP saja). Bisa diganti ke stub lokal untuk testing.
+IP_API_URL = 'http://ip-api.com'
+
+# Field bitmask ip-api (semua field yang ditampilkan)
+FIELDS = 66846719
+
+# Maksimum IP per POST /batch
+BATCH_SIZE = 100
+
+# Batas ekspansi satu CIDR (IPv6 /64 = 2^64 host)
+MAX_CIDR_HOSTS = 65536
+
+# Kolom tetap untuk output tabel (CSV/TXT) bulk
+ROW_FIELDS = ('query', 'status', 'country', 'countryCode', 'regionName', 'city',
+              'isp', 'org', 'as', 'lat', 'lon', 'hostnames', 'message')
 
 def get_public_ip():
     try:
-        r = requests.get('https://api.ipify.org?format=json', timeout=5)
+        r = get_client().get('https://api.ipify.org?format=json', timeout=5)
         return r.json()['ip']
     except:
         return None
 
-def track_ip(ip, verbose=False, save=None):
+def _geo_key(ip, api_url):
+    """Key cache geo; hasil dari stub/endpoint lain tidak dicampur dengan ip-api asli"""
+    return ip if api_url == IP_API_URL else f"{ip}@{api_url.rstrip('/')}"
+
+def track_ip(ip, verbose=False, save=None, api_url=IP_API_URL, geo_db=None):
+    """
+    Lacak satu IP / hostname.
+
+    Args:
+        ip (str): IP atau hostname
+        verbose (bool): Mode verbose
+        save (str): File JSON untuk menyimpan hasil
+        api_url (str): Base URL ip-api (atau stub lokal)
+        geo_db (GeoDB): Database lokal (lib.geoip); kalo ada, tanpa request ke ip-api
+
+    Returns:
+        dict: Record format ip-api, None kalo gagal
+    """
     v = Verbose(verbose)
     v.log(f"Tracking IP: {ip}")
-    
+
     # Resolve hostname if domain
+    resolved = resolve_cached(ip)
+    if resolved and resolved != ip:
+        v.log(f"Resolved to IP: {resolved}")
+        ip = resolved
+
+    url = f"{api_url.rstrip('/')}/json/{ip}?fields={FIELDS}"
     try:
-        resolved = socket.gethostbyname(ip)
-        if resolved != ip:
-            v.log(f"Resolved to IP: {resolved}")
-            ip = resolved
-    except:
-        pass
-    
-    url = f"http://ip-api.com/json/{ip}?fields=66846719"
-    try:
-        r = requests.get(url, timeout=10)
-        data = r.json()
+        if geo_db is not None:
+            data = geo_db.lookup(ip)
+        else:
+            cache = get_lookup_cache()
+            key = _geo_key(ip, api_url)
+            data = cache.get('geo', key)
+            if data is MISS:
+                r = get_client().get(url, timeout=10)
+                data = r.json()
+                if data.get('status') == 'success':
+                    cache.set('geo', key, data)
+            else:
+                v.log("Geo dari lookup cache")
         if data.get('status') == 'fail':
             v.error(f"Failed: {data.get('message', 'Invalid IP')}")
-            return
-        
+            return None
+
         print(f"\n{Fore.GREEN}[ IP INFO ]{Fore.RESET}")
         print(f"IP: {data.get('query')}")
         print(f"Country: {data.get('country')} ({data.get('countryCode')})")
@@ -41,10 +88,225 @@ def track_ip(ip, verbose=False, save=None):
         print(f"Organization: {data.get('org')}")
         print(f"AS: {data.get('as')}")
         print(f"Coordinates: {data.get('lat')}, {data.get('lon')}")
-        
+
         if save:
             output = prepare_output(data, ip, "iptrack")
             save_to_json(output, save)
-            
+
+        return data
+
     except Exception as e:
         v.error(f"Request failed: {e}")
+        return None
+
+# ========== BULK / BATCH ==========
+
+def expand_targets(targets, verbose=False):
+    """
+    Pisahkan target jadi IP literal dan hostname; CIDR, range dan glob diekspansi.
+
+    Args:
+        targets (iterable): IP, hostname, CIDR (1.2.3.0/24), range (1.2.3.1-50),
+                            @file atau '-' (lihat lib.multi_target.iter_targets)
+
+    Returns:
+        tuple: (list IP unik, list hostname unik), urutan input dipertahankan
+    """
+    ips = []
+    hosts = []
+    for target in iter_targets(targets, max_expand=MAX_CIDR_HOSTS):
+        # Parse ketat: 10.0.0.256 / 010.1.1.1 bukan IP, diperlakukan sebagai hostname
+        if is_valid_ip(target):
+            ips.append(target)
+        else:
+            hosts.append(target)
+    return ips, hosts
+
+def resolve_hosts(hosts, workers=32, verbose=False):
+    """
+    Resolve banyak hostname paralel.
+
+    Returns:
+        dict: hostname -> IP (None kalo gagal)
+    """
+    v = Verbose(verbose)
+
+    def resolve(host):
+        ip = resolve_cached(host)
+        if ip is None:
+            v.log(f"Resolve gagal {host}")
+        return ip
+
+    if not hosts:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(hosts))) as pool:
+        return dict(zip(hosts, pool.map(resolve, hosts)))
+
+class IPAPIClient:
+    """
+    Client POST /batch ip-api yang mematuhi rate limit lewat header:
+    - X-Rl: sisa request di window sekarang
+    - X-Ttl: detik sampai window di-reset
+    Kalo X-Rl habis (atau dapat 429), request berikutnya ditunda X-Ttl detik.
+    """
+
+    def __init__(self, api_url=IP_API_URL, verbose=False):
+        self.v = Verbose(verbose)
+        self.api_url = api_url.rstrip('/')
+        self.host = urlsplit(self.api_url).netloc
+        self.limiter = HostLimiter(max_per_host=1)
+        self.http = get_client()
+        self.stats = {'requests': 0, 'throttled': 0, 'waited': 0.0}
+
+    def _pace(self, response):
+        """Atur jadwal request berikutnya dari X-Rl / X-Ttl"""
+        try:
+            remaining = int(response.headers.get('X-Rl', 1))
+            ttl = int(response.headers.get('X-Ttl', 0))
+        except ValueError:
+            return
+        if remaining <= 0 or response.status_code == 429:
+            # +1 detik: X-Ttl dibulatkan ke bawah oleh server
+            wait = ttl + 1
+            self.v.log(f"Rate limit habis, tunggu {wait}s")
+            self.stats['throttled'] += 1
+            self.stats['waited'] += wait
+            self.limiter.defer(self.host, wait)
+
+    def lookup_batch(self, ips, retries=3):
+        """
+        Lookup maksimum BATCH_SIZE IP dalam satu POST.
+
+        Returns:
+            list: Record ip-api (urutan sama dengan input), [] kalo gagal
+        """
+        url = f"{self.api_url}/batch?fields={FIELDS}"
+        for attempt in range(retries + 1):
+            with self.limiter.slot(self.host):
+                response = self.http.post(url, json=list(ips), timeout=15)
+                self.stats['requests'] += 1
+            self._pace(response)
+            if response.status_code == 429 and attempt < retries:
+                continue
+            response.raise_for_status()
+            return response.json()
+        return []
+
+def flatten_record(record):
+    """Record ip-api -> dict dengan kolom tetap ROW_FIELDS (untuk CSV)"""
+    row = {field: record.get(field, '') for field in ROW_FIELDS}
+    if isinstance(row['hostnames'], list):
+        row['hostnames'] = ' '.join(row['hostnames'])
+    return row
+
+def _print_record(record, hostnames):
+    if record.get('status') == 'fail':
+        print(f"{Fore.RED}[!]{Fore.RESET} {record.get('query', '?'):<16} {record.get('message', 'fail')}")
+        return
+    names = f" ({', '.join(hostnames)})" if hostnames else ''
+    print(f"{Fore.GREEN}[+]{Fore.RESET} {record.get('query', ''):<16} "
+          f"{record.get('countryCode') or '--':<3} {str(record.get('city') or '')[:20]:<20} "
+          f"{str(record.get('isp') or '')[:30]}{names}")
+
+def track_ips(targets, verbose=False, sink=None, api_url=IP_API_URL, batch_size=BATCH_SIZE,
+              geo_db=None):
+    """
+    Geolokasi banyak target lewat POST /batch ip-api.
+
+    Args:
+        targets (iterable): IP, hostname, atau CIDR
+        verbose (bool): Mode verbose
+        sink (callable): Dipanggil per batch dengan list record (streaming output)
+        api_url (str): Base URL ip-api (atau stub lokal)
+        batch_size (int): IP per request (maks 100)
+        geo_db (GeoDB): Database lokal (lib.geoip); kalo ada, tanpa request ke ip-api
+
+    Returns:
+        list: Semua record (record punya field 'hostnames' kalo berasal dari domain)
+    """
+    v = Verbose(verbose)
+    ips, hosts = expand_targets(targets, verbose)
+
+    # Resolve hostname paralel, dedupe hasilnya dengan IP yang sudah ada
+    hostnames = {}
+    if hosts:
+        print(f"[*] Resolving {len(hosts)} hostname...")
+        seen = set(ips)
+        for host, ip in resolve_hosts(hosts, verbose=verbose).items():
+            if ip is None:
+                print(f"{Fore.RED}[!]{Fore.RESET} {host}: tidak bisa di-resolve")
+                continue
+            hostnames.setdefault(ip, []).append(host)
+            if ip not in seen:
+                seen.add(ip)
+                ips.append(ip)
+
+    if not ips:
+        v.error("Tidak ada IP untuk dilacak")
+        return []
+
+    batch_size = max(1, min(batch_size, BATCH_SIZE))
+    batches = (len(ips) + batch_size - 1) // batch_size
+    if geo_db is not None:
+        print(f"[*] Tracking {len(ips)} IP unik dari geo-db lokal")
+    else:
+        print(f"[*] Tracking {len(ips)} IP unik dalam {batches} batch")
+
+    client = IPAPIClient(api_url, verbose) if geo_db is None else None
+    results = []
+    start = time.time()
+
+    def emit(records):
+        for record in records:
+            names = hostnames.get(record.get('query'))
+            if names:
+                record['hostnames'] = names
+            _print_record(record, names)
+        results.extend(records)
+        if sink and records:
+            sink(records)
+
+    # Record yang masih ada di lookup cache tidak perlu di-query ulang
+    cached = 0
+    if client is not None:
+        cache = get_lookup_cache()
+        missing = []
+        hits = []
+        for ip in ips:
+            record = cache.get('geo', _geo_key(ip, api_url))
+            if record is MISS:
+                missing.append(ip)
+            else:
+                hits.append(dict(record))
+        if hits:
+            cached = len(hits)
+            v.log(f"{cached} IP dari lookup cache")
+            emit(hits)
+        ips = missing
+        batches = (len(ips) + batch_size - 1) // batch_size
+
+    for i in range(0, len(ips), batch_size):
+        chunk = ips[i:i + batch_size]
+        try:
+            if geo_db is not None:
+                records = geo_db.lookup_many(chunk)
+            else:
+                records = client.lookup_batch(chunk)
+        except Exception as e:
+            v.error(f"Batch {i // batch_size + 1}/{batches} gagal: {e}")
+            continue
+
+        if client is not None:
+            for record in records:
+                if record.get('status') == 'success':
+                    cache.set('geo', _geo_key(record.get('query'), api_url), dict(record))
+        emit(records)
+
+    elapsed = time.time() - start
+    if client is None:
+        print(f"\n[+] {len(results)} IP dilacak dalam {elapsed:.1f}s (geo-db lokal)")
+    else:
+        print(f"\n[+] {len(results)} IP dilacak dalam {elapsed:.1f}s "
+              f"({client.stats['requests']} request, {cached} dari cache, "
+              f"{client.stats['throttled']}x rate limited)")
+    return results
@@ -1,8 +1,11 @@
+import time
 import socket
 import threading
 from queue import Queue
 from lib.verbose import Verbose
 from lib.json_save import save_to_json, prepare_output
+from lib.metrics import incr, observe
+from lib.progress import progress
 
 COMMON_PORTS = {
     21: 'FTP', 22: 'SSH', 23: 'Telnet', 25: 'SMTP', 53: 'DNS',
@@ -17,15 +20,19 @@ def scan_port(host, port, timeout, results, verbose):
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(timeout)
+        start = time.perf_counter()
         result = sock.connect_ex((host, port))
+        observe('scanport.connect', time.perf_counter() - start)
         if result == 0:
+            incr('scanport.open')
             service = COMMON_PORTS.get(port, 'unknown')
             results.append({'port': port, 'service': service})
             if verbose:
                 print(f"  [OPEN] {port}/tcp - {service}")
         sock.close()
+        return result == 0
     except:
-        pass
+        return None
 
 def port_scan(host, ports, threads=20, timeout=2, verbose=False, save=None):
     v = Verbose(verbose)
@@ -60,23 +67,27 @@ def port_scan(host, ports, threads=20, timeout=2, verbose=False, save=None):
     def worker():
         while not queue.empty():
             port = queue.get()
-            scan_port(ip, port, timeout, results, verbose)
+            if scan_port(ip, port, timeout, results, verbose) is None:
+                p.error()
+            p.advance()
             queue.task_done()
     
     # Start threads
-    thread_list = []
-    for _ in range(min(threads, len(port_list))):
-        t = threading.Thread(target=worker)
-        t.start()
-        thread_list.append(t)
-    
-    for t in thread_list:
-        t.join()
+    with progress(len(port_list), f"Port Scan {host}", 'port') as p:
+        thread_list = []
+        for _ in range(min(threads, len(port_list))):
+            t = threading.Thread(target=worker)
+            t.start()
+            thread_list.append(t)
+        
+        for t in thread_list:
+            t.join()
     
     # Output
+    results.sort(key=lambda x: x['port'])
     print(f"\n[ Open Ports on {host} ]")
     if results:
-        for r in sorted(results, key=lambda x: x['port']):
+        for r in results:
             print(f"  {r['port']}/tcp - {r['service']}")
     else:
         print("  No open ports found")
@@ -84,3 +95,5 @@ def port_scan(host, ports, threads=20, timeout=2, verbose=False, save=None):
     if save:
         output = prepare_output(results, host, "portscan")
         save_to_json(output, save)
+    
+    return results
@@ -1,27 +1,38 @@
 #!/usr/bin/env python3
 # OSXNT - Subdomain Enumeration Module
 
-import socket
+import time
 import threading
 from queue import Queue
 from lib.verbose import Verbose
 from lib.json_save import save_to_json, prepare_output
+from lib.lookup_cache import resolve_cached
+from lib.metrics import incr, observe
+from lib.progress import progress
 
 def check_subdomain(domain, sub, timeout, results, verbose):
-    """Check if subdomain exists"""
+    """
+    Check if subdomain exists
+
+    Returns:
+        bool: True kalo resolve, False kalo tidak ada, None kalo resolver error
+    """
     full = f"{sub}.{domain}"
     try:
-        ip = socket.gethostbyname(full)
+        start = time.perf_counter()
+        ip = resolve_cached(full)
+        observe('subdomain.resolve', time.perf_counter() - start)
+        if ip is None:
+            return False
+        incr('subdomain.found')
         results.append({'subdomain': full, 'ip': ip})
         if verbose:
             print(f"  [FOUND] {full} -> {ip}")
         return True
-    except socket.gaierror:
-        return False
     except Exception as e:
         if verbose:
             print(f"  [ERROR] {full}: {e}")
-        return False
+        return None
 
 def load_wordlist(filename):
     """Load subdomain wordlist from file"""
@@ -39,7 +50,12 @@ def load_wordlist(filename):
         return []
 
 def subdomain_scan(domain, wordlist_file, threads=20, timeout=3, verbose=False, save=None):
-    """Main subdomain scanner function"""
+    """
+    Main subdomain scanner function
+
+    Returns:
+        list: {subdomain, ip} yang ditemukan, None kalo wordlist kosong
+    """
     v = Verbose(verbose)
     print(f"\n[ Subdomain Scanner ]")
     print(f"Target: {domain}")
@@ -71,24 +87,29 @@ def subdomain_scan(domain, wordlist_file, threads=20, timeout=3, verbose=False,
         while not queue.empty():
             try:
                 sub = queue.get_nowait()
-                if check_subdomain(domain, sub, timeout, results, verbose):
+                found = check_subdomain(domain, sub, timeout, results, verbose)
+                if found:
                     found_count += 1
+                elif found is None:
+                    p.error()
             except:
-                pass
+                p.error()
             finally:
+                p.advance()
                 queue.task_done()
     
     # Create and start threads
-    thread_list = []
-    for _ in range(min(threads, len(subdomains))):
-        t = threading.Thread(target=worker)
-        t.daemon = True
-        t.start()
-        thread_list.append(t)
-    
-    # Wait for all threads to complete
-    for t in thread_list:
-        t.join(timeout=timeout * 2)
+    with progress(len(subdomains), f"Subdomain {domain}", 'name') as p:
+        thread_list = []
+        for _ in range(min(threads, len(subdomains))):
+            t = threading.Thread(target=worker)
+            t.daemon = True
+            t.start()
+            thread_list.append(t)
+        
+        # Wait for all threads to complete
+        for t in thread_list:
+            t.join(timeout=timeout * 2)
     
     # Sort results
     results.sort(key=lambda x: x['subdomain'])
@@ -109,6 +130,8 @@ def subdomain_scan(domain, wordlist_file, threads=20, timeout=3, verbose=False,
     print(f"\n[ Scan Complete ]")
     print(f"Total checked: {len(subdomains)}")
     print(f"Found: {found_count}")
+    
+    return results
 
 # For standalone testing
 if __name__ == "__main__":
@@ -2,36 +2,170 @@
 # OSXNT - URL Extractor & Checker Module
 # Developed by alzzdevmaret
 
-import requests
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from lib.verbose import Verbose
 from lib.json_save import save_to_json, prepare_output
-from collections import Counter
+from lib.frontier import CrawlFrontier, RobotsCache
+from lib.ratelimit import HostLimiter
+from lib.htmlscan import extract_links
+from lib.url_store import URLStore
+from lib.http import get_client
+
+# Kategori URL (urutan = urutan tampil)
+URL_CATEGORIES = ('internal', 'external', 'static', 'mailto', 'javascript', 'invalid')
+
+STATIC_EXTENSIONS = ('.css', '.js', '.png', '.jpg', '.jpeg', '.gif',
+                     '.svg', '.woff', '.ttf', '.pdf', '.doc', '.zip')
+
+class LinkChecker:
+    """
+    Cek status banyak URL secara paralel.
+    
+    - URL identik hanya dicek sekali (dedupe lintas tipe resource)
+    - Satu session dengan pool koneksi per host + batas koneksi per host
+    - HEAD dulu, fallback ke GET untuk server yang menolak HEAD
+    - Cache hasil bersama (per proses) dengan TTL, jadi URL yang muncul
+      di banyak halaman crawl cukup dicek sekali
+    """
+    
+    # Status HEAD yang sering berarti "HEAD tidak didukung", bukan link rusak
+    HEAD_FALLBACK_STATUS = {400, 403, 405, 406, 501}
+    
+    # Cache bersama semua instance (LRU): url -> (expires_at, result)
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    
+    # Batas entry cache; yang paling lama tidak dipakai dibuang duluan
+    CACHE_MAX = 10000
+    
+    def __init__(self, http, workers=16, per_host=4, timeout=5, ttl=300, verbose=False):
+        """
+        Args:
+            http (HTTPClient): Client yang dipakai (lib.http, pool koneksi + retry)
+            workers (int): Jumlah pengecekan paralel
+            per_host (int): Koneksi paralel maksimum per host
+            timeout (int): Timeout per request
+            ttl (int): Umur cache hasil (detik)
+            verbose (bool): Mode verbose
+        """
+        self.v = Verbose(verbose)
+        self.http = http
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.ttl = ttl
+        self.limiter = HostLimiter(max_per_host=per_host)
+    
+    def check(self, url):
+        """
+        Cek satu URL.
+        
+        Returns:
+            dict: {'url', 'status_code', 'reason', 'size', 'error'}
+                  status_code 0 kalo request gagal
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(url)
+            if cached is not None:
+                if cached[0] > now:
+                    self._cache.move_to_end(url)
+                    return cached[1]
+                del self._cache[url]
+        
+        host = urlparse(url).netloc
+        with self.limiter.slot(host):
+            result = self._request(url)
+        
+        with self._cache_lock:
+            self._cache[url] = (time.monotonic() + self.ttl, result)
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.CACHE_MAX:
+                self._cache.popitem(last=False)
+        return result
+    
+    def check_many(self, urls):
+        """
+        Cek banyak URL paralel (duplikat dibuang).
+        
+        Returns:
+            dict: url -> hasil check()
+        """
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return {}
+        if len(unique) == 1 or self.workers == 1:
+            return {url: self.check(url) for url in unique}
+        
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(unique))) as pool:
+            return dict(zip(unique, pool.map(self.check, unique)))
+    
+    def _request(self, url):
+        """HEAD, fallback GET (stream, body tidak dibaca)"""
+        result = {'url': url, 'status_code': 0, 'reason': None, 'size': None, 'error': None}
+        try:
+            response = self.http.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in self.HEAD_FALLBACK_STATUS:
+                self.v.log(f"HEAD {response.status_code}, retry GET: {url}")
+                response.close()
+                response = self.http.get(url, timeout=self.timeout,
+                                         allow_redirects=True, stream=True)
+                response.close()
+            result['status_code'] = response.status_code
+            result['reason'] = response.reason
+            result['size'] = response.headers.get('content-length')
+        except Exception as e:
+            result['error'] = str(e)
+        return result
+    
+    @classmethod
+    def clear_cache(cls):
+        """Kosongkan cache hasil bersama"""
+        with cls._cache_lock:
+            cls._cache.clear()
+
 
 class URLExtractor:
     """
     URL Extractor untuk mengambil semua link dari website
     """
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, max_pages=100, workers=8, per_host=4,
+                 delay=0.0, respect_robots=True, check_limit=50, parser='auto'):
+        """
+        Args:
+            verbose (bool): Mode verbose
+            max_pages (int): Budget halaman default
+            workers (int): Jumlah fetch paralel (global)
+            per_host (int): Koneksi paralel maksimum per host
+            delay (float): Jeda minimum antar request ke host yang sama
+            respect_robots (bool): Patuhi robots.txt (Disallow + Crawl-delay)
+            check_limit (int): Maksimum link yang dicek broken (None/0 = semua)
+            parser (str): Backend ekstraksi link: 'auto', 'lxml', 'html.parser'
+        """
         self.v = Verbose(verbose)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        
-        # Kategori URL
-        self.url_categories = {
-            'internal': [],
-            'external': [],
-            'static': [],
-            'mailto': [],
-            'javascript': [],
-            'invalid': []
-        }
+        self.max_pages = max_pages
+        self.workers = max(1, workers)
+        self.respect_robots = respect_robots
+        self.check_limit = check_limit
+        self.parser = parser
+        # Client bersama; pool koneksi cukup untuk semua worker + link checker
+        self.http = get_client()
+        self.http.ensure_pool_size(self.workers * 2)
+        
+        self.limiter = HostLimiter(max_per_host=per_host, delay=delay)
+        self.robots = RobotsCache(self._fetch_robots)
+        self.link_checker = LinkChecker(self.http, workers=self.workers * 2,
+                                        per_host=per_host, verbose=verbose)
+        
+        # URLStore dari extract() terakhir (untuk export JSONL)
+        self.store = None
     
-    def extract(self, url, depth=1, save=None):
+    def extract(self, url, depth=1, save=None, max_pages=None, jsonl=None):
         """
         Extract semua URL dari website
         
@@ -39,6 +173,8 @@ class URLExtractor:
             url (str): Target URL
             depth (int): Kedalaman crawling
             save (str): File JSON untuk menyimpan hasil
+            max_pages (int): Budget halaman (default: self.max_pages)
+            jsonl (str): File JSONL untuk semua URL unik + counter-nya
         
         Returns:
             dict: Hasil extraction
@@ -48,6 +184,9 @@ class URLExtractor:
         print(f"Depth: {depth}")
         print("-" * 50)
         
+        if max_pages is None:
+            max_pages = self.max_pages
+        
         # Normalisasi URL
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
@@ -57,59 +196,68 @@ class URLExtractor:
             'target': url,
             'depth': depth,
             'total_urls': 0,
-            'categories': self.url_categories.copy(),
+            'total_occurrences': 0,
+            'categories': {},
             'urls_by_type': {},
             'urls_by_domain': {},
-            'broken_links': []
+            'broken_links': [],
+            'robots_blocked': 0
         }
         
-        visited = set()
-        to_visit = [(url, 0)]
-        
-        while to_visit and len(visited) < 100:  # Limit 100 pages
-            current_url, current_depth = to_visit.pop(0)
-            
-            if current_url in visited or current_depth > depth:
-                continue
-            
-            self.v.log(f"Crawling [{current_depth}/{depth}]: {current_url}")
-            
-            # Extract dari halaman ini
-            page_urls = self._extract_from_page(current_url)
-            
-            # Kategorikan
-            categorized = self._categorize_urls(page_urls, current_url)
-            
-            # Update result
-            for cat, urls in categorized.items():
-                if cat in result['categories']:
-                    result['categories'][cat].extend(urls)
-            
-            visited.add(current_url)
-            
-            # Tambahkan internal links untuk crawling selanjutnya
-            if current_depth < depth:
-                for internal_url in categorized['internal']:
-                    if internal_url not in visited and internal_url not in [v[0] for v in to_visit]:
-                        to_visit.append((internal_url, current_depth + 1))
-        
-        # Hitung total
-        for cat, urls in result['categories'].items():
-            result['total_urls'] += len(urls)
-            result['urls_by_type'][cat] = len(urls)
-        
-        # Group by domain
-        domains = []
-        for cat, urls in result['categories'].items():
-            for u in urls:
-                try:
-                    domain = urlparse(u).netloc
-                    if domain:
-                        domains.append(domain)
-                except:
-                    pass
-        
-        result['urls_by_domain'] = dict(Counter(domains).most_common())
+        # Store baru per extract(): URL unik disimpan sekali
+        store = URLStore(URL_CATEGORIES)
+        self.store = store
+        
+        frontier = CrawlFrontier(max_pages=max_pages, max_depth=depth)
+        if self._allowed(url):
+            frontier.add(url, 0)
+        else:
+            self.v.error(f"robots.txt melarang crawling {url}")
+        
+        # Worker pool: frontier diisi ulang setiap ada halaman selesai
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {}
+            while frontier or pending:
+                while frontier and len(pending) < self.workers:
+                    current_url, current_depth = frontier.next()
+                    self.v.log(f"Crawling [{current_depth}/{depth}]: {current_url}")
+                    future = pool.submit(self._fetch_page, current_url)
+                    pending[future] = (current_url, current_depth)
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_url, current_depth = pending.pop(future)
+                    page_urls = future.result()
+                    
+                    # Kategorikan langsung ke store (dedupe + counter)
+                    base_domain = urlparse(current_url).netloc
+                    source = store.intern(current_url)
+                    internal = []
+                    for url_info in page_urls:
+                        u = url_info['url']
+                        cat = self._categorize(u, base_domain)
+                        if cat is None:
+                            continue
+                        store.add(u, cat, source, url_info.get('type', ''))
+                        if cat == 'internal':
+                            internal.append(u)
+                    
+                    # Tambahkan internal links untuk crawling selanjutnya
+                    if current_depth < depth:
+                        allowed = [u for u in internal if self._allowed(u)]
+                        result['robots_blocked'] += len(internal) - len(allowed)
+                        frontier.add_many(allowed, current_depth + 1)
+        
+        result['pages_crawled'] = frontier.crawled
+        
+        # Hitung total (URL unik; total_occurrences termasuk duplikat)
+        result['categories'] = store.by_category()
+        result['urls_by_type'] = store.counts_by_category()
+        result['total_urls'] = sum(result['urls_by_type'].values())
+        result['total_occurrences'] = store.occurrences
+        
+        # Group by domain (domain sudah dihitung saat insert)
+        result['urls_by_domain'] = store.counts_by_domain()
         
         # Tampilkan hasil
         self._display_results(result)
@@ -127,83 +275,66 @@ class URLExtractor:
             save_to_json(output, save)
             print(f"\n✅ Hasil disimpan ke {save}")
         
+        if jsonl:
+            self.export_jsonl(jsonl)
+        
         return result
     
+    def export_jsonl(self, filename):
+        """
+        Export URL dari extract() terakhir ke JSON Lines
+        
+        Returns:
+            bool: True jika berhasil
+        """
+        if self.store is None:
+            self.v.error("Belum ada hasil extract untuk di-export")
+            return False
+        try:
+            count = self.store.export_jsonl(filename)
+            print(f"✅ {count} URL disimpan ke {filename}")
+            return True
+        except Exception as e:
+            print(f"[!] Error saving JSONL: {e}")
+            return False
+    
+    def _fetch_robots(self, url):
+        """Ambil isi robots.txt (None kalo tidak ada / gagal)"""
+        try:
+            response = self.http.get(url, timeout=10)
+            if response.status_code == 200:
+                return response.text
+        except Exception as e:
+            self.v.log(f"robots.txt tidak bisa diambil ({url}): {e}")
+        return None
+    
+    def _allowed(self, url):
+        """Cek robots.txt, sekaligus pasang Crawl-delay ke limiter"""
+        if not self.respect_robots:
+            return True
+        host = urlparse(url).netloc
+        crawl_delay = self.robots.crawl_delay(url)
+        if crawl_delay and crawl_delay > self.limiter.get_delay(host):
+            self.limiter.set_delay(host, crawl_delay)
+        return self.robots.allowed(url)
+    
+    def _fetch_page(self, url):
+        """Extract satu halaman di worker thread, dengan batas per host"""
+        host = urlparse(url).netloc
+        with self.limiter.slot(host):
+            return self._extract_from_page(url)
+    
     def _extract_from_page(self, url):
         """
-        Extract semua URL dari satu halaman
+        Extract semua URL dari satu halaman (satu traversal, lihat lib.htmlscan)
         """
         urls = []
         
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.http.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Dari tag <a>
-            for link in soup.find_all('a', href=True):
-                href = link['href'].strip()
-                if href:
-                    full_url = urljoin(url, href)
-                    urls.append({
-                        'url': full_url,
-                        'text': link.text.strip()[:100],
-                        'type': 'a'
-                    })
-            
-            # Dari tag <link> (CSS, dll)
-            for link in soup.find_all('link', href=True):
-                href = link['href'].strip()
-                if href:
-                    full_url = urljoin(url, href)
-                    urls.append({
-                        'url': full_url,
-                        'type': 'link',
-                        'rel': link.get('rel', [''])[0]
-                    })
-            
-            # Dari tag <script> src
-            for script in soup.find_all('script', src=True):
-                src = script['src'].strip()
-                if src:
-                    full_url = urljoin(url, src)
-                    urls.append({
-                        'url': full_url,
-                        'type': 'script'
-                    })
-            
-            # Dari tag <img> src
-            for img in soup.find_all('img', src=True):
-                src = img['src'].strip()
-                if src:
-                    full_url = urljoin(url, src)
-                    urls.append({
-                        'url': full_url,
-                        'type': 'image',
-                        'alt': img.get('alt', '')[:50]
-                    })
-            
-            # Dari tag <iframe> src
-            for iframe in soup.find_all('iframe', src=True):
-                src = iframe['src'].strip()
-                if src:
-                    full_url = urljoin(url, src)
-                    urls.append({
-                        'url': full_url,
-                        'type': 'iframe'
-                    })
-            
-            # Dari tag <form> action
-            for form in soup.find_all('form', action=True):
-                action = form['action'].strip()
-                if action:
-                    full_url = urljoin(url, action)
-                    urls.append({
-                        'url': full_url,
-                        'type': 'form',
-                        'method': form.get('method', 'get')
-                    })
+            urls = extract_links(response.text, response.url or url, backend=self.parser)
             
             self.v.log(f"  Found {len(urls)} URLs")
             
@@ -212,88 +343,64 @@ class URLExtractor:
         
         return urls
     
-    def _categorize_urls(self, urls, base_url):
+    def _categorize(self, url, base_domain):
         """
-        Kategorikan URL berdasarkan tipe
+        Kategori satu URL (None kalo kosong)
         """
-        base_domain = urlparse(base_url).netloc
-        
-        categorized = {
-            'internal': [],
-            'external': [],
-            'static': [],
-            'mailto': [],
-            'javascript': [],
-            'invalid': []
-        }
+        if not url:
+            return None
         
-        for url_info in urls:
-            url = url_info['url']
-            
-            # Skip kosong
-            if not url:
-                continue
-            
-            # Kategorikan
-            if url.startswith('mailto:'):
-                categorized['mailto'].append(url)
-            
-            elif url.startswith('javascript:'):
-                categorized['javascript'].append(url)
-            
-            elif url.startswith(('#', 'tel:', 'sms:', 'ftp:')):
-                categorized['invalid'].append(url)
-            
-            else:
-                # Cek static files
-                if url.endswith(('.css', '.js', '.png', '.jpg', '.jpeg', '.gif', 
-                                '.svg', '.woff', '.ttf', '.pdf', '.doc', '.zip')):
-                    categorized['static'].append(url_info)
-                
-                else:
-                    # Cek internal/external
-                    try:
-                        domain = urlparse(url).netloc
-                        if domain == base_domain or domain == '':
-                            categorized['internal'].append(url)
-                        elif domain:
-                            categorized['external'].append(url)
-                        else:
-                            categorized['invalid'].append(url)
-                    except:
-                        categorized['invalid'].append(url)
-        
-        return categorized
+        if url.startswith('mailto:'):
+            return 'mailto'
+        if url.startswith('javascript:'):
+            return 'javascript'
+        if url.startswith(('#', 'tel:', 'sms:', 'ftp:')):
+            return 'invalid'
+        
+        # Cek static files
+        if url.endswith(STATIC_EXTENSIONS):
+            return 'static'
+        
+        # Cek internal/external
+        try:
+            domain = urlparse(url).netloc
+        except ValueError:
+            return 'invalid'
+        if domain == base_domain or domain == '':
+            return 'internal'
+        return 'external'
     
-    def _check_broken_links(self, urls, limit=50):
+    def _check_broken_links(self, urls, limit=None):
         """
-        Check broken links (HTTP status)
+        Check broken links (HTTP status), paralel lewat LinkChecker
         """
+        if limit is None:
+            limit = self.check_limit
+        unique = list(dict.fromkeys(urls))
+        if limit:
+            unique = unique[:limit]
+        
         broken = []
-        checked = 0
-        
-        for url in urls[:limit]:
-            try:
-                response = self.session.head(url, timeout=5, allow_redirects=True)
-                if response.status_code >= 400:
-                    broken.append({
-                        'url': url,
-                        'status': response.status_code,
-                        'error': response.reason
-                    })
-                    print(f"  ❌ {url[:60]}... -> {response.status_code}")
-                else:
-                    print(f"  ✅ {url[:60]}... -> OK")
-                
-                checked += 1
-                
-            except Exception as e:
+        statuses = self.link_checker.check_many(unique)
+        
+        for url in unique:
+            status = statuses[url]
+            if status['error']:
                 broken.append({
                     'url': url,
                     'status': 0,
-                    'error': str(e)
+                    'error': status['error']
                 })
                 print(f"  ❌ {url[:60]}... -> Error")
+            elif status['status_code'] >= 400:
+                broken.append({
+                    'url': url,
+                    'status': status['status_code'],
+                    'error': status['reason']
+                })
+                print(f"  ❌ {url[:60]}... -> {status['status_code']}")
+            else:
+                print(f"  ✅ {url[:60]}... -> OK")
         
         return broken
     
@@ -305,7 +412,11 @@ class URLExtractor:
         print(f"🔗 URL EXTRACTION RESULTS")
         print("=" * 60)
         print(f"Target: {result['target']}")
-        print(f"Total URLs found: {result['total_urls']}")
+        print(f"Pages crawled: {result.get('pages_crawled', 0)}")
+        print(f"Total URLs found: {result['total_urls']} unique "
+              f"({result.get('total_occurrences', 0)} occurrences)")
+        if result.get('robots_blocked'):
+            print(f"Blocked by robots.txt: {result['robots_blocked']}")
         print("\n📊 URL CATEGORIES:")
         
         for cat, count in result['urls_by_type'].items():
@@ -331,12 +442,20 @@ class URLChecker:
     URL Checker untuk memeriksa resource website
     """
     
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, workers=16, per_host=4, check_limit=None):
+        """
+        Args:
+            verbose (bool): Mode verbose
+            workers (int): Jumlah pengecekan paralel
+            per_host (int): Koneksi paralel maksimum per host
+            check_limit (int): Maksimum URL unik yang dicek (None/0 = semua)
+        """
         self.v = Verbose(verbose)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.check_limit = check_limit
+        self.http = get_client()
+        self.http.ensure_pool_size(workers)
+        self.link_checker = LinkChecker(self.http, workers=workers,
+                                        per_host=per_host, verbose=verbose)
     
     def check(self, url, resource_type='all', save=None):
         """
@@ -365,30 +484,35 @@ class URLChecker:
         }
         
         try:
-            response = self.session.get(url, timeout=10)
+            response = self.http.get(url, timeout=10)
             soup = BeautifulSoup(response.text, 'html.parser')
             
-            # Extract berdasarkan tipe
+            # Kumpulkan resource berdasarkan tipe
             if resource_type in ['all', 'images']:
-                result['resources']['images'] = self._check_images(soup, url)
+                result['resources']['images'] = self._collect_images(soup, url)
             
             if resource_type in ['all', 'scripts']:
-                result['resources']['scripts'] = self._check_scripts(soup, url)
+                result['resources']['scripts'] = self._collect_scripts(soup, url)
             
             if resource_type in ['all', 'styles']:
-                result['resources']['styles'] = self._check_styles(soup, url)
+                result['resources']['styles'] = self._collect_styles(soup, url)
             
             if resource_type in ['all', 'links']:
-                result['resources']['links'] = self._check_links(soup, url)
+                result['resources']['links'] = self._collect_links(soup, url)
+            
+            # Cek semua URL unik sekaligus (paralel), lalu isi status per resource
+            self._check_collected(result['resources'])
             
             # Summary
             for res_type, resources in result['resources'].items():
                 total = len(resources)
                 working = sum(1 for r in resources if r.get('status') == 'OK')
+                skipped = sum(1 for r in resources if r.get('status') == 'SKIPPED')
                 result['summary'][res_type] = {
                     'total': total,
                     'working': working,
-                    'broken': total - working
+                    'broken': total - working - skipped,
+                    'skipped': skipped
                 }
             
             # Tampilkan hasil
@@ -405,82 +529,62 @@ class URLChecker:
         
         return result
     
-    def _check_images(self, soup, base_url):
-        """Check semua image src"""
+    def _collect_images(self, soup, base_url):
+        """Kumpulkan semua image src"""
         images = []
         for img in soup.find_all('img', src=True):
-            src = img['src']
-            full_url = urljoin(base_url, src)
-            
-            status, size = self._check_resource(full_url)
             images.append({
-                'url': full_url,
-                'alt': img.get('alt', ''),
-                'status': status,
-                'size': size
+                'url': urljoin(base_url, img['src']),
+                'alt': img.get('alt', '')
             })
-        
         return images
     
-    def _check_scripts(self, soup, base_url):
-        """Check semua script src"""
-        scripts = []
-        for script in soup.find_all('script', src=True):
-            src = script['src']
-            full_url = urljoin(base_url, src)
-            
-            status, size = self._check_resource(full_url)
-            scripts.append({
-                'url': full_url,
-                'status': status,
-                'size': size
-            })
-        
-        return scripts
+    def _collect_scripts(self, soup, base_url):
+        """Kumpulkan semua script src"""
+        return [{'url': urljoin(base_url, script['src'])}
+                for script in soup.find_all('script', src=True)]
     
-    def _check_styles(self, soup, base_url):
-        """Check semua stylesheet"""
-        styles = []
-        for link in soup.find_all('link', rel='stylesheet'):
-            href = link['href']
-            full_url = urljoin(base_url, href)
-            
-            status, size = self._check_resource(full_url)
-            styles.append({
-                'url': full_url,
-                'status': status,
-                'size': size
-            })
-        
-        return styles
+    def _collect_styles(self, soup, base_url):
+        """Kumpulkan semua stylesheet"""
+        return [{'url': urljoin(base_url, link['href'])}
+                for link in soup.find_all('link', rel='stylesheet', href=True)]
     
-    def _check_links(self, soup, base_url):
-        """Check semua hyperlink"""
+    def _collect_links(self, soup, base_url):
+        """Kumpulkan semua hyperlink absolut"""
         links = []
         for a in soup.find_all('a', href=True):
             href = a['href']
             if href.startswith(('http://', 'https://')):
-                status, size = self._check_resource(href)
                 links.append({
                     'url': href,
-                    'text': a.text.strip()[:50],
-                    'status': status,
-                    'size': size
+                    'text': a.text.strip()[:50]
                 })
-        
         return links
     
-    def _check_resource(self, url):
-        """Check status dan size resource"""
-        try:
-            response = self.session.head(url, timeout=5, allow_redirects=True)
-            if response.status_code == 200:
-                size = response.headers.get('content-length', 'unknown')
-                return 'OK', size
-            else:
-                return f'HTTP {response.status_code}', None
-        except:
+    def _check_collected(self, resources):
+        """Cek status semua resource, URL yang sama lintas tipe cukup sekali"""
+        urls = list(dict.fromkeys(res['url'] for items in resources.values() for res in items))
+        if self.check_limit:
+            if len(urls) > self.check_limit:
+                self.v.log(f"Check limit: {self.check_limit} dari {len(urls)} URL unik")
+            urls = urls[:self.check_limit]
+        
+        statuses = self.link_checker.check_many(urls)
+        for items in resources.values():
+            for res in items:
+                status = statuses.get(res['url'])
+                if status is None:
+                    res['status'], res['size'] = 'SKIPPED', None
+                else:
+                    res['status'], res['size'] = self._format_status(status)
+    
+    def _format_status(self, status):
+        """Konversi hasil LinkChecker ke (status, size) format URLChecker"""
+        if status['error']:
             return 'ERROR', None
+        if status['status_code'] == 200:
+            return 'OK', status['size'] or 'unknown'
+        return f"HTTP {status['status_code']}", None
     
     def _display_results(self, result):
         """Display hasil check"""
@@ -493,11 +597,13 @@ class URLChecker:
             print(f"   Total: {summary['total']}")
             print(f"   ✅ Working: {summary['working']}")
             print(f"   ❌ Broken: {summary['broken']}")
+            if summary.get('skipped'):
+                print(f"   ⏭️  Skipped (check limit): {summary['skipped']}")
             
             if summary['broken'] > 0 and res_type in result['resources']:
                 print("   Broken URLs:")
                 for res in result['resources'][res_type]:
-                    if res['status'] != 'OK':
+                    if res['status'] not in ('OK', 'SKIPPED'):
                         print(f"     [{res['status']}] {res['url'][:70]}...")
 
 
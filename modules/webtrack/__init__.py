@@ -2,6 +2,7 @@
 
 from .webtrack import track_web, extract_domain, get_ip_from_domain, get_dns_records, get_whois_info
 from .webcode import process_single_target, process_multi_targets
+from .webbulk import WebBulkTracker, track_webs, flatten_web_result
 
 __all__ = [
     'track_web',
@@ -10,5 +11,8 @@ __all__ = [
     'get_dns_records',
     'get_whois_info',
     'process_single_target',
-    'process_multi_targets'
+    'process_multi_targets',
+    'WebBulkTracker',
+    'track_webs',
+    'flatten_web_result'
 ]
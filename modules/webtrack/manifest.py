@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# OSXNT - Download Manifest
+# Cache conditional re-download (ETag/Last-Modified) untuk web source downloader
+
+import os
+import json
+import stat
+import shutil
+import hashlib
+from datetime import datetime
+from lib.verbose import Verbose
+
+MANIFEST_NAME = '.osxnt_manifest.json'
+STORE_NAME = '.osxnt_store'
+
+# Blob read-only (mode hardlink): semua hardlink berbagi inode, jadi edit in-place
+# di satu file output akan mengubah blob dan semua salinan lain. Editor yang
+# menulis lewat file baru + rename tetap bisa (link putus, blob aman).
+BLOB_MODE = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+class DownloadManifest:
+    """
+    Manifest per output directory.
+
+    Setiap entry mencatat URL, ETag, Last-Modified, hash konten (sha256) dan
+    path lokal. Run berikutnya mengirim If-None-Match / If-Modified-Since,
+    jadi resource yang tidak berubah cukup dijawab 304 tanpa body.
+
+    Default file output adalah salinan biasa (bebas diedit). Dengan hardlink=True
+    konten disimpan sekali di content store (dikunci sha256, read-only) lalu
+    di-hardlink ke output directory, sehingga file identik antar situs (jQuery
+    dari CDN yang sama, dll) hanya memakan disk sekali; file output ikut
+    read-only. Blob yang sudah ada dicek ulang hash-nya sebelum dipakai lagi.
+    """
+
+    def __init__(self, output_dir, store_dir=None, hardlink=False, verbose=False):
+        """
+        Args:
+            output_dir (str): Direktori output target
+            store_dir (str): Direktori content store bersama
+                             (default: <parent output_dir>/.osxnt_store)
+            hardlink (bool): Hardlink file identik dari content store (hemat disk,
+                             file output read-only) alih-alih salinan biasa
+            verbose (bool): Mode verbose
+        """
+        self.v = Verbose(verbose)
+        self.hardlink = hardlink
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        if store_dir is None:
+            parent = os.path.dirname(os.path.abspath(output_dir))
+            store_dir = os.path.join(parent, STORE_NAME)
+        self.store_dir = store_dir
+        self.entries = self._load()
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'downloaded': 0,
+            'bytes': 0,
+            'linked': 0
+        }
+
+    def _load(self):
+        """Load manifest dari disk (kosong kalo belum ada / rusak)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('entries', {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.v.error(f"Manifest rusak, diabaikan: {e}")
+            return {}
+
+    def save(self):
+        """Tulis manifest secara atomic (temp file lalu rename)"""
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'updated': str(datetime.now()),
+                    'entries': self.entries
+                }, f, indent=2)
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            self.v.error(f"Gagal menyimpan manifest: {e}")
+            return False
+
+    def get(self, url):
+        """Dapatkan entry manifest untuk URL (None kalo belum ada)"""
+        return self.entries.get(url)
+
+    def is_fresh(self, url):
+        """Cek apakah file lokal untuk URL masih utuh (hash cocok)"""
+        entry = self.entries.get(url)
+        if not entry or not os.path.isfile(entry['path']):
+            return False
+        st = os.stat(entry['path'])
+        # Ukuran beda = pasti berubah; inode + mtime sama = file yang sama kita
+        # tulis dan tidak disentuh (skip hashing), selain itu hash ulang
+        if st.st_size != entry.get('size'):
+            return False
+        if st.st_mtime == entry.get('mtime') and st.st_ino == entry.get('inode'):
+            return True
+        return _hash_file(entry['path']) == entry.get('sha256')
+
+    def conditional_headers(self, url):
+        """
+        Header conditional request untuk URL.
+        Kosong kalo belum pernah didownload atau file lokal sudah berubah.
+        """
+        entry = self.entries.get(url)
+        if not entry or not self.is_fresh(url):
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def not_modified(self, url):
+        """Catat response 304, kembalikan path lokal yang masih valid"""
+        self.stats['requests'] += 1
+        self.stats['not_modified'] += 1
+        self.v.log(f"Not modified (304): {url}")
+        return self.entries[url]['path']
+
+    def store(self, url, content, filepath, etag=None, last_modified=None):
+        """
+        Tulis konten ke filepath (salinan, atau hardlink dari content store), update manifest.
+
+        Args:
+            url (str): URL sumber
+            content (bytes): Isi response
+            filepath (str): Path tujuan dalam output directory
+            etag (str): Header ETag dari server
+            last_modified (str): Header Last-Modified dari server
+
+        Returns:
+            str: filepath
+        """
+        self.stats['requests'] += 1
+        self.stats['downloaded'] += 1
+        self.stats['bytes'] += len(content)
+
+        digest = hashlib.sha256(content).hexdigest()
+        if self.hardlink:
+            blob = self._write_blob(digest, content)
+            self._link(blob, filepath, content)
+        else:
+            _write_file(filepath, content)
+
+        st = os.stat(filepath)
+        self.entries[url] = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'sha256': digest,
+            'size': len(content),
+            'path': filepath,
+            'mtime': st.st_mtime,
+            'inode': st.st_ino,
+            'fetched': str(datetime.now())
+        }
+        return filepath
+
+    def _write_blob(self, digest, content):
+        """Tulis blob ke content store kalo belum ada / isinya tidak cocok lagi dengan hash"""
+        blob_dir = os.path.join(self.store_dir, digest[:2])
+        blob = os.path.join(blob_dir, digest)
+        if os.path.exists(blob):
+            if _hash_file(blob) == digest:
+                return blob
+            self.v.error(f"Blob rusak, ditulis ulang: {blob}")
+
+        os.makedirs(blob_dir, exist_ok=True)
+        tmp_path = f"{blob}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.chmod(tmp_path, BLOB_MODE)
+        # Replace, bukan tulis ulang in-place: file lama yang masih di-link ke
+        # blob rusak tetap di inode lama
+        try:
+            os.replace(tmp_path, blob)
+        except PermissionError:
+            # Windows: tujuan read-only tidak bisa di-replace
+            _make_writable(blob)
+            os.replace(tmp_path, blob)
+        return blob
+
+    def _link(self, blob, filepath, content):
+        """
+        Hardlink blob (read-only) ke filepath, fallback ke copy kalo filesystem
+        tidak support. File lama di filepath dihapus dulu, tidak ditimpa in-place.
+        """
+        try:
+            if os.path.exists(filepath):
+                if os.path.samefile(blob, filepath):
+                    return
+                _make_writable(filepath)
+                os.remove(filepath)
+            os.link(blob, filepath)
+            self.stats['linked'] += 1
+        except OSError:
+            # Beda filesystem / tidak support hardlink
+            try:
+                shutil.copyfile(blob, filepath)
+            except OSError:
+                with open(filepath, 'wb') as f:
+                    f.write(content)
+
+    def summary(self):
+        """Ringkasan statistik satu run"""
+        s = self.stats
+        return (f"{s['requests']} request, {s['not_modified']} tidak berubah (304), "
+                f"{s['downloaded']} didownload ({s['bytes']} bytes), "
+                f"{s['linked']} hardlink")
+
+
+def _write_file(path, content):
+    """
+    Tulis salinan biasa lewat temp file + rename: hardlink lama dari run
+    --hardlink sebelumnya diputus, blob tidak ikut tertimpa.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    try:
+        os.replace(tmp_path, path)
+    except PermissionError:
+        _make_writable(path)
+        os.replace(tmp_path, path)
+
+
+def _make_writable(path):
+    """Buka read-only sebelum hapus / replace (Windows menolak file read-only)"""
+    if os.name == 'nt':
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+
+
+def _hash_file(path, chunk_size=65536):
+    """sha256 dari file di disk"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# OSXNT - Bulk Web Tracking Module
+# Profil banyak domain sekaligus: DNS, PTR dan WHOIS di pool terpisah, output streaming
+
+import time
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from lib.verbose import Verbose
+from lib.progress import progress
+from lib.whois_client import WhoisClient
+from modules.dns import resolve_records
+from .webtrack import DNS_TYPES, extract_domain, get_ip_from_domain, get_hostname_from_ip, get_whois_info
+
+DNS_WORKERS = 32
+PTR_WORKERS = 16
+WHOIS_WORKERS = 4
+
+# Jeda minimum antar query ke server WHOIS yang sama (detik)
+WHOIS_DELAY = 2.0
+
+# Domain yang sedang diproses sekaligus (membatasi antrian + memori)
+WINDOW = 512
+
+# Sink dipanggil per batch, bukan per domain
+FLUSH_EVERY = 50
+FLUSH_INTERVAL = 2.0
+
+
+def interleave_by_server(domains, server_key):
+    """
+    Urutkan domain round-robin per WHOIS server, supaya worker WHOIS tidak
+    antri di belakang ratusan domain .com sementara TLD lain menganggur.
+
+    Args:
+        domains (list): Domain
+        server_key (callable): domain -> server WHOIS / RDAP
+    """
+    groups = OrderedDict()
+    for domain in domains:
+        groups.setdefault(server_key(domain), []).append(domain)
+    ordered = []
+    lists = list(groups.values())
+    for i in range(max((len(l) for l in lists), default=0)):
+        for group in lists:
+            if i < len(group):
+                ordered.append(group[i])
+    return ordered
+
+
+class WebBulkTracker:
+    """
+    Web tracking untuk daftar domain.
+
+    - resolve + semua record type: pool DNS
+    - PTR per IP: pool PTR (dimulai begitu IP domain didapat)
+    - WHOIS: pool kecil sendiri, WhoisClient dengan rate limit per server
+    Hasil per domain dikirim ke sink begitu semua bagiannya selesai.
+    """
+
+    def __init__(self, verbose=False, dns_workers=DNS_WORKERS, ptr_workers=PTR_WORKERS,
+                 whois_workers=WHOIS_WORKERS, whois_delay=WHOIS_DELAY, dns_timeout=10,
+                 whois=True, window=WINDOW):
+        """
+        Args:
+            verbose (bool): Mode verbose
+            dns_workers (int): Thread untuk resolve + record DNS
+            ptr_workers (int): Thread untuk reverse DNS
+            whois_workers (int): Thread WHOIS
+            whois_delay (float): Jeda antar query ke WHOIS server yang sama
+            dns_timeout (float): Batas waktu satu query DNS
+            whois (bool): False untuk melewati WHOIS
+            window (int): Maksimum domain in-flight
+        """
+        self.verbose = verbose
+        self.v = Verbose(verbose)
+        self.dns_workers = dns_workers
+        self.ptr_workers = ptr_workers
+        self.whois_workers = whois_workers
+        self.dns_timeout = dns_timeout
+        self.whois = whois
+        self.window = max(1, window)
+        self.whois_client = WhoisClient(timeout=dns_timeout, delay=whois_delay, max_per_server=1)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._done = queue.Queue()
+        # Future yang belum selesai saja (dibuang lewat done callback)
+        self._futures = set()
+        self._progress = None
+
+    # ---------- task ----------
+
+    def _track(self, future):
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._untrack)
+
+    def _untrack(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def _finish(self, domain):
+        with self._lock:
+            self._pending[domain] -= 1
+            finished = self._pending[domain] == 0
+        if finished:
+            self._done.put(domain)
+
+    def _task(self, domain, func, *args):
+        """Jalankan bagian lookup; counter domain selalu dikurangi"""
+        try:
+            func(*args)
+        except Exception as e:
+            self.jobs[domain]['errors'].append(str(e))
+        finally:
+            self._finish(domain)
+
+    def _resolve(self, domain):
+        result = self.jobs[domain]
+        ips = get_ip_from_domain(domain, self.verbose)
+        result['ips'] = [{'ip': ip, 'hostname': None} for ip in ips]
+        with self._lock:
+            self._pending[domain] += len(ips)
+        for entry in result['ips']:
+            self._track(self.ptr_pool.submit(self._task, domain, self._ptr, entry))
+
+    def _ptr(self, entry):
+        entry['hostname'] = get_hostname_from_ip(entry['ip'], self.verbose)
+
+    def _dns(self, domain, record_type):
+        records = resolve_records(domain, record_type, self.dns_timeout)
+        if records is not None:
+            self.jobs[domain]['dns'][record_type] = records
+
+    def _whois(self, domain):
+        info = get_whois_info(domain, self.verbose, client=self.whois_client)
+        if info:
+            self.jobs[domain]['whois'] = info
+
+    def _submit(self, domain):
+        self.jobs[domain] = {'domain': domain, 'ips': [], 'dns': {}, 'whois': {}, 'errors': []}
+        with self._lock:
+            self._pending[domain] = 1 + len(DNS_TYPES) + (1 if self.whois else 0)
+        self._track(self.dns_pool.submit(self._task, domain, self._resolve, domain))
+        for record_type in DNS_TYPES:
+            self._track(self.dns_pool.submit(self._task, domain, self._dns, domain, record_type))
+        if self.whois:
+            self._track(self.whois_pool.submit(self._task, domain, self._whois, domain))
+
+    # ---------- output ----------
+
+    def _print_result(self, result):
+        self._progress.clear()
+        if not result['ips'] and not result['dns']:
+            print(f"[!] {result['domain']}: tidak bisa di-resolve")
+            return
+        ips = [e['ip'] for e in result['ips']]
+        shown = ', '.join(ips[:2]) + (f" (+{len(ips) - 2})" if len(ips) > 2 else '')
+        registrar = result['whois'].get('registrar') or ''
+        print(f"[+] {result['domain']:<30} {shown:<34} {registrar}")
+
+    def _finalize(self, domain):
+        """Ambil hasil domain yang sudah lengkap (record DNS diurutkan seperti track_web)"""
+        result = self.jobs.pop(domain)
+        with self._lock:
+            del self._pending[domain]
+        dns = result['dns']
+        result['dns'] = {t: dns[t] for t in DNS_TYPES if t in dns}
+        if not result['errors']:
+            del result['errors']
+        return result
+
+    # ---------- main ----------
+
+    def run(self, targets, sink=None):
+        """
+        Profil semua target.
+
+        Args:
+            targets (iterable): Domain / URL
+            sink (callable): Dipanggil per batch dengan list hasil (streaming output)
+
+        Returns:
+            list: Hasil per domain (urutan selesai)
+        """
+        domains = list(OrderedDict.fromkeys(
+            d for d in (extract_domain(t.strip()).lower().rstrip('.') for t in targets) if d))
+        if not domains:
+            self.v.error("Tidak ada domain untuk diproses")
+            return []
+        if self.whois:
+            domains = interleave_by_server(domains, self.whois_client.server_key)
+        total = len(domains)
+        print(f"[*] Profiling {total} domain (DNS {self.dns_workers}, PTR {self.ptr_workers}, "
+              f"WHOIS {self.whois_workers if self.whois else 0} thread)")
+
+        self.jobs = {}
+        self.dns_pool = ThreadPoolExecutor(max_workers=self.dns_workers)
+        self.ptr_pool = ThreadPoolExecutor(max_workers=self.ptr_workers)
+        self.whois_pool = ThreadPoolExecutor(max_workers=self.whois_workers)
+
+        results = []
+        batch = []
+        last_flush = time.monotonic()
+        start = time.monotonic()
+        submitted = 0
+        done = 0
+
+        def flush():
+            nonlocal batch, last_flush
+            if sink and batch:
+                sink(batch)
+            batch = []
+            last_flush = time.monotonic()
+
+        # Status line / JSON lines lewat lib.progress (ikut --progress)
+        self._progress = progress(total, 'Web Track', 'domain').start()
+        try:
+            while done < total:
+                while submitted < total and submitted - done < self.window:
+                    self._submit(domains[submitted])
+                    submitted += 1
+                try:
+                    domain = self._done.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                result = self._finalize(domain)
+                done += 1
+                if result.get('errors'):
+                    self._progress.error()
+                self._progress.advance()
+                self._print_result(result)
+                results.append(result)
+                batch.append(result)
+                if len(batch) >= FLUSH_EVERY or time.monotonic() - last_flush >= FLUSH_INTERVAL:
+                    flush()
+        except KeyboardInterrupt:
+            self._progress.clear()
+            print(f"\n[!] Dihentikan, {done}/{total} domain selesai")
+        finally:
+            flush()
+            with self._lock:
+                futures = list(self._futures)
+            for future in futures:
+                future.cancel()
+            for pool in (self.dns_pool, self.ptr_pool, self.whois_pool):
+                pool.shutdown(wait=False)
+            self._progress.close()
+
+        elapsed = time.monotonic() - start
+        print(f"\n[+] {done} domain diproses dalam {elapsed:.1f}s ({done / elapsed if elapsed else 0:.1f}/s)")
+        return results
+
+
+def track_webs(targets, verbose=False, sink=None, **kwargs):
+    """
+    Shortcut: WebBulkTracker(verbose, **kwargs).run(targets, sink)
+
+    Returns:
+        list: Hasil per domain
+    """
+    return WebBulkTracker(verbose, **kwargs).run(targets, sink)
+
+
+def flatten_web_result(result):
+    """Hasil track_web -> dict kolom tetap (untuk CSV / TXT)"""
+    whois_info = result.get('whois') or {}
+    dns = result.get('dns') or {}
+    return {
+        'domain': result.get('domain'),
+        'ips': ' '.join(e['ip'] for e in result.get('ips', [])),
+        'hostnames': ' '.join(e['hostname'] for e in result.get('ips', []) if e.get('hostname')),
+        'mx': ' '.join(dns.get('MX', [])),
+        'ns': ' '.join(dns.get('NS', [])),
+        'registrar': whois_info.get('registrar') or '',
+        'creation_date': whois_info.get('creation_date') or '',
+        'expiration_date': whois_info.get('expiration_date') or '',
+        'org': whois_info.get('org') or '',
+        'country': whois_info.get('country') or ''
+    }
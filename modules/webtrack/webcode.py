@@ -2,56 +2,82 @@
 # modules/webcode.py
 
 import os
-import requests
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import hashlib
+from collections import deque
+from urllib.parse import urlparse
 from lib.verbose import Verbose
 from lib.multi_target import sanitize_filename, process_placeholder
+from lib.htmlscan import extract_assets, extract_css_urls
+from lib.http import get_client
+from .manifest import DownloadManifest
+
+# Tipe asset yang bisa dipilih lewat -c (selain html)
+ASSET_KINDS = ('css', 'js', 'img', 'font', 'media')
+
+# Batas panjang satu segmen path di disk
+MAX_SEGMENT = 120
 
 def ensure_dir(path):
     if not os.path.exists(path):
         os.makedirs(path)
 
-def download_file(url, dest_dir, verbose=False):
-    """Download file dan simpan ke dest_dir, kembalikan path lengkap"""
+def _short_hash(text, length=10):
+    return hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()[:length]
+
+def _safe_segment(segment):
+    """Sanitasi satu segmen path, potong + hash kalo terlalu panjang"""
+    segment = sanitize_filename(segment)
+    if len(segment) > MAX_SEGMENT:
+        base, ext = os.path.splitext(segment)
+        segment = f"{base[:MAX_SEGMENT - 20]}_{_short_hash(segment)}{ext[:10]}"
+    return segment
+
+def asset_path(url, root):
+    """
+    Path lokal yang mempertahankan struktur URL: root/<host>/<path>.
+    Query string di-hash ke nama file (app.js?v=1 -> app_<hash>.js),
+    jadi a/app.js, b/app.js dan varian query tidak saling menimpa.
+    """
+    parsed = urlparse(url)
+    host = _safe_segment(parsed.netloc) or '_'
+    segments = [_safe_segment(seg) for seg in parsed.path.split('/')
+                if seg not in ('', '.', '..')]
+    if not segments or parsed.path.endswith('/'):
+        segments.append('index.html')
+    name = segments.pop() or 'index.html'
+    if parsed.query:
+        base, ext = os.path.splitext(name)
+        name = f"{base}_{_short_hash(parsed.query)}{ext}"
+    return os.path.join(root, host, *segments, name)
+
+def download_file(url, dest_dir, verbose=False, manifest=None):
+    """Download file ke dest_dir (layout asset_path), kembalikan path lengkap"""
     v = Verbose(verbose)
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        r = requests.get(url, headers=headers, timeout=10)
+        headers = manifest.conditional_headers(url) if manifest else {}
+        r = get_client().get(url, headers=headers, timeout=10)
+        if r.status_code == 304 and manifest and manifest.get(url):
+            return manifest.not_modified(url)
         r.raise_for_status()
         
-        # Tentukan nama file dari URL
-        path = urlparse(url).path
-        filename = os.path.basename(path) if path else 'index.html'
-        if not filename or filename.endswith('/'):
-            filename = 'index.html'
-        # Bersihkan nama
-        filename = sanitize_filename(filename)
-        if not filename:
-            filename = 'index.html'
-        
-        filepath = os.path.join(dest_dir, filename)
-        with open(filepath, 'wb') as f:
-            f.write(r.content)
+        filepath = asset_path(url, dest_dir)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        if manifest:
+            manifest.store(url, r.content, filepath,
+                           etag=r.headers.get('ETag'),
+                           last_modified=r.headers.get('Last-Modified'))
+        else:
+            with open(filepath, 'wb') as f:
+                f.write(r.content)
         v.log(f"Downloaded: {url} -> {filepath}")
         return filepath
     except Exception as e:
         v.error(f"Gagal download {url}: {e}")
         return None
 
-def extract_resources(soup, base_url, resource_type):
-    """Ekstrak URL resource berdasarkan tipe (css/js)"""
-    urls = []
-    if resource_type == 'css':
-        for link in soup.find_all('link', rel='stylesheet'):
-            href = link.get('href')
-            if href:
-                urls.append(urljoin(base_url, href))
-    elif resource_type == 'js':
-        for script in soup.find_all('script', src=True):
-            src = script['src']
-            urls.append(urljoin(base_url, src))
-    return urls
+def extract_resources(html_text, base_url, resource_type):
+    """Ekstrak URL resource berdasarkan tipe (css/js/img/font/media)"""
+    return [url for url, kind in extract_assets(html_text, base_url) if kind == resource_type]
 
 def save_html_content(html_text, dest_dir, verbose=False):
     """Simpan konten HTML ke file"""
@@ -66,15 +92,20 @@ def save_html_content(html_text, dest_dir, verbose=False):
         v.error(f"Gagal menyimpan HTML: {e}")
         return None
 
-def process_single_target(target, code_types, output_dir_placeholder, verbose=False):
+def process_single_target(target, code_types, output_dir_placeholder, verbose=False, use_cache=True,
+                          hardlink=False):
     """
     Proses satu target:
     - target: domain atau URL
-    - code_types: list tipe ['html','css','js']
+    - code_types: list tipe ['html','css','js','img','font','media'] atau ['all']
     - output_dir_placeholder: string dengan placeholder $result$ (misal 'package/$result$')
     - verbose: bool
+    - use_cache: pakai manifest (conditional request ETag/Last-Modified)
+    - hardlink: file identik antar situs di-hardlink dari content store (read-only)
     """
     v = Verbose(verbose)
+    if 'all' in code_types:
+        code_types = ['html'] + list(ASSET_KINDS)
     
     # Normalisasi URL
     if not target.startswith(('http://', 'https://')):
@@ -94,61 +125,82 @@ def process_single_target(target, code_types, output_dir_placeholder, verbose=Fa
         'downloaded': []
     }
     
-    # Download halaman utama
+    manifest = DownloadManifest(output_dir, hardlink=hardlink, verbose=verbose) if use_cache else None
+    html_path = os.path.join(output_dir, 'index.html')
+    
+    # Download halaman utama (conditional kalo index.html dari run sebelumnya masih utuh)
     try:
-        r = requests.get(target, timeout=10)
-        r.raise_for_status()
-        html_content = r.text
+        headers = {}
+        if manifest and 'html' in code_types:
+            headers = manifest.conditional_headers(target)
+        r = get_client().get(target, headers=headers, timeout=10)
+        page_url = r.url or target
+        if r.status_code == 304 and headers:
+            manifest.not_modified(target)
+            with open(html_path, 'r', encoding='utf-8', errors='replace') as f:
+                html_content = f.read()
+            if 'html' in code_types:
+                result['downloaded'].append(html_path)
+        else:
+            r.raise_for_status()
+            html_content = r.text
+            # Simpan HTML jika diminta
+            if 'html' in code_types:
+                if manifest:
+                    manifest.store(target, r.content, html_path,
+                                   etag=r.headers.get('ETag'),
+                                   last_modified=r.headers.get('Last-Modified'))
+                    html_file = html_path
+                else:
+                    html_file = save_html_content(html_content, output_dir, verbose)
+                if html_file:
+                    result['downloaded'].append(html_file)
         v.log("Berhasil mengambil halaman utama")
     except Exception as e:
         v.error(f"Gagal mengakses {target}: {e}")
+        if manifest:
+            manifest.save()
         return None
     
-    # Simpan HTML jika diminta
-    if 'html' in code_types:
-        html_file = save_html_content(html_content, output_dir, verbose)
-        if html_file:
-            result['downloaded'].append(html_file)
-    
-    # Parse HTML untuk CSS/JS
-    if 'css' in code_types or 'js' in code_types:
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-        except Exception as e:
-            v.error(f"Gagal parsing HTML: {e}")
-            return result
-        
-        # Download CSS
-        if 'css' in code_types:
-            css_urls = extract_resources(soup, target, 'css')
-            if css_urls:
-                css_dir = os.path.join(output_dir, 'css')
-                ensure_dir(css_dir)
-                for url in css_urls:
-                    path = download_file(url, css_dir, verbose)
-                    if path:
-                        result['downloaded'].append(path)
+    # Kumpulkan semua asset dalam satu parse, CSS diikuti rekursif (@import/url())
+    wanted = [k for k in code_types if k in ASSET_KINDS]
+    if wanted:
+        queue = deque(a for a in extract_assets(html_content, page_url) if a[1] in wanted)
+        seen = {url for url, _ in queue}
         
-        # Download JS
-        if 'js' in code_types:
-            js_urls = extract_resources(soup, target, 'js')
-            if js_urls:
-                js_dir = os.path.join(output_dir, 'js')
-                ensure_dir(js_dir)
-                for url in js_urls:
-                    path = download_file(url, js_dir, verbose)
-                    if path:
-                        result['downloaded'].append(path)
+        while queue:
+            url, kind = queue.popleft()
+            path = download_file(url, output_dir, verbose, manifest)
+            if not path:
+                continue
+            result['downloaded'].append(path)
+            
+            if kind == 'css':
+                try:
+                    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                        css_text = f.read()
+                except OSError:
+                    continue
+                for ref, ref_kind in extract_css_urls(css_text, url):
+                    if ref_kind in wanted and ref not in seen:
+                        seen.add(ref)
+                        queue.append((ref, ref_kind))
+    
+    if manifest:
+        manifest.save()
+        result['cache'] = dict(manifest.stats)
+        v.log(f"Cache: {manifest.summary()}")
     
     v.success(f"Selesai memproses {target}. File tersimpan di {output_dir}")
     return result
 
-def process_multi_targets(targets, code_types, output_dir_placeholder, verbose=False):
+def process_multi_targets(targets, code_types, output_dir_placeholder, verbose=False, use_cache=True,
+                          hardlink=False):
     """Proses banyak target dari list"""
     results = []
     for target in targets:
         print(f"\n--- Memproses: {target} ---")
-        res = process_single_target(target, code_types, output_dir_placeholder, verbose)
+        res = process_single_target(target, code_types, output_dir_placeholder, verbose, use_cache, hardlink)
         if res:
             results.append(res)
     return results
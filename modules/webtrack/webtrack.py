@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 # OSXNT - Web Tracking Module (IP, DNS, WHOIS)
 
+import time
 import socket
-import dns.resolver
-import whois
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from urllib.parse import urlparse
 from lib.verbose import Verbose
 from lib.json_save import save_to_json, prepare_output
+from lib.lookup_cache import get_lookup_cache, MISS
+from lib.whois_client import get_whois_client, registrable_domain
+from modules.dns import resolve_records
+
+# python-whois hanya dipakai sebagai fallback client WHOIS bawaan
+try:
+    import whois
+    HAS_PYTHON_WHOIS = True
+except ImportError:
+    HAS_PYTHON_WHOIS = False
+
+# Record type yang diambil track_web
+DNS_TYPES = ('A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME', 'SOA', 'CAA')
+
+# Batas waktu total satu track_web (detik)
+DEFAULT_DEADLINE = 15
 
 def extract_domain(url):
     """Extract domain from URL"""
@@ -20,6 +36,10 @@ def get_ip_from_domain(domain, verbose=False):
     """Dapatkan IP address dari domain"""
     v = Verbose(verbose)
     v.log(f"Resolving domain: {domain}")
+    cache = get_lookup_cache()
+    ips = cache.get('addrinfo', domain.lower())
+    if ips is not MISS:
+        return ips or []
     try:
         ips = []
         addrinfo = socket.getaddrinfo(domain, 80)
@@ -27,9 +47,11 @@ def get_ip_from_domain(domain, verbose=False):
             ip = addr[4][0]
             if ip not in ips:
                 ips.append(ip)
+        cache.set('addrinfo', domain.lower(), ips)
         return ips
     except socket.gaierror as e:
         v.error(f"Gagal resolve domain: {e}")
+        cache.set('addrinfo', domain.lower(), None)
         return []
     except Exception as e:
         v.error(f"Error: {e}")
@@ -39,53 +61,163 @@ def get_hostname_from_ip(ip, verbose=False):
     """Reverse DNS lookup"""
     v = Verbose(verbose)
     v.log(f"Reverse DNS untuk IP: {ip}")
+    cache = get_lookup_cache()
+    hostname = cache.get('ptr', ip)
+    if hostname is not MISS:
+        return hostname
     try:
         hostname, _, _ = socket.gethostbyaddr(ip)
+        cache.set('ptr', ip, hostname)
         return hostname
     except socket.herror:
+        cache.set('ptr', ip, None)
         return None
     except Exception as e:
         v.error(f"Error reverse DNS: {e}")
         return None
 
-def get_dns_records(domain, verbose=False):
-    """Dapatkan semua DNS records umum"""
-    v = Verbose(verbose)
+def _remaining(deadline):
+    return max(0.0, deadline - time.monotonic())
+
+def _collect_dns(futures, domain, deadline, v):
+    """
+    Kumpulkan hasil query per record type (urutan DNS_TYPES).
+
+    Returns:
+        tuple: (dict records, list type yang kena timeout)
+    """
     records = {}
-    types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME', 'SOA', 'CAA']
-    for t in types:
+    timed_out = []
+    for t, future in futures.items():
         try:
-            answers = dns.resolver.resolve(domain, t, raise_on_no_answer=False)
-            records[t] = [str(r) for r in answers]
-        except dns.resolver.NoAnswer:
+            answers = future.result(timeout=_remaining(deadline))
+        except FutureTimeout:
+            timed_out.append(t)
             continue
         except Exception as e:
             v.error(f"Error {t}: {e}")
             continue
+        if answers is None:
+            # NXDOMAIN: type lain juga tidak akan ada
+            v.error(f"{domain}: NXDOMAIN")
+            return {}, []
+        records[t] = answers
+    return records, timed_out
+
+def _submit_dns(pool, domain, deadline):
+    lifetime = _remaining(deadline)
+    return {t: pool.submit(resolve_records, domain, t, lifetime) for t in DNS_TYPES}
+
+def _abandon(futures):
+    """Batalkan future yang belum jalan (Python 3.8 belum punya cancel_futures)"""
+    for future in futures:
+        future.cancel()
+
+def get_dns_records(domain, verbose=False, timeout=DEFAULT_DEADLINE):
+    """
+    Dapatkan semua DNS records umum (semua type di-query paralel)
+
+    Args:
+        domain (str): Domain
+        verbose (bool): Mode verbose
+        timeout (float): Batas waktu total (detik)
+
+    Returns:
+        dict: type -> list record
+    """
+    v = Verbose(verbose)
+    deadline = time.monotonic() + timeout
+    pool = ThreadPoolExecutor(max_workers=len(DNS_TYPES))
+    futures = {}
+    try:
+        futures = _submit_dns(pool, domain, deadline)
+        records, timed_out = _collect_dns(futures, domain, deadline, v)
+    finally:
+        _abandon(futures.values())
+        pool.shutdown(wait=False)
+    if timed_out:
+        v.error(f"Timeout: {', '.join(timed_out)}")
     return records
 
-def get_whois_info(domain, verbose=False):
-    """Dapatkan informasi WHOIS domain"""
+def _python_whois(domain):
+    w = whois.whois(domain)
+    return {
+        'registrar': w.registrar,
+        'creation_date': str(w.creation_date) if w.creation_date else None,
+        'expiration_date': str(w.expiration_date) if w.expiration_date else None,
+        'updated_date': str(w.updated_date) if w.updated_date else None,
+        'name_servers': w.name_servers,
+        'emails': w.emails,
+        'org': w.org,
+        'country': w.country
+    }
+
+def fetch_whois(domain, client=None):
+    """
+    Query WHOIS / RDAP tanpa lookup cache.
+
+    Args:
+        domain (str): Domain
+        client (WhoisClient): Client (default: client bersama)
+
+    Returns:
+        dict: Field WHOIS utama, None kalo domain tidak terdaftar (raise kalo gagal)
+    """
+    client = client or get_whois_client()
+    try:
+        info = client.lookup(domain)
+    except Exception:
+        if not HAS_PYTHON_WHOIS:
+            raise
+        return _python_whois(domain)
+    # Batas domain terdaftar cuma tebakan: coba python-whois sebelum menyerah
+    if info is None and HAS_PYTHON_WHOIS and not registrable_domain(domain)[1]:
+        return _python_whois(domain)
+    return info
+
+def get_whois_info(domain, verbose=False, client=None):
+    """
+    Dapatkan informasi WHOIS domain
+
+    Args:
+        domain (str): Domain
+        verbose (bool): Mode verbose
+        client (WhoisClient): Client dengan rate limit sendiri (misal mode bulk)
+    """
     v = Verbose(verbose)
     v.log(f"Mengambil WHOIS untuk {domain}")
+    cache = get_lookup_cache()
+    # Key dari domain terdaftar: www.x.com dan x.com berbagi satu entry
+    key, certain = registrable_domain(domain)
+    info = cache.get('whois', key)
+    if info is not MISS:
+        return info
     try:
-        w = whois.whois(domain)
-        return {
-            'registrar': w.registrar,
-            'creation_date': str(w.creation_date) if w.creation_date else None,
-            'expiration_date': str(w.expiration_date) if w.expiration_date else None,
-            'updated_date': str(w.updated_date) if w.updated_date else None,
-            'name_servers': w.name_servers,
-            'emails': w.emails,
-            'org': w.org,
-            'country': w.country
-        }
+        info = fetch_whois(domain, client)
+        # "Tidak terdaftar" untuk domain tebakan jangan di-cache seharian
+        if info is not None or certain:
+            cache.set('whois', key, info)
+        return info
     except Exception as e:
         v.error(f"Gagal WHOIS: {e}")
         return None
 
-def track_web(target, verbose=False, save=None):
-    """Fungsi utama web tracking"""
+def track_web(target, verbose=False, save=None, deadline=DEFAULT_DEADLINE):
+    """
+    Fungsi utama web tracking.
+
+    Resolve IP, semua DNS record type, PTR per IP dan WHOIS jalan bersamaan
+    dengan satu batas waktu total; bagian yang lewat deadline dikosongkan.
+
+    Args:
+        target (str): Domain atau URL
+        verbose (bool): Mode verbose
+        save (str): File JSON untuk menyimpan hasil
+        deadline (float): Batas waktu total (detik)
+
+    Returns:
+        dict: {domain, ips, dns, whois}
+    """
     v = Verbose(verbose)
     print(f"\n[ Web Tracker ]")
     print(f"Target: {target}")
@@ -101,18 +233,60 @@ def track_web(target, verbose=False, save=None):
         'whois': {}
     }
 
-    # Dapatkan IP
-    ips = get_ip_from_domain(domain, verbose)
-    if ips:
-        result['ips'] = []
-        print(f"\n[ IP Addresses ]")
-        for ip in ips:
-            hostname = get_hostname_from_ip(ip, verbose)
-            print(f"  {ip}  {f'({hostname})' if hostname else ''}")
+    start = time.monotonic()
+    end = start + deadline
+    timed_out = []
+    pool = ThreadPoolExecutor(max_workers=len(DNS_TYPES) + 8)
+    futures = []
+    try:
+        # Semua query dimulai sekaligus; WHOIS biasanya paling lambat
+        ip_future = pool.submit(get_ip_from_domain, domain, verbose)
+        dns_futures = _submit_dns(pool, domain, end)
+        whois_future = pool.submit(get_whois_info, domain, verbose)
+        futures = [ip_future, whois_future] + list(dns_futures.values())
+
+        # PTR dimulai begitu IP didapat, selagi DNS / WHOIS masih jalan
+        try:
+            ips = ip_future.result(timeout=_remaining(end))
+        except FutureTimeout:
+            ips = []
+            timed_out.append('resolve')
+        ptr_futures = [(ip, pool.submit(get_hostname_from_ip, ip, verbose)) for ip in ips]
+        futures.extend(f for _, f in ptr_futures)
+
+        for ip, future in ptr_futures:
+            try:
+                hostname = future.result(timeout=_remaining(end))
+            except FutureTimeout:
+                hostname = None
+                if 'ptr' not in timed_out:
+                    timed_out.append('ptr')
             result['ips'].append({'ip': ip, 'hostname': hostname})
 
-    # Dapatkan DNS records
-    dns_records = get_dns_records(domain, verbose)
+        dns_records, dns_timeouts = _collect_dns(dns_futures, domain, end, v)
+        timed_out.extend(f"dns {t}" for t in dns_timeouts)
+
+        try:
+            whois_info = whois_future.result(timeout=_remaining(end))
+        except FutureTimeout:
+            whois_info = None
+            timed_out.append('whois')
+    finally:
+        _abandon(futures)
+        pool.shutdown(wait=False)
+
+    v.log(f"Lookup selesai dalam {time.monotonic() - start:.2f}s")
+    if timed_out:
+        print(f"[!] Deadline {deadline}s terlewati: {', '.join(timed_out)}")
+
+    # Tampilkan IP
+    if result['ips']:
+        print(f"\n[ IP Addresses ]")
+        for entry in result['ips']:
+            hostname = entry['hostname']
+            print(f"  {entry['ip']}  {f'({hostname})' if hostname else ''}")
+
+    # Tampilkan DNS records
     if dns_records:
         result['dns'] = dns_records
         print(f"\n[ DNS Records ]")
@@ -123,8 +297,7 @@ def track_web(target, verbose=False, save=None):
             if len(records) > 3:
                 print(f"    ... dan {len(records)-3} lainnya")
 
-    # Dapatkan WHOIS
-    whois_info = get_whois_info(domain, verbose)
+    # Tampilkan WHOIS
     if whois_info:
         result['whois'] = whois_info
         print(f"\n[ WHOIS Info ]")
@@ -3,6 +3,7 @@
 # Version: 2.4.0 (with Darkweb Upgraded)
 
 import argparse
+import atexit
 import sys
 import os
 from core.banner import show_banner
@@ -10,8 +11,8 @@ from core.about import about
 from config.config import config
 
 # Import semua lib yang sudah diupgrade
-from lib.multi_target import read_targets_from_file, sanitize_filename
-from lib.json_save import save_to_json, prepare_output
+from lib.multi_target import read_targets_from_file, sanitize_filename, iter_targets, is_multi_target
+from lib.json_save import save_to_json, append_to_jsonl, prepare_output, configure_json
 from lib.verbose import Verbose
 from lib.csv_save import save_to_csv, append_to_csv, dict_to_csv
 from lib.txt_save import save_to_txt, append_to_txt, save_results
@@ -19,10 +20,17 @@ from lib.file_helper import ensure_dir, get_unique_filename, list_files, delete_
 from lib.validator import is_valid_ip, is_valid_domain, is_valid_url, is_valid_email, is_valid_port, validate_input
 from lib.converter import json_to_csv, dict_to_txt, size_to_human, timestamp_to_date
 from lib.timer import Timer, measure_time
+from lib.metrics import configure_metrics
+from lib.progress import configure_progress
+from lib.http import configure as configure_http, get_client
+from lib.lookup_cache import configure_lookup_cache, get_lookup_cache
+from lib.geoip import GeoDB
+from lib.result_export import configure_export, export_result
+from lib.scan_history import configure_history, get_history, record_result, print_diff, flatten_diff
 
 # Import modules (tanpa http/ssl)
 from modules import iptrack, dns, scanport, subdomain
-from modules.webtrack import track_web, process_single_target, process_multi_targets
+from modules.webtrack import track_web, track_webs, flatten_web_result, process_single_target, process_multi_targets
 from modules.spam import NGLSpammer, GmailSpammer
 from modules.email_harvester import EmailHarvester
 from modules.url_extractor import URLExtractor, URLChecker
@@ -40,6 +48,19 @@ VERSION = "2.4.0"
 AUTHOR = "alzzdevmaret"
 GITHUB = "https://github.com/alzzdevmaret/osxnt"
 
+def store_result(module, target, result):
+    """Hasil modul ke --export dan --history (masing-masing no-op kalo tidak aktif)"""
+    export_result(module, target, result)
+    record_result(module, target, result)
+
+def http_report():
+    """Statistik HTTP untuk report --profile"""
+    client = get_client()
+    report = {'totals': client.metrics.totals(), 'hosts': client.metrics.summary()}
+    if client.cache is not None:
+        report['cache'] = dict(client.cache.stats)
+    return report if report['totals']['requests'] or 'cache' in report else None
+
 def show_version():
     """Tampilkan informasi versi dengan lib baru"""
     print(f"""
@@ -75,17 +96,39 @@ USAGE:
     --version, -vr          Tampilkan informasi versi tools
     -v, --verbose           Mode verbose (tampilkan proses detail)
     -vv                     Double verbose (lebih detail)
-    -s file.json            Simpan hasil ke file JSON
+    -s file.json            Simpan hasil ke file JSON (.jsonl = append per record)
+    --compact-json          JSON tanpa indent (lebih kecil + cepat, orjson kalo ada)
     --csv file.csv          Simpan hasil ke file CSV
     --txt file.txt          Simpan hasil ke file TXT
+    --jsonl file.jsonl      Stream hasil bulk ke JSON Lines
+    --export PATH           Export kolom: folder Parquet (pyarrow) atau file .sqlite ber-index
+    --history               Simpan hasil run ke history (lihat -diff)
     --auto-save             Auto save dengan timestamp
     -about                  Tampilkan informasi tentang tools
     --timeout SECONDS       Set timeout (default: 30)
+    --retries N             Retry HTTP untuk error koneksi / 429 / 5xx (default: 3)
+    --http2                 Pakai HTTP/2 kalo httpx[http2] terinstall
+    --http-stats            Tampilkan statistik HTTP per host di akhir
+    --cache-dir DIR         Cache response HTTP di disk (urlextract, urlcheck, webcode, ...)
+    --cache-ttl SECONDS     Umur response di cache (default: 3600)
+    --offline               Replay hanya dari cache, tanpa request ke jaringan
+    --no-cache              Jangan pakai lookup cache (resolve, DNS, PTR, geo, WHOIS)
+    --cache-stats           Tampilkan hit rate lookup cache di akhir
+    --profile FILE.json     Report JSON: waktu per tahap, counter, latency, HTTP, cache
+    --profiler KIND         Tambah capture cprofile / pyinstrument (butuh --profile)
+    --progress MODE         Progress live: auto (status line di TTY), tty, json (JSON Lines ke stderr), off
+    --progress-interval S   Detik antar update progress (default: 0.5)
+    --geo-ttl SECONDS       Umur hasil geolokasi di lookup cache (default: 86400)
+    --whois-ttl SECONDS     Umur hasil WHOIS di lookup cache (default: 86400)
 
 {'='*70}
 📍 IP TRACKING:
 {'='*70}
     -trackip IP             Lacak informasi geolokasi IP
+    -trackip @ips.txt       Bulk (IP / hostname / CIDR per baris), batch 100 IP per request
+    -trackip 1.2.3.0/24     Lacak semua IP dalam CIDR
+    --ipapi-url URL         Base URL ip-api (default: http://ip-api.com, bisa stub lokal)
+    --geo-db PATH[,PATH]    Lookup offline dari database lokal (.mmdb / .csv range)
     ip IP                   Shortcut untuk -trackip
     
     Contoh:
@@ -98,9 +141,22 @@ USAGE:
     -webtrack {{ip,dns}}     Mode web tracking
     web TARGET              Shortcut untuk -webtrack ip
     dns TARGET              Shortcut untuk -webtrack dns
+    -webtrack ip -ip @domains.txt
+                            Bulk: DNS, PTR, WHOIS paralel per domain + progress/ETA
+    -t THREADS              Thread DNS untuk bulk (default: 32)
+    --whois-delay SECONDS   Jeda antar query ke WHOIS server yang sama (default: 2)
+    --jsonl FILE            Stream hasil bulk ke JSON Lines (satu domain per baris)
+    -webtrack dns -dns @queries.txt
+                            Bulk DNS: "name [TYPE]" per baris (-dns - untuk stdin)
+    --ns NS[,NS]            Nameserver bulk DNS (default: resolver sistem), EDNS + fallback TCP
+    --rtype A,MX            Record type untuk baris tanpa TYPE (default: A)
+    -ptrsweep CIDR[,CIDR]   Reverse DNS sweep (maks /16 per CIDR, @file untuk daftar)
+                            Zone /24 yang kosong / lame dilewati
     
     Contoh:
         osxnt.py web google.com
+        osxnt.py -webtrack ip -ip @domains.txt --jsonl assets.jsonl --csv assets.csv
+        osxnt.py -ptrsweep 192.0.2.0/24,198.51.100.0/24 --jsonl ptr.jsonl
         osxnt.py dns facebook.com --csv dns.csv
 
 {'='*70}
@@ -125,6 +181,26 @@ USAGE:
         osxnt.py sub target.com -t 50
         osxnt.py -sbdomain google.com -w wordlist.txt --csv subs.csv
 
+{'='*70}
+📥 WEB SOURCE DOWNLOADER:
+{'='*70}
+    -trackweb TARGET         Download kode sumber website
+    -c TYPES                 Tipe kode (html,css,js,img,font,media,all)
+    -o DIR                   Direktori output ($result$ = domain)
+    --hardlink               Hardlink file identik dari .osxnt_store (hemat disk)
+    
+    Asset disimpan dengan layout <dir>/<host>/<path asli>, query string
+    di-hash ke nama file sehingga file senama tidak saling menimpa.
+    
+    Download ulang hanya mengambil file yang berubah (ETag/Last-Modified).
+    File output berupa salinan biasa yang bebas diedit. Dengan --hardlink,
+    file identik antar situs disimpan sekali di .osxnt_store lalu di-hardlink
+    dan dibuat read-only (edit file hasil = edit semua salinan).
+    Untuk mengedit, salin dulu filenya (cp) lalu edit salinannya.
+    
+    Contoh:
+        osxnt.py -trackweb target.com -c html,css,js -o output/$result$
+
 {'='*70}
 📧 EMAIL HARVESTER:
 {'='*70}
@@ -139,7 +215,16 @@ USAGE:
 🔗 URL EXTRACTOR:
 {'='*70}
     -urlextract TARGET       Extract semua URL
+    -depth LEVEL             Budget kedalaman crawling
+    --max-pages N            Budget jumlah halaman (default: 100)
+    -t THREADS               Fetch paralel (default: 8)
+    --per-host N             Koneksi paralel per host (default: 4)
+    --crawl-delay SECONDS    Jeda antar request ke host yang sama
+    --ignore-robots          Abaikan robots.txt
     -urlcheck -resource TARGET Check resources
+    --check-limit N          Maksimum link yang dicek (extract default: 50, 0 = semua)
+    --parser BACKEND         auto, lxml, html.parser (auto = lxml kalo ada)
+    --url-jsonl FILE         Simpan semua URL unik + counter ke JSON Lines
     
     Contoh:
         osxnt.py -urlextract target.com
@@ -231,7 +316,12 @@ USAGE:
 {'='*70}
 📌 MULTI-TARGET & OUTPUT:
 {'='*70}
-    Gunakan @file.txt untuk multi-target
+    Gunakan @file.txt untuk multi-target (juga @folder/*.txt, - untuk stdin)
+    Target bisa diekspansi langsung (duplikat dibuang):
+        192.0.2.0/24            CIDR
+        10.0.0.1-50             Range oktet terakhir (atau 10.0.0.1-10.0.3.20)
+        {{www,mail}}.example.com  Glob hostname (juga srv[01-20].corp.local)
+        a.com,b.com             Daftar dipisah koma
     --csv file.csv           Export ke CSV
     --txt file.txt           Export ke TXT
     --auto-save              Auto save dengan timestamp
@@ -239,6 +329,21 @@ USAGE:
     Contoh:
         osxnt.py ip @list.txt --csv results.csv
         osxnt.py sub @domains.txt --txt subs.txt --auto-save
+        osxnt.py -scan -p 22,80,443 10.0.0.1-20 --csv ports.csv
+
+{'='*70}
+🕘 SCAN HISTORY:
+{'='*70}
+    --history                Simpan hasil setiap run ke history SQLite
+    --history-db FILE        File history (default: .osxnt_cache/history.sqlite3)
+    -diff                    Daftar run terakhir
+    -diff RUN                Bandingkan RUN dengan run sebelumnya (modul + target sama)
+    -diff RUN_A RUN_B        Bandingkan dua run (RUN = id atau 'last')
+    
+    Contoh:
+        osxnt.py -scan -p 1-1024 example.com --history
+        osxnt.py -diff last
+        osxnt.py -diff 12 15 --csv changes.csv
 
 {'='*70}
 🎯 Shortcuts:
@@ -265,11 +370,34 @@ def create_parser():
     parser.add_argument('-v', '--verbose', action='store_true', help='Mode verbose')
     parser.add_argument('-vv', action='store_true', help='Double verbose mode')
     parser.add_argument('-s', metavar='file.json', help='Simpan hasil ke file JSON')
+    parser.add_argument('--compact-json', action='store_true', help='Simpan JSON tanpa indent')
     parser.add_argument('--csv', metavar='file.csv', help='Simpan hasil ke file CSV')
     parser.add_argument('--txt', metavar='file.txt', help='Simpan hasil ke file TXT')
+    parser.add_argument('--jsonl', metavar='file.jsonl', help='Stream hasil bulk ke file JSON Lines')
+    parser.add_argument('--export', metavar='PATH', help='Export hasil ke Parquet / SQLite ber-index')
+    parser.add_argument('--history', action='store_true', help='Simpan hasil run ke history')
+    parser.add_argument('--history-db', metavar='FILE', help='File SQLite history')
+    parser.add_argument('-diff', nargs='*', metavar='RUN', help='Bandingkan dua run di history')
     parser.add_argument('--auto-save', action='store_true', help='Auto save dengan timestamp')
     parser.add_argument('-about', action='store_true', help='Tampilkan informasi tools')
     parser.add_argument('--timeout', type=int, default=30, help='Timeout dalam detik')
+    parser.add_argument('--retries', type=int, default=3, help='Jumlah retry HTTP')
+    parser.add_argument('--http2', action='store_true', help='Pakai HTTP/2 (httpx)')
+    parser.add_argument('--http-stats', action='store_true', help='Tampilkan statistik HTTP per host')
+    parser.add_argument('--cache-dir', metavar='DIR', help='Folder cache response HTTP')
+    parser.add_argument('--cache-ttl', type=int, default=3600, help='Umur response di cache (detik)')
+    parser.add_argument('--offline', action='store_true', help='Hanya pakai response dari cache')
+    parser.add_argument('--no-cache', action='store_true', help='Nonaktifkan lookup cache')
+    parser.add_argument('--cache-stats', action='store_true', help='Tampilkan statistik lookup cache')
+    parser.add_argument('--geo-ttl', type=int, default=86400, help='Umur hasil geolokasi di cache (detik)')
+    parser.add_argument('--whois-ttl', type=int, default=86400, help='Umur hasil WHOIS di cache (detik)')
+    parser.add_argument('--profile', metavar='FILE', help='Tulis report profiling JSON')
+    parser.add_argument('--profiler', choices=['cprofile', 'pyinstrument'],
+                       help='Capture profiler untuk --profile')
+    parser.add_argument('--progress', choices=['auto', 'tty', 'json', 'off'], default='auto',
+                       help='Tampilan progress modul yang lama jalan')
+    parser.add_argument('--progress-interval', type=float, default=0.5, metavar='SECONDS',
+                       help='Detik antar update progress')
     
     # ===== SHORTCUTS =====
     parser.add_argument('ip', nargs='?', help='Shortcut untuk -trackip')
@@ -279,10 +407,16 @@ def create_parser():
     parser.add_argument('sub', nargs='?', help='Shortcut untuk -sbdomain')
     
     # ===== IP TRACKING =====
-    parser.add_argument('-trackip', metavar='IP', help='Lacak informasi IP')
+    parser.add_argument('-trackip', metavar='IP', help='Lacak informasi IP (@file / CIDR untuk bulk)')
+    parser.add_argument('--ipapi-url', default=iptrack.IP_API_URL, help='Base URL ip-api')
+    parser.add_argument('--geo-db', metavar='PATH', help='Database GeoIP lokal (.mmdb / .csv), pisah koma')
     
     # ===== WEB TRACKING =====
     parser.add_argument('-webtrack', choices=['ip', 'dns'], help='Web tracking mode')
+    parser.add_argument('--whois-delay', type=float, default=2.0, help='Jeda antar query per WHOIS server (bulk)')
+    parser.add_argument('--ns', metavar='NS[,NS]', help='Nameserver untuk bulk DNS (IP atau host:port)')
+    parser.add_argument('-ptrsweep', metavar='CIDR', help='Reverse DNS sweep (CIDR[,CIDR] atau @file)')
+    parser.add_argument('--rtype', default='A', help='Record type default bulk DNS (misal A,AAAA,MX)')
     parser.add_argument('-ip', metavar='TARGET', help='Target untuk -webtrack ip')
     parser.add_argument('-dns', metavar='TARGET', help='Target untuk -webtrack dns')
     
@@ -297,8 +431,10 @@ def create_parser():
     
     # ===== TRACKWEB =====
     parser.add_argument('-trackweb', action='store_true', help='Download kode sumber website')
-    parser.add_argument('-c', metavar='CODE', help='Tipe kode (html,css,js)')
+    parser.add_argument('-c', metavar='CODE', help='Tipe kode (html,css,js,img,font,media,all)')
     parser.add_argument('-o', metavar='OUTPUT_DIR', default='package/$result$', help='Direktori output')
+    parser.add_argument('--hardlink', action='store_true',
+                        help='Hardlink file identik dari .osxnt_store (read-only, hemat disk)')
     
     # ===== EMAIL HARVESTER =====
     parser.add_argument('-email', action='store_true', help='Email Harvester')
@@ -307,6 +443,14 @@ def create_parser():
     
     # ===== URL EXTRACTOR =====
     parser.add_argument('-urlextract', metavar='TARGET', help='URL Extractor')
+    parser.add_argument('--max-pages', type=int, default=100, help='Budget halaman untuk crawler')
+    parser.add_argument('--per-host', type=int, default=4, help='Koneksi paralel maksimum per host')
+    parser.add_argument('--crawl-delay', type=float, default=0.0, help='Jeda antar request ke host yang sama')
+    parser.add_argument('--ignore-robots', action='store_true', help='Abaikan robots.txt')
+    parser.add_argument('--check-limit', type=int, help='Maksimum link yang dicek (0 = semua)')
+    parser.add_argument('--parser', choices=['auto', 'lxml', 'html.parser'], default='auto',
+                       help='Backend parser HTML untuk URL extractor')
+    parser.add_argument('--url-jsonl', metavar='FILE', help='Export URL unik URL extractor ke JSON Lines')
     parser.add_argument('-urlcheck', action='store_true', help='URL Checker')
     parser.add_argument('-resource', metavar='TARGET', help='Target untuk URL checker')
     parser.add_argument('-type', choices=['all', 'images', 'scripts', 'styles', 'links'], 
@@ -394,10 +538,45 @@ def main():
         parser = create_parser()
         args = parser.parse_args()
         
+        # Metrics + profiler (--profile); sedini mungkin supaya semua tahap tercatat
+        if args.profile:
+            metrics = configure_metrics(report_path=args.profile, profiler=args.profiler)
+            metrics.add_collector('http', http_report)
+            metrics.add_collector('lookup_cache', lambda: get_lookup_cache().summary())
+        elif args.profiler:
+            print("[!] --profiler butuh --profile FILE.json, diabaikan")
+        
+        # Progress live (scanport, subdomain, crack wordlist, download wordlist)
+        configure_progress(mode=args.progress, interval=args.progress_interval)
+        
         # Setup verbose
         verbose = args.verbose or args.vv
         double_verbose = args.vv
         
+        # Client HTTP bersama untuk semua modul
+        configure_http(timeout=(5, args.timeout), retries=max(0, args.retries),
+                       http2=args.http2, cache_dir=args.cache_dir, cache_ttl=args.cache_ttl,
+                       offline=args.offline, verbose=verbose)
+        if args.http_stats:
+            atexit.register(lambda: get_client().display_stats())
+        
+        # Lookup cache bersama (resolve, DNS, PTR, geo, WHOIS); DNS pakai TTL record
+        configure_lookup_cache(cache_dir=args.cache_dir, enabled=not args.no_cache,
+                               ttls={'geo': args.geo_ttl, 'whois': args.whois_ttl})
+        if args.cache_stats:
+            atexit.register(lambda: get_lookup_cache().display())
+        
+        # Format JSON untuk -s
+        configure_json(compact=args.compact_json)
+        
+        # Export kolom (Parquet / SQLite) untuk semua modul
+        if args.export:
+            configure_export(args.export, verbose=verbose)
+        
+        # History run (--history) dan -diff
+        configure_history(args.history_db, enabled=args.history, command=' '.join(sys.argv[1:]),
+                          verbose=verbose)
+        
         # Setup output files
         save_file = args.s
         csv_file = args.csv
@@ -430,7 +609,7 @@ def main():
             sys.exit(0)
         
         # ===== SHORTCUT HANDLERS =====
-        if args.ip and not any([args.trackip, args.webtrack, args.scan, args.sbdomain]):
+        if args.ip and not any([args.trackip, args.webtrack, args.scan, args.sbdomain, args.trackweb]):
             args.trackip = args.ip
         
         if args.web and not args.webtrack:
@@ -450,6 +629,43 @@ def main():
             args.sbdomain = True
             args.target = args.sub
         
+        # ===== SCAN HISTORY DIFF =====
+        if args.diff is not None:
+            history = get_history()
+            if not args.diff:
+                runs = history.runs(limit=20)
+                if not runs:
+                    print("[!] History kosong, jalankan modul dengan --history dulu")
+                    return
+                print(f"[*] {len(runs)} run terakhir:")
+                for run in runs:
+                    print(f"  #{run['id']:<5} {run['ts']}  {run['module']:<10} {run['target'] or '':<30} "
+                          f"{run['records']} record")
+                return
+            
+            new_id = history.resolve(args.diff[-1])
+            if new_id is None:
+                print(f"[!] Run tidak ditemukan: {args.diff[-1]}")
+                return
+            if len(args.diff) > 1:
+                old_id = history.resolve(args.diff[0])
+            else:
+                old_id = history.previous_run(new_id)
+            if old_id is None:
+                print("[!] Tidak ada run pembanding (modul + target sama)")
+                return
+            
+            diff = history.diff(old_id, new_id)
+            print_diff(diff, limit=0 if verbose else 50)
+            if save_file:
+                save_to_json(prepare_output(diff, f"{old_id}..{new_id}", "diff"), save_file)
+            if csv_file:
+                save_to_csv(flatten_diff(diff), csv_file)
+            if txt_file:
+                save_to_txt('\n'.join(f"{r['change']}\t{r['kind']}\t{r['key']}\t{r['detail']}"
+                                      for r in flatten_diff(diff)), txt_file)
+            return
+        
         # ===== WORDLIST MANAGER =====
         if args.wordlist:
             wm = WordlistManager(verbose=verbose)
@@ -484,6 +700,8 @@ def main():
                 else:
                     result = generator.hash_string(args.text, args.algorithm)
                     if result:
+                        store_result('hash', args.text, {'input': args.text, 'algorithm': args.algorithm,
+                                                         'hash': result})
                         print(f"\n[{args.algorithm.upper()} Hash]")
                         print(result)
                         if txt_file:
@@ -492,6 +710,8 @@ def main():
             elif args.file:
                 result = generator.hash_file(args.file, args.algorithm)
                 if result:
+                    store_result('hash', args.file, {'input': args.file, 'algorithm': args.algorithm,
+                                                     'hash': result})
                     print(f"\n[{args.algorithm.upper()} Hash of {args.file}]")
                     print(result)
                     if txt_file:
@@ -592,6 +812,8 @@ def main():
                 
                 if result:
                     print(f"\n[✓] {algo} Password found: {result}")
+                    store_result('hash', args.hash, {'input': result, 'algorithm': algo.lower(),
+                                                     'hash': args.hash})
                     if txt_file:
                         save_to_txt(f"Hash: {args.hash}\nPassword: {result}", txt_file)
                 else:
@@ -655,13 +877,46 @@ def main():
         
         # ===== IP TRACKING =====
         if args.trackip:
+            geo_db = None
+            if args.geo_db:
+                try:
+                    geo_db = GeoDB(args.geo_db, verbose=verbose)
+                except (OSError, ValueError, ImportError) as e:
+                    print(f"[!] Gagal membuka geo-db: {e}")
+                    return
+            
             with Timer("IP Tracking"):
+                # Bulk: @file, stdin, CIDR, range, glob -> POST /batch ip-api
+                if is_multi_target(args.trackip):
+                    targets = [args.trackip]
+                    
+                    # Output di-stream per batch
+                    streamed = {'csv': False}
+                    def sink(records):
+                        store_result('iptrack', args.trackip, records)
+                        if csv_file:
+                            rows = [iptrack.flatten_record(r) for r in records]
+                            if streamed['csv']:
+                                append_to_csv(rows, csv_file)
+                            else:
+                                save_to_csv(rows, csv_file)
+                                streamed['csv'] = True
+                        if txt_file:
+                            append_to_txt([f"{r.get('query')}\t{r.get('countryCode')}\t{r.get('city')}\t{r.get('isp')}"
+                                           for r in records], txt_file)
+                    
+                    result = iptrack.track_ips(targets, verbose, sink=sink, api_url=args.ipapi_url,
+                                               geo_db=geo_db)
+                    if result and save_file:
+                        save_to_json(prepare_output(result, args.trackip, "iptrack"), save_file)
+                    return
+                
                 if args.trackip.lower() == 'myip':
                     print("[*] Mendapatkan IP publik...")
                     myip = iptrack.get_public_ip()
                     if myip:
                         print(f"[+] IP Anda: {myip}")
-                        result = iptrack.track_ip(myip, verbose)
+                        result = iptrack.track_ip(myip, verbose, api_url=args.ipapi_url, geo_db=geo_db)
                     else:
                         print("[!] Gagal mendapatkan IP publik")
                         return
@@ -671,10 +926,11 @@ def main():
                         print("[!] Invalid IP or domain format")
                         return
                     
-                    result = iptrack.track_ip(args.trackip, verbose)
+                    result = iptrack.track_ip(args.trackip, verbose, api_url=args.ipapi_url, geo_db=geo_db)
                 
                 # Save results
                 if result:
+                    store_result('iptrack', args.trackip, result)
                     if save_file:
                         save_to_json(prepare_output(result, args.trackip, "iptrack"), save_file)
                     if csv_file:
@@ -692,15 +948,73 @@ def main():
                     if not args.ip:
                         print("[!] Gunakan -ip untuk menentukan target")
                         return
-                    result = track_web(args.ip, verbose)
+                    if is_multi_target(args.ip):
+                        # Bulk: hasil di-stream per batch
+                        targets = iter_targets(args.ip)
+                        streamed = {'csv': False}
+                        def sink(records):
+                            store_result('webtrack', args.ip, records)
+                            if args.jsonl:
+                                append_to_jsonl(records, args.jsonl)
+                            if csv_file:
+                                rows = [flatten_web_result(r) for r in records]
+                                if streamed['csv']:
+                                    append_to_csv(rows, csv_file)
+                                else:
+                                    save_to_csv(rows, csv_file)
+                                    streamed['csv'] = True
+                            if txt_file:
+                                append_to_txt([f"{r['domain']}\t{' '.join(e['ip'] for e in r['ips'])}\t"
+                                               f"{r['whois'].get('registrar') or ''}" for r in records], txt_file)
+                        
+                        result = track_webs(targets, verbose, sink=sink, dns_workers=args.threads or 32,
+                                            whois_delay=args.whois_delay, dns_timeout=args.timeout)
+                        if result and save_file:
+                            save_to_json(prepare_output(result, args.ip, "webtrack"), save_file)
+                        return
+                    result = track_web(args.ip, verbose, deadline=args.timeout)
                 elif args.webtrack == 'dns':
                     if not args.dns:
                         print("[!] Gunakan -dns untuk menentukan target")
                         return
+                    if args.dns.startswith('@') or args.dns == '-':
+                        # Bulk: "name [TYPE]" per baris dari file / stdin
+                        if args.dns == '-':
+                            lines = sys.stdin
+                        else:
+                            lines = read_targets_from_file(args.dns[1:])
+                            if not lines:
+                                return
+                        streamed = {'csv': False}
+                        def sink(records):
+                            store_result('dns', args.dns, records)
+                            if args.jsonl:
+                                append_to_jsonl(records, args.jsonl)
+                            if csv_file:
+                                rows = [dns.flatten_result(r) for r in records]
+                                if streamed['csv']:
+                                    append_to_csv(rows, csv_file)
+                                else:
+                                    save_to_csv(rows, csv_file)
+                                    streamed['csv'] = True
+                            if txt_file:
+                                append_to_txt([f"{r['name']}\t{r['type']}\t{r['status']}\t{r['ttl']}\t"
+                                               f"{' '.join(x['value'] for x in r['records'])}" for r in records],
+                                              txt_file)
+                        
+                        types = [t.strip().upper() for t in args.rtype.split(',') if t.strip()]
+                        nameservers = [n for n in args.ns.split(',') if n.strip()] if args.ns else None
+                        result = dns.dns_bulk(lines, types=types, nameservers=nameservers,
+                                              workers=args.threads or 64, timeout=min(args.timeout, 5),
+                                              verbose=verbose, sink=sink)
+                        if result and save_file:
+                            save_to_json(prepare_output(result, args.dns, "dns"), save_file)
+                        return
                     result = dns.dns_lookup(args.dns, verbose=verbose)
                 
                 # Save results
                 if result:
+                    store_result('webtrack' if args.webtrack == 'ip' else 'dns', args.ip or args.dns, result)
                     if save_file:
                         save_to_json(prepare_output(result, args.ip or args.dns, "webtrack"), save_file)
                     if csv_file and isinstance(result, dict):
@@ -710,14 +1024,60 @@ def main():
             
             return
         
+        # ===== PTR SWEEP =====
+        if args.ptrsweep:
+            with Timer("PTR Sweep"):
+                if args.ptrsweep.startswith('@'):
+                    cidrs = read_targets_from_file(args.ptrsweep[1:])
+                    if not cidrs:
+                        return
+                else:
+                    cidrs = args.ptrsweep.split(',')
+                
+                streamed = {'csv': False}
+                def sink(records):
+                    store_result('ptrsweep', args.ptrsweep, records)
+                    if args.jsonl:
+                        append_to_jsonl(records, args.jsonl)
+                    if csv_file:
+                        rows = [{'ip': r['ip'], 'ptr': ' '.join(r['ptr']), 'ttl': r['ttl']} for r in records]
+                        if streamed['csv']:
+                            append_to_csv(rows, csv_file)
+                        else:
+                            save_to_csv(rows, csv_file)
+                            streamed['csv'] = True
+                    if txt_file:
+                        append_to_txt([f"{r['ip']}\t{' '.join(r['ptr'])}" for r in records], txt_file)
+                
+                nameservers = [n for n in args.ns.split(',') if n.strip()] if args.ns else None
+                result = dns.ptr_sweep(cidrs, nameservers=nameservers, workers=args.threads or 64,
+                                       timeout=min(args.timeout, 5), verbose=verbose, sink=sink)
+                if result and save_file:
+                    save_to_json(prepare_output(result, args.ptrsweep, "ptrsweep"), save_file)
+            return
+        
         # ===== PORT SCANNER =====
         if args.scan:
+            # Positional pertama ditangkap argparse sebagai 'ip'
+            args.target = args.target or args.ip
             if not args.p or not args.target:
                 print("[!] Gunakan: osxnt.py -scan -p <ports> <target>")
                 return
             
             with Timer("Port Scan"):
-                result = scanport.port_scan(args.target, args.p, verbose=verbose)
+                if is_multi_target(args.target):
+                    # Banyak host: CIDR, range, glob, @file; hasil digabung dengan kolom host
+                    result = []
+                    for host in iter_targets(args.target):
+                        ports = scanport.port_scan(host, args.p, verbose=verbose)
+                        if ports is None:
+                            continue
+                        # Tanpa port terbuka tetap dicatat: port yang tertutup muncul di -diff
+                        store_result('scanport', host, ports)
+                        result.extend({'host': host, **r} for r in ports)
+                else:
+                    result = scanport.port_scan(args.target, args.p, verbose=verbose)
+                    store_result('scanport', args.target, result)
                 
                 if result and csv_file:
                     save_to_csv(result, csv_file)
@@ -728,6 +1088,7 @@ def main():
         
         # ===== SUBDOMAIN SCANNER =====
         if args.sbdomain:
+            args.target = args.target or args.ip
             if not args.target:
                 print("[!] Masukkan domain target")
                 return
@@ -735,13 +1096,24 @@ def main():
             wordlist = args.w if args.w else "requiments/subdomain.txt"
             threads = args.threads if args.threads else 20
             
-            # Validasi domain
-            if not is_valid_domain(args.target):
+            # Banyak domain (@file, daftar, glob) atau satu domain
+            if is_multi_target(args.target):
+                domains = iter_targets(args.target)
+            elif is_valid_domain(args.target):
+                domains = [args.target]
+            else:
                 print("[!] Invalid domain format")
                 return
             
             with Timer("Subdomain Scan"):
-                result = subdomain.subdomain_scan(args.target, wordlist, threads, verbose=verbose)
+                result = []
+                for domain in domains:
+                    if not is_valid_domain(domain):
+                        print(f"[!] Invalid domain format: {domain}")
+                        continue
+                    found = subdomain.subdomain_scan(domain, wordlist, threads, verbose=verbose)
+                    store_result('subdomain', domain, found)
+                    result.extend(found or [])
                 
                 if result and csv_file:
                     save_to_csv(result, csv_file)
@@ -750,14 +1122,40 @@ def main():
             
             return
         
+        # ===== WEB SOURCE DOWNLOADER =====
+        if args.trackweb:
+            # Positional pertama ditangkap argparse sebagai 'ip'
+            args.target = args.target or args.ip
+            if not args.target:
+                print("[!] Gunakan: osxnt.py -trackweb <target> -c html,css,js -o <dir>")
+                return
+            
+            code_types = [c.strip() for c in (args.c or 'html').split(',') if c.strip()]
+            
+            with Timer("Web Source Download"):
+                if is_multi_target(args.target):
+                    targets = list(iter_targets(args.target))
+                    if not targets:
+                        return
+                    result = process_multi_targets(targets, code_types, args.o, verbose,
+                                                   hardlink=args.hardlink)
+                else:
+                    result = process_single_target(args.target, code_types, args.o, verbose,
+                                                   hardlink=args.hardlink)
+                
+                store_result('webcode', args.target, result)
+                if result and save_file:
+                    save_to_json(prepare_output(result, args.target, "webcode"), save_file)
+            
+            return
+        
         # ===== EMAIL HARVESTER =====
         if args.email and args.scrap:
             harvester = EmailHarvester(verbose=verbose)
             
             # Multi-target dari file
-            if args.scrap.startswith('@'):
-                filename = args.scrap[1:]
-                targets = read_targets_from_file(filename)
+            if is_multi_target(args.scrap):
+                targets = list(iter_targets(args.scrap))
                 if not targets:
                     return
                 
@@ -769,6 +1167,7 @@ def main():
                         result = harvester.harvest(target, depth=args.depth)
                         if result:
                             all_results.append(result)
+                            store_result('email', target, result)
                 
                 if all_results and csv_file:
                     # Flatten untuk CSV
@@ -780,6 +1179,7 @@ def main():
                 
             else:
                 result = harvester.harvest(args.scrap, depth=args.depth)
+                store_result('email', args.scrap, result)
                 
                 if result and csv_file:
                     save_to_csv(result.get('emails', []), csv_file)
@@ -790,30 +1190,46 @@ def main():
         
         # ===== URL EXTRACTOR =====
         if args.urlextract:
-            extractor = URLExtractor(verbose=verbose)
-            result = extractor.extract(args.urlextract, depth=args.depth)
+            extractor = URLExtractor(
+                verbose=verbose,
+                max_pages=args.max_pages,
+                workers=args.threads or 8,
+                per_host=args.per_host,
+                delay=args.crawl_delay,
+                respect_robots=not args.ignore_robots,
+                check_limit=50 if args.check_limit is None else args.check_limit,
+                parser=args.parser
+            )
+            result = extractor.extract(args.urlextract, depth=args.depth, jsonl=args.url_jsonl)
+            store_result('urlextract', args.urlextract, result)
             
             if result and csv_file:
                 # Flatten URLs
                 all_urls = []
                 for cat, urls in result.get('categories', {}).items():
                     for url in urls:
-                        all_urls.append({'category': cat, 'url': url if isinstance(url, str) else url.get('url', '')})
+                        all_urls.append({'category': cat, 'url': url})
                 save_to_csv(all_urls, csv_file)
             
             return
         
         # ===== URL CHECKER =====
         if args.urlcheck and args.resource:
-            checker = URLChecker(verbose=verbose)
+            checker = URLChecker(
+                verbose=verbose,
+                workers=args.threads or 16,
+                per_host=args.per_host,
+                check_limit=args.check_limit
+            )
             result = checker.check(args.resource, resource_type=args.type)
+            store_result('urlcheck', args.resource, result)
             
             if result and csv_file:
                 # Flatten broken links
                 broken = []
                 for res_type, resources in result.get('resources', {}).items():
                     for res in resources:
-                        if res.get('status') != 'OK':
+                        if res.get('status') not in ('OK', 'SKIPPED'):
                             broken.append({
                                 'type': res_type,
                                 'url': res.get('url', ''),